@@ -4,8 +4,6 @@ import cairo
 from gi.repository import GLib
 from gi.repository import Clutter
 
-resize_id = 0
-
 def draw_clock(canvas, cr, width, height):
     # Clear the canvas
     cr.save()
@@ -59,23 +57,15 @@ def invalidate_clock(canvas):
     canvas.invalidate()
     return True
 
-def idle_resize(actor):
-    global resize_id
-
+def resize_canvas(actor):
     # Match the size of the canvas with the size of the actor
     width, height = actor.get_size()
     actor.get_content().set_size(math.ceil(width), math.ceil(height))
 
-    resize_id = 0
-
-    return False
-
 def on_actor_resize(actor, allocation, flags):
-    global resize_id
-
-    # Throttle multiple allocations to a single canvas resize
-    if resize_id == 0:
-        resize_id = GLib.timeout_add(500, idle_resize, actor)
+    # Throttle multiple allocations to a single canvas resize, right
+    # before the next frame is painted
+    Clutter.FrameScheduler.get_default().schedule(resize_canvas, actor, key=actor)
 
 if __name__ == '__main__':
     Clutter.init(None)
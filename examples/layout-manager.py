@@ -3,12 +3,12 @@ import math
 from gi.repository import GObject
 from gi.repository import Clutter
 
-class MultiLayout(Clutter.LayoutManager):
+class MultiLayout(Clutter.CachedLayoutManager):
     GRID = 0
     CIRCLE = 1
 
     def __init__(self):
-        Clutter.LayoutManager.__init__(self)
+        Clutter.CachedLayoutManager.__init__(self)
         self._state = MultiLayout.GRID
         self._spacing = 0
         self._cell_width = -1
@@ -34,7 +34,7 @@ class MultiLayout(Clutter.LayoutManager):
             self._spacing = value
             self.layout_changed()
 
-    def do_get_preferred_width(self, actor, for_height):
+    def compute_preferred_width(self, actor, for_height):
         minimum = 0
         natural = 0
         max_natural = 0
@@ -63,7 +63,7 @@ class MultiLayout(Clutter.LayoutManager):
 
         return (minimum, natural)
 
-    def do_get_preferred_height(self, actor, for_width):
+    def compute_preferred_height(self, actor, for_width):
         minimum = 0
         natural = 0
         max_natural = 0
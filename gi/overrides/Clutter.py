@@ -25,13 +25,38 @@ from ..overrides import override, deprecated_init
 from ..importer import modules
 
 from gi import PyGIDeprecationWarning
+from gi.repository import GLib
 from gi.repository import GObject
 
 from contextlib import contextmanager
 
+import array
+import bisect
+import collections
+import ctypes
+import heapq
+import math
+import struct
 import sys
 import warnings
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import asyncio
+    import selectors
+    from collections.abc import Mapping as _Mapping
+except ImportError:
+    asyncio = None
+
+try:
+    from concurrent import futures as _futures
+except ImportError:
+    _futures = None
+
 if sys.version_info >= (3, 0):
     _basestring = str
     _callable = lambda c: hasattr(c, '__call__')
@@ -89,6 +114,132 @@ def _builder_connect_callback(builder, gobj, signal_name, handler_name, connect_
         else:
             gobj.connect(signal_name, handler, *args)
 
+# Maps fundamental types to the GValue setter that handles them, so that
+# converters can skip the type dispatch done by GObject.Value.set_value()
+_GVALUE_SETTERS = {
+    GObject.TYPE_BOOLEAN: GObject.Value.set_boolean,
+    GObject.TYPE_CHAR: GObject.Value.set_schar,
+    GObject.TYPE_UCHAR: GObject.Value.set_uchar,
+    GObject.TYPE_INT: GObject.Value.set_int,
+    GObject.TYPE_UINT: GObject.Value.set_uint,
+    GObject.TYPE_LONG: GObject.Value.set_long,
+    GObject.TYPE_ULONG: GObject.Value.set_ulong,
+    GObject.TYPE_INT64: GObject.Value.set_int64,
+    GObject.TYPE_UINT64: GObject.Value.set_uint64,
+    GObject.TYPE_FLOAT: GObject.Value.set_float,
+    GObject.TYPE_DOUBLE: GObject.Value.set_double,
+    GObject.TYPE_STRING: GObject.Value.set_string,
+    GObject.TYPE_ENUM: GObject.Value.set_enum,
+    GObject.TYPE_FLAGS: GObject.Value.set_flags,
+    GObject.TYPE_BOXED: GObject.Value.set_boxed,
+    GObject.TYPE_OBJECT: GObject.Value.set_object,
+}
+
+_gvalue_converters = {}
+
+def _gvalue_converter(value_type):
+    try:
+        return _gvalue_converters[value_type]
+    except KeyError:
+        pass
+
+    setter = _GVALUE_SETTERS.get(GObject.type_fundamental(value_type),
+                                 GObject.Value.set_value)
+
+    def convert(value):
+        if isinstance(value, GObject.Value):
+            return value
+        gvalue = GObject.Value()
+        gvalue.init(value_type)
+        setter(gvalue, value)
+        return gvalue
+
+    _gvalue_converters[value_type] = convert
+    return convert
+
+def _gvalue_from_python(value_type, value):
+    return _gvalue_converter(value_type)(value)
+
+# Process-wide cache of (pspec, converter) pairs keyed by (GType, property
+# name), used by the overrides that set properties from Python values
+_property_cache = {}
+_property_cache_stats = {'hits': 0, 'misses': 0}
+
+def _lookup_property(obj, property_name):
+    key = (obj.__gtype__, property_name)
+    try:
+        entry = _property_cache[key]
+    except KeyError:
+        _property_cache_stats['misses'] += 1
+    else:
+        _property_cache_stats['hits'] += 1
+        return entry
+
+    try:
+        pspec = getattr(obj.__class__.props, property_name.replace('-', '_'))
+    except AttributeError:
+        raise AttributeError(("Objects of type '%s' don't have a " +
+            "property '%s'") % (type(obj), property_name))
+    entry = (pspec, _gvalue_converter(pspec.value_type))
+    _property_cache[key] = entry
+    return entry
+
+def get_property_cache_stats():
+    """
+    Returns a dictionary with the number of 'hits' and 'misses' of the
+    property lookup cache used by Actor.animate(), Animator.set_key(),
+    State.set_key() and the child_set_properties() methods, and its current
+    'size'.
+    """
+    stats = dict(_property_cache_stats)
+    stats['size'] = len(_property_cache)
+    return stats
+
+__all__.append('get_property_cache_stats')
+
+def clear_property_cache():
+    _property_cache.clear()
+    _property_cache_stats['hits'] = 0
+    _property_cache_stats['misses'] = 0
+
+__all__.append('clear_property_cache')
+
+def _struct_fields(boxed, struct_type, fields_type):
+    # The hash of a boxed wrapper is the address of the C structure it
+    # wraps, so we can map the fields directly without going through the
+    # introspected field accessors. The ctypes array holds a reference on
+    # the wrapper to keep the memory alive.
+    fields = fields_type.from_address(struct_type.__hash__(boxed))
+    fields._boxed = boxed
+    return fields
+
+def _struct_memoryview(fields, fmt):
+    view = memoryview(fields)
+    # ctypes exports an explicit byte order ('<f'), which memoryview cannot
+    # index; recast to the native single-character format
+    if hasattr(view, 'cast'):
+        view = view.cast('B').cast(fmt)
+    return view
+
+def _require_numpy(name):
+    if numpy is None:
+        raise ImportError('Clutter.%s requires NumPy' % name)
+
+def _require_asyncio(name):
+    if asyncio is None:
+        raise ImportError('Clutter.%s requires asyncio' % name)
+
+def _require_futures(name):
+    if _futures is None:
+        raise ImportError('Clutter.%s requires concurrent.futures' % name)
+
+def _report_exception():
+    # prints the exception being handled like PyGObject does for the ones
+    # escaping callbacks, for callbacks run from our own dispatch loops
+    sys.excepthook(*sys.exc_info())
+
+_NAN = float('nan')
+
 class PyClutterDeprecationWarning(PyGIDeprecationWarning):
     pass
 
@@ -110,27 +261,32 @@ class Color(Clutter.Color):
         return '<Clutter.Color(red=%d, green=%d, blue=%d, alpha=%s)>' % (
             self.red, self.green, self.blue, self.alpha)
 
+    _fields_type = ctypes.c_uint8 * 4
+
+    def as_memoryview(self):
+        """
+        Returns a writable memoryview of format 'B' over the red, green,
+        blue and alpha components of the underlying ClutterColor.
+
+        >>> color.as_memoryview()[:] = b'\\xff\\x00\\x00\\xff'
+        """
+        return _struct_memoryview(
+            _struct_fields(self, Clutter.Color, self._fields_type), 'B')
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
     def __iter__(self):
-        yield self.red
-        yield self.green
-        yield self.blue
-        yield self.alpha
+        return iter(_struct_fields(self, Clutter.Color, self._fields_type)[:])
 
     def __len__(self):
         return 4
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            if key == 0:
-                return self.red
-            elif key == 1:
-                return self.green
-            elif key == 2:
-                return self.blue
-            elif key == 3:
-                return self.alpha
-            else:
+            if key < 0 or key >= 4:
                 raise IndexError("index out of range")
+            return _struct_fields(self, Clutter.Color, self._fields_type)[key]
         else:
             raise TypeError("sequence index must be integer")
 
@@ -161,6 +317,292 @@ class Color(Clutter.Color):
                self.blue != other.blue or \
                self.alpha != other.alpha
 
+class _ColorArrayElement(object):
+    # A light view on one row of a ColorArray; it only turns into a real
+    # Clutter.Color when to_color() is called
+    __slots__ = ('_data', '_index')
+
+    def __init__(self, data, index):
+        self._data = data
+        self._index = index
+
+    def __repr__(self):
+        return '<Clutter.ColorArray element(red=%d, green=%d, blue=%d, alpha=%d)>' % (
+            tuple(self))
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        return iter(self._data[self._index].tolist())
+
+    def __getitem__(self, key):
+        return int(self._data[self._index, key])
+
+    def __setitem__(self, key, value):
+        self._data[self._index, key] = value
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    red = property(lambda self: int(self._data[self._index, 0]),
+                   lambda self, value: self.__setitem__(0, value))
+    green = property(lambda self: int(self._data[self._index, 1]),
+                     lambda self, value: self.__setitem__(1, value))
+    blue = property(lambda self: int(self._data[self._index, 2]),
+                    lambda self, value: self.__setitem__(2, value))
+    alpha = property(lambda self: int(self._data[self._index, 3]),
+                     lambda self, value: self.__setitem__(3, value))
+
+    def to_color(self):
+        color = Color()
+        color.as_memoryview()[:] = self._data[self._index].tobytes()
+        return color
+
+class ColorArray(object):
+    """
+    A contiguous array of RGBA colors, stored as an N×4 NumPy array of
+    unsigned bytes using the same layout as ClutterColor.
+
+    Indexing returns an element view that can be converted to a
+    Clutter.Color with to_color() when it needs to be passed to Clutter;
+    slicing returns a ColorArray sharing the same storage.
+
+    >>> palette = Clutter.ColorArray.from_hls(hues, 0.5, 0.8)
+    >>> actor.props.background_color = palette.lighten()[3].to_color()
+    """
+    def __init__(self, colors=None):
+        _require_numpy('ColorArray')
+        if colors is None:
+            self._data = numpy.zeros((0, 4), dtype=numpy.uint8)
+        elif isinstance(colors, int):
+            self._data = numpy.zeros((colors, 4), dtype=numpy.uint8)
+        else:
+            self._data = numpy.array([tuple(c) for c in colors],
+                                     dtype=numpy.uint8).reshape(-1, 4)
+
+    @classmethod
+    def _wrap(cls, data):
+        ret = cls.__new__(cls)
+        ret._data = data
+        return ret
+
+    @classmethod
+    def from_numpy(cls, array):
+        """
+        Creates a ColorArray from an N×4 array of RGBA bytes. A C-contiguous
+        uint8 array is used without copying.
+        """
+        _require_numpy('ColorArray')
+        data = numpy.ascontiguousarray(array, dtype=numpy.uint8)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError('expected an array of shape (N, 4), got %s' %
+                             (data.shape,))
+        return cls._wrap(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a ColorArray from packed RGBA bytes.
+        """
+        _require_numpy('ColorArray')
+        if len(data) % 4:
+            raise ValueError('the length of the data must be a multiple of 4')
+        return cls._wrap(numpy.frombuffer(bytearray(data), dtype=numpy.uint8).reshape(-1, 4))
+
+    @classmethod
+    def from_hls(cls, hue, luminance, saturation, alpha=255):
+        """
+        Creates a ColorArray from hue (0 to 360), luminance and saturation
+        (0 to 1) arrays, following clutter_color_from_hls().
+        """
+        _require_numpy('ColorArray')
+        hue, luminance, saturation, alpha = numpy.broadcast_arrays(
+            numpy.asarray(hue, dtype=numpy.float64) / 360.0,
+            numpy.asarray(luminance, dtype=numpy.float64),
+            numpy.asarray(saturation, dtype=numpy.float64),
+            numpy.asarray(alpha))
+
+        tmp2 = numpy.where(luminance <= 0.5,
+                           luminance * (1.0 + saturation),
+                           luminance + saturation - luminance * saturation)
+        tmp1 = 2.0 * luminance - tmp2
+
+        data = numpy.empty(hue.shape + (4,), dtype=numpy.uint8)
+        for i, offset in enumerate((1.0 / 3.0, 0.0, -1.0 / 3.0)):
+            tmp3 = hue + offset
+            tmp3 = numpy.where(tmp3 < 0.0, tmp3 + 1.0, tmp3)
+            tmp3 = numpy.where(tmp3 > 1.0, tmp3 - 1.0, tmp3)
+            channel = numpy.select(
+                [6.0 * tmp3 < 1.0, 2.0 * tmp3 < 1.0, 3.0 * tmp3 < 2.0],
+                [tmp1 + (tmp2 - tmp1) * tmp3 * 6.0,
+                 tmp2,
+                 tmp1 + (tmp2 - tmp1) * ((2.0 / 3.0) - tmp3) * 6.0],
+                tmp1)
+            data[..., i] = numpy.floor(channel * 255.0 + 0.5)
+        data[..., 3] = alpha
+        return cls._wrap(data.reshape(-1, 4))
+
+    @classmethod
+    def from_colors(cls, colors):
+        """
+        Creates a ColorArray from a sequence of Clutter.Color.
+        """
+        _require_numpy('ColorArray')
+        data = bytearray()
+        for color in colors:
+            data.extend(color.as_memoryview())
+        return cls.from_bytes(data)
+
+    def to_numpy(self):
+        """
+        Returns the N×4 uint8 array backing this ColorArray, without copying.
+        """
+        return self._data
+
+    def to_bytes(self):
+        return self._data.tobytes()
+
+    def to_colors(self):
+        """
+        Returns a list of newly allocated Clutter.Color.
+        """
+        return [_ColorArrayElement(self._data, i).to_color()
+                for i in range(len(self._data))]
+
+    def as_memoryview(self):
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def __repr__(self):
+        return '<Clutter.ColorArray of %d colors>' % len(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self._data)):
+            yield _ColorArrayElement(self._data, i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ColorArray._wrap(self._data[key])
+        elif isinstance(key, int):
+            if key < 0:
+                key += len(self._data)
+            if key < 0 or key >= len(self._data):
+                raise IndexError("index out of range: %d" % key)
+            return _ColorArrayElement(self._data, key)
+        else:
+            raise TypeError("indices must be integer or slice")
+
+    def __setitem__(self, key, value):
+        if isinstance(value, ColorArray):
+            value = value._data
+        elif isinstance(value, (Clutter.Color, _ColorArrayElement)):
+            value = tuple(value)
+        self._data[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, ColorArray):
+            return numpy.array_equal(self._data, other._data)
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def interpolate(self, final, progress):
+        """
+        Interpolates between this array and @final, which can be another
+        ColorArray or a single color. @progress is either a scalar or an
+        array with one value per color.
+        """
+        if isinstance(final, ColorArray):
+            final = final._data
+        else:
+            final = numpy.asarray(tuple(final), dtype=numpy.uint8)
+        progress = numpy.asarray(progress, dtype=numpy.float64)
+        if progress.ndim == 1:
+            progress = progress[:, numpy.newaxis]
+        initial = self._data.astype(numpy.float64)
+        result = initial + (final.astype(numpy.float64) - initial) * progress
+        return ColorArray._wrap(numpy.clip(result, 0, 255).astype(numpy.uint8))
+
+    def to_hls(self):
+        """
+        Returns an N×3 float array of hue (0 to 360), luminance and
+        saturation (0 to 1), following clutter_color_to_hls().
+        """
+        rgb = self._data[:, :3].astype(numpy.float64) / 255.0
+        red, green, blue = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+        cmax = rgb.max(axis=1)
+        cmin = rgb.min(axis=1)
+        delta = cmax - cmin
+        chromatic = delta != 0.0
+        # avoid dividing by zero on greys; those rows are masked out below
+        safe_delta = numpy.where(chromatic, delta, 1.0)
+
+        luminance = (cmax + cmin) / 2.0
+        saturation = numpy.where(luminance <= 0.5,
+                                 delta / numpy.where(chromatic, cmax + cmin, 1.0),
+                                 delta / numpy.where(chromatic, 2.0 - cmax - cmin, 1.0))
+        hue = numpy.select(
+            [red == cmax, green == cmax],
+            [(green - blue) / safe_delta,
+             2.0 + (blue - red) / safe_delta],
+            4.0 + (red - green) / safe_delta) * 60.0
+        hue = numpy.where(hue < 0.0, hue + 360.0, hue)
+
+        hls = numpy.empty((len(self._data), 3), dtype=numpy.float64)
+        hls[:, 0] = numpy.where(chromatic, hue, 0.0)
+        hls[:, 1] = luminance
+        hls[:, 2] = numpy.where(chromatic, saturation, 0.0)
+        return hls
+
+    def shade(self, factor):
+        """
+        Shades every color by @factor, which is either a scalar or an array
+        with one value per color, following clutter_color_shade().
+        """
+        factor = numpy.asarray(factor, dtype=numpy.float64)
+        hls = self.to_hls()
+        ret = ColorArray.from_hls(hls[:, 0],
+                                  numpy.clip(hls[:, 1] * factor, 0.0, 1.0),
+                                  numpy.clip(hls[:, 2] * factor, 0.0, 1.0),
+                                  self._data[:, 3])
+        return ret
+
+    def lighten(self):
+        return self.shade(1.3)
+
+    def darken(self):
+        return self.shade(0.7)
+
+    def premultiply(self):
+        """
+        Returns a copy with the color components multiplied by the alpha.
+        """
+        data = self._data.astype(numpy.uint16)
+        data[:, :3] = (data[:, :3] * data[:, 3:] + 127) // 255
+        return ColorArray._wrap(data.astype(numpy.uint8))
+
+    def unpremultiply(self):
+        """
+        Returns a copy with the color components divided by the alpha.
+        """
+        data = self._data.astype(numpy.uint32)
+        alpha = data[:, 3:]
+        rgb = (data[:, :3] * 255 + alpha // 2) // numpy.where(alpha == 0, 1, alpha)
+        data[:, :3] = numpy.where(alpha == 0, 0, numpy.minimum(rgb, 255))
+        return ColorArray._wrap(data.astype(numpy.uint8))
+
+__all__.append('ColorArray')
+
 @giclassoverride
 class ActorBox(Clutter.ActorBox):
     def __new__(cls, *args, **kwargs):
@@ -177,21 +619,30 @@ class ActorBox(Clutter.ActorBox):
         return '<Clutter.ActorBox(x1=%f, y1=%f, x2=%f y2=%f)>' % (
             self.x1, self.y1, self.x2, self.y2)
 
+    _fields_type = ctypes.c_float * 4
+
+    def as_memoryview(self):
+        """
+        Returns a writable memoryview of format 'f' over the x1, y1, x2
+        and y2 coordinates of the underlying ClutterActorBox.
+        """
+        return _struct_memoryview(
+            _struct_fields(self, Clutter.ActorBox, self._fields_type), 'f')
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def __iter__(self):
+        return iter(_struct_fields(self, Clutter.ActorBox, self._fields_type)[:])
+
     def __len__(self):
         return 4
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            if key == 0:
-                return self.x1
-            elif key == 1:
-                return self.y1
-            elif key == 2:
-                return self.x2
-            elif key == 3:
-                return self.y2
-            else:
+            if key < 0 or key >= 4:
                 raise IndexError("index out of range")
+            return _struct_fields(self, Clutter.ActorBox, self._fields_type)[key]
         else:
             raise TypeError("sequence index must be integer")
 
@@ -244,6 +695,229 @@ class ActorBox(Clutter.ActorBox):
     def height(self):
         return self.y2 - self.y1
 
+class ActorBoxArray(object):
+    """
+    A contiguous array of actor boxes, stored as an N×4 NumPy array of
+    floats laid out like ClutterActorBox: [x1, y1, x2, y2].
+
+    Indexing returns a new Clutter.ActorBox; slicing returns an
+    ActorBoxArray sharing the same storage.
+
+    >>> boxes = Clutter.ActorBoxArray.from_boxes(child.get_allocation_box()
+    ...                                          for child in container)
+    >>> hits = boxes.contains_points([(x, y)])[:, 0]
+    """
+    def __init__(self, boxes=None):
+        _require_numpy('ActorBoxArray')
+        if boxes is None:
+            self._data = numpy.zeros((0, 4), dtype=numpy.float32)
+        elif isinstance(boxes, int):
+            self._data = numpy.zeros((boxes, 4), dtype=numpy.float32)
+        else:
+            self._data = numpy.array([tuple(b) for b in boxes],
+                                     dtype=numpy.float32).reshape(-1, 4)
+
+    @classmethod
+    def _wrap(cls, data):
+        ret = cls.__new__(cls)
+        ret._data = data
+        return ret
+
+    @classmethod
+    def from_numpy(cls, array):
+        """
+        Creates an ActorBoxArray from an N×4 array of [x1, y1, x2, y2]. A
+        C-contiguous float32 array is used without copying.
+        """
+        _require_numpy('ActorBoxArray')
+        data = numpy.ascontiguousarray(array, dtype=numpy.float32)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError('expected an array of shape (N, 4), got %s' %
+                             (data.shape,))
+        return cls._wrap(data)
+
+    @classmethod
+    def from_boxes(cls, boxes):
+        """
+        Creates an ActorBoxArray from a sequence of Clutter.ActorBox.
+        """
+        _require_numpy('ActorBoxArray')
+        data = bytearray()
+        for box in boxes:
+            data.extend(box.as_memoryview().tobytes())
+        return cls._wrap(numpy.frombuffer(data, dtype=numpy.float32).reshape(-1, 4))
+
+    def to_numpy(self):
+        """
+        Returns the N×4 float32 array backing this ActorBoxArray, without
+        copying.
+        """
+        return self._data
+
+    def to_boxes(self):
+        """
+        Returns a list of newly allocated Clutter.ActorBox.
+        """
+        return [self[i] for i in range(len(self._data))]
+
+    def as_memoryview(self):
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def __repr__(self):
+        return '<Clutter.ActorBoxArray of %d boxes>' % len(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self._data)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ActorBoxArray._wrap(self._data[key])
+        elif isinstance(key, int):
+            if key < 0:
+                key += len(self._data)
+            if key < 0 or key >= len(self._data):
+                raise IndexError("index out of range: %d" % key)
+            box = ActorBox()
+            # memoryviews cannot be recast on Python 2, so copy through the
+            # ctypes fields of the box instead
+            data = self._data[key].tobytes()
+            ctypes.memmove(_struct_fields(box, Clutter.ActorBox,
+                                          ActorBox._fields_type),
+                           data, len(data))
+            return box
+        else:
+            raise TypeError("indices must be integer or slice")
+
+    def __setitem__(self, key, value):
+        if isinstance(value, ActorBoxArray):
+            value = value._data
+        elif isinstance(value, Clutter.ActorBox):
+            value = tuple(value)
+        self._data[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, ActorBoxArray):
+            return numpy.array_equal(self._data, other._data)
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    x1 = property(lambda self: self._data[:, 0])
+    y1 = property(lambda self: self._data[:, 1])
+    x2 = property(lambda self: self._data[:, 2])
+    y2 = property(lambda self: self._data[:, 3])
+
+    @property
+    def width(self):
+        return self._data[:, 2] - self._data[:, 0]
+
+    @property
+    def height(self):
+        return self._data[:, 3] - self._data[:, 1]
+
+    @property
+    def size(self):
+        return self._data[:, 2:] - self._data[:, :2]
+
+    def _other_data(self, other):
+        if isinstance(other, ActorBoxArray):
+            return other._data
+        return numpy.asarray(tuple(other), dtype=numpy.float32)
+
+    def union(self, other):
+        """
+        Returns the union of each box with the matching box of @other, which
+        is either an ActorBoxArray of the same length or a single box.
+        """
+        other = self._other_data(other)
+        data = numpy.empty_like(self._data)
+        numpy.minimum(self._data[:, :2], other[..., :2], out=data[:, :2])
+        numpy.maximum(self._data[:, 2:], other[..., 2:], out=data[:, 2:])
+        return ActorBoxArray._wrap(data)
+
+    def bounds(self):
+        """
+        Returns a Clutter.ActorBox enclosing every box in the array.
+        """
+        if len(self._data) == 0:
+            return ActorBox()
+        mins = self._data[:, :2].min(axis=0)
+        maxs = self._data[:, 2:].max(axis=0)
+        return ActorBox(float(mins[0]), float(mins[1]),
+                        float(maxs[0]), float(maxs[1]))
+
+    def intersect(self, other):
+        """
+        Returns the intersection of each box with the matching box of
+        @other, which is either an ActorBoxArray of the same length or a
+        single box. Boxes that do not overlap collapse to an empty box.
+        """
+        other = self._other_data(other)
+        data = numpy.empty_like(self._data)
+        numpy.maximum(self._data[:, :2], other[..., :2], out=data[:, :2])
+        numpy.minimum(self._data[:, 2:], other[..., 2:], out=data[:, 2:])
+        numpy.maximum(data[:, 2:], data[:, :2], out=data[:, 2:])
+        return ActorBoxArray._wrap(data)
+
+    def intersects(self, other):
+        """
+        Returns a boolean array telling which boxes overlap the matching box
+        of @other.
+        """
+        other = self._other_data(other)
+        return ((self._data[:, 0] < other[..., 2]) &
+                (self._data[:, 2] > other[..., 0]) &
+                (self._data[:, 1] < other[..., 3]) &
+                (self._data[:, 3] > other[..., 1]))
+
+    def contains_points(self, points):
+        """
+        Tests points against every box, with the semantics of
+        clutter_actor_box_contains(). @points is either a single (x, y)
+        pair, giving an N boolean array, or an M×2 array of points, giving
+        an N×M boolean array.
+        """
+        points = numpy.asarray(points, dtype=numpy.float32)
+        if points.ndim == 1:
+            x, y = points[0], points[1]
+            data = self._data
+        else:
+            x, y = points[numpy.newaxis, :, 0], points[numpy.newaxis, :, 1]
+            data = self._data[:, :, numpy.newaxis]
+        return ((x > data[:, 0]) & (x < data[:, 2]) &
+                (y > data[:, 1]) & (y < data[:, 3]))
+
+    def clamp_to_pixel(self):
+        """
+        Clamps every box to integer pixel coordinates in place, like
+        clutter_actor_box_clamp_to_pixel().
+        """
+        numpy.floor(self._data[:, :2], out=self._data[:, :2])
+        numpy.ceil(self._data[:, 2:], out=self._data[:, 2:])
+
+    def interpolate(self, final, progress):
+        """
+        Interpolates between this array and @final, which is either an
+        ActorBoxArray of the same length or a single box. @progress is
+        either a scalar or an array with one value per box.
+        """
+        final = self._other_data(final)
+        progress = numpy.asarray(progress, dtype=numpy.float32)
+        if progress.ndim == 1:
+            progress = progress[:, numpy.newaxis]
+        data = self._data + (final - self._data) * progress
+        return ActorBoxArray._wrap(data.astype(numpy.float32))
+
+__all__.append('ActorBoxArray')
+
 @giclassoverride
 class Vertex(Clutter.Vertex):
     def __new__(cls, *args, **kwargs):
@@ -258,19 +932,30 @@ class Vertex(Clutter.Vertex):
     def __repr__(self):
         return '<Clutter.Vertex(x=%f, y=%f, z=%f)>' % (self.x, self.y, self.z)
 
+    _fields_type = ctypes.c_float * 3
+
+    def as_memoryview(self):
+        """
+        Returns a writable memoryview of format 'f' over the x, y and z
+        coordinates of the underlying ClutterVertex.
+        """
+        return _struct_memoryview(
+            _struct_fields(self, Clutter.Vertex, self._fields_type), 'f')
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def __iter__(self):
+        return iter(_struct_fields(self, Clutter.Vertex, self._fields_type)[:])
+
     def __len__(self):
         return 3
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            if key == 0:
-                return self.x
-            elif key == 1:
-                return self.y
-            elif key == 2:
-                return self.z
-            else:
+            if key < 0 or key >= 3:
                 raise IndexError("index out of range")
+            return _struct_fields(self, Clutter.Vertex, self._fields_type)[key]
         else:
             raise TypeError("sequence index must be integer")
 
@@ -321,21 +1006,32 @@ class Geometry(Clutter.Geometry):
         return '<Clutter.Geometry(x=%d, y=%d, width=%d, height=%d)>' % (
             self.x, self.y, self.width, self.height)
 
+    # width and height are unsigned in C, but share the 'i' format with the
+    # origin so that the whole structure can be exported as one buffer
+    _fields_type = ctypes.c_int32 * 4
+
+    def as_memoryview(self):
+        """
+        Returns a writable memoryview of format 'i' over the x, y, width
+        and height of the underlying ClutterGeometry.
+        """
+        return _struct_memoryview(
+            _struct_fields(self, Clutter.Geometry, self._fields_type), 'i')
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def __iter__(self):
+        return iter(_struct_fields(self, Clutter.Geometry, self._fields_type)[:])
+
     def __len__(self):
         return 4
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            if key == 0:
-                return self.x
-            elif key == 1:
-                return self.y
-            elif key == 2:
-                return self.width
-            elif key == 3:
-                return self.height
-            else:
+            if key < 0 or key >= 4:
                 raise IndexError("index out of range")
+            return _struct_fields(self, Clutter.Geometry, self._fields_type)[key]
         else:
             raise TypeError("sequence index must be integer")
 
@@ -478,11 +1174,98 @@ class Rect(Clutter.Rect):
     def __ne__(self, other):
         return self.origin != other.origin or self.size != other.size
 
+    _fields_type = ctypes.c_float * 4
+
+    def as_memoryview(self):
+        """
+        Returns a writable memoryview of format 'f' over the origin and
+        size of the underlying ClutterRect, as [x, y, width, height].
+        """
+        return _struct_memoryview(
+            _struct_fields(self, Clutter.Rect, self._fields_type), 'f')
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
     def __iter__(self):
-        yield self.origin.x
-        yield self.origin.y
-        yield self.size.width
-        yield self.size.height
+        return iter(_struct_fields(self, Clutter.Rect, self._fields_type)[:])
+
+_keyval_names = None
+_keyval_values = None
+
+def _build_keyval_index():
+    global _keyval_names, _keyval_values
+
+    names = {}
+    values = {}
+    for symbol in sorted(dir(Clutter)):
+        if not symbol.startswith('KEY_'):
+            continue
+        keyval = getattr(Clutter, symbol)
+        name = symbol[4:]
+        names.setdefault(keyval, name)
+        values[name] = keyval
+    _keyval_names = names
+    _keyval_values = values
+
+def keyval_name(keyval):
+    """
+    Returns the name of @keyval, like 'Return' for Clutter.KEY_Return, or
+    None if it has no name. When several names share a key value, the
+    first in alphabetical order is returned.
+
+    The index is built from the Clutter.KEY_* constants on first use.
+    """
+    if _keyval_names is None:
+        _build_keyval_index()
+    return _keyval_names.get(keyval)
+
+__all__.append('keyval_name')
+
+def keyval_from_name(name):
+    """
+    Returns the key value named @name, like Clutter.KEY_Return for
+    'Return', or None if there is no such key.
+    """
+    if _keyval_values is None:
+        _build_keyval_index()
+    return _keyval_values.get(name)
+
+__all__.append('keyval_from_name')
+
+class EventSnapshot(collections.namedtuple('EventSnapshot',
+        'type x y time modifier_state keyval button sequence source_id')):
+    """
+    An immutable copy of the fields of a Clutter.Event, created by
+    Event.snapshot(). The type and modifier state are stored as plain
+    integers; the touch sequence and source actor are identified by the
+    address of their C structure, and are 0 when not set.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def to_numpy(cls, snapshots):
+        """
+        Packs a sequence of snapshots into a NumPy structured array of
+        EventSnapshot.DTYPE.
+        """
+        _require_numpy('EventSnapshot')
+        return numpy.array(list(snapshots), dtype=cls.DTYPE)
+
+if numpy is not None:
+    EventSnapshot.DTYPE = numpy.dtype([
+        ('type', numpy.uint16),
+        ('x', numpy.float32),
+        ('y', numpy.float32),
+        ('time', numpy.uint32),
+        ('modifier_state', numpy.uint32),
+        ('keyval', numpy.uint32),
+        ('button', numpy.uint32),
+        ('sequence', numpy.int64),
+        ('source_id', numpy.int64),
+    ])
+
+__all__.append('EventSnapshot')
 
 @giclassoverride
 class Event(Clutter.Event):
@@ -505,23 +1288,137 @@ class Event(Clutter.Event):
             Clutter.EventType.TOUCH_CANCEL: 'touch'
         })
 
+    # Fields of the union members that can be read with a single call to
+    # the C accessors, instead of copying the member structure first
+    _MEMBER_ACCESSORS = {
+        'key': {
+            'keyval': Clutter.Event.get_key_symbol,
+            'hardware_keycode': Clutter.Event.get_key_code,
+            'modifier_state': Clutter.Event.get_state,
+            'key_name': lambda event: keyval_name(
+                Clutter.Event.get_key_symbol(event)),
+        },
+        'button': {
+            'x': lambda event: Clutter.Event.get_coords(event)[0],
+            'y': lambda event: Clutter.Event.get_coords(event)[1],
+            'click_count': Clutter.Event.get_click_count,
+            'modifier_state': Clutter.Event.get_state,
+        },
+        'motion': {
+            'x': lambda event: Clutter.Event.get_coords(event)[0],
+            'y': lambda event: Clutter.Event.get_coords(event)[1],
+            'modifier_state': Clutter.Event.get_state,
+        },
+        'scroll': {
+            'x': lambda event: Clutter.Event.get_coords(event)[0],
+            'y': lambda event: Clutter.Event.get_coords(event)[1],
+            'direction': Clutter.Event.get_scroll_direction,
+            'modifier_state': Clutter.Event.get_state,
+        },
+        'crossing': {
+            'x': lambda event: Clutter.Event.get_coords(event)[0],
+            'y': lambda event: Clutter.Event.get_coords(event)[1],
+            'related': Clutter.Event.get_related,
+        },
+        'stage_state': {},
+    }
+    if clutter_version >= (1, 10, 0):
+        _MEMBER_ACCESSORS['touch'] = {
+            'x': lambda event: Clutter.Event.get_coords(event)[0],
+            'y': lambda event: Clutter.Event.get_coords(event)[1],
+            'sequence': Clutter.Event.get_event_sequence,
+            'modifier_state': Clutter.Event.get_state,
+        }
+    for _accessors in _MEMBER_ACCESSORS.values():
+        _accessors.update({
+            'time': Clutter.Event.get_time,
+            'source': Clutter.Event.get_source,
+            'stage': Clutter.Event.get_stage,
+            'flags': Clutter.Event.get_flags,
+        })
+    del _accessors
+
+    # Per event type accessor tables, built once
+    _ACCESSORS = {}
+    for _event_type, _member in _UNION_MEMBERS.items():
+        _ACCESSORS[_event_type] = _MEMBER_ACCESSORS[_member]
+    del _event_type, _member
+    _COORDS_TYPES = frozenset(event_type
+                              for event_type, accessors in _ACCESSORS.items()
+                              if 'x' in accessors)
+
     def __new__(cls, *args, **kwargs):
         return Clutter.Event.__new__(cls)
 
     def __getattr__(self, name):
-        real_event = getattr(self, '_UNION_MEMBERS').get(self.type())
-        if real_event:
-            return getattr(getattr(self, real_event), name)
+        event_type = self.type()
+        accessors = Event._ACCESSORS.get(event_type)
+        if accessors is not None:
+            accessor = accessors.get(name)
+            if accessor is not None:
+                return accessor(self)
+            return getattr(getattr(self, Event._UNION_MEMBERS[event_type]), name)
         else:
             raise AttributeError("'%s' object has no attribute '%s'" %
                                  (self.__class__.__name__, name))
 
+    def _typed_accessor(name):
+        def get(self):
+            accessor = Event._ACCESSORS.get(self.type(), {}).get(name)
+            if accessor is None:
+                raise AttributeError("'%s' object has no attribute '%s'" %
+                                     (self.__class__.__name__, name))
+            return accessor(self)
+        return property(get)
+
+    # Typed accessors that skip __getattr__; the button number is
+    # available through get_button(), as 'button' is a union member
+    x = _typed_accessor('x')
+    y = _typed_accessor('y')
+    keyval = _typed_accessor('keyval')
+    modifier_state = _typed_accessor('modifier_state')
+
+    del _typed_accessor
+
+    @property
+    def coords(self):
+        if self.type() not in Event._COORDS_TYPES:
+            raise AttributeError("'%s' object has no attribute 'coords'" %
+                                 self.__class__.__name__)
+        return Clutter.Event.get_coords(self)
+
+    def snapshot(self):
+        """
+        Returns an immutable Clutter.EventSnapshot of this event, holding
+        only plain numbers, that stays valid after the dispatch and can be
+        handed to other threads.
+        """
+        event_type = self.type()
+        member = Event._UNION_MEMBERS.get(event_type)
+        x = y = 0.0
+        keyval = button = sequence_id = 0
+        if event_type in Event._COORDS_TYPES:
+            x, y = Clutter.Event.get_coords(self)
+        if member == 'key':
+            keyval = Clutter.Event.get_key_symbol(self)
+        elif member == 'button':
+            button = Clutter.Event.get_button(self)
+        elif member == 'touch':
+            sequence = Clutter.Event.get_event_sequence(self)
+            if sequence is not None:
+                sequence_id = hash(sequence)
+        source = Clutter.Event.get_source(self)
+        return EventSnapshot(int(event_type), x, y,
+                             Clutter.Event.get_time(self),
+                             int(Clutter.Event.get_state(self)),
+                             keyval, button, sequence_id,
+                             hash(source) if source is not None else 0)
+
     def __str__(self):
         def get_key():
-            from gi.overrides import keysyms
-            for name in dir(keysyms):
-                if self.keyval == getattr(keysyms, name):
-                    return name
+            name = keyval_name(self.keyval)
+            if name is not None:
+                return name
             if sys.version_info < (3, 0):
                 return unichr(self.get_key_unicode()).encode('UTF-8')
             else:
@@ -608,50 +1505,739 @@ class Event(Clutter.Event):
         else:
             return '<Unkown event>'
 
-@giclassoverride
-class Actor(Clutter.Actor):
-    def _update_animation(self, *args, **kwargs):
-        def _detach_animation(animation):
-            delattr(self, '_animation')
-            del animation
+class MotionBatch(object):
+    """
+    The motion or touch update points received by an actor during one
+    frame, for one pointer or touch sequence.
 
-        # check if we already have a running animation
-        if hasattr(self, '_animation'):
-            animation = getattr(self, '_animation')
-        else:
-            animation = Clutter.Animation()
-            animation.set_object(self)
-            animation.connect('completed', _detach_animation)
-            setattr(self, '_animation', animation)
+    The points are stored as a flat array of doubles holding x, y, time
+    (in ms) and pressure for each point; the pressure is NaN for devices
+    without a pressure axis.
+    """
+    __slots__ = ('actor', 'sequence', 'points')
 
-        # check arguments
-        if len(args) == 1 and isinstance(args[0], dict):
-            properties = args[0].items()
-        elif len(args) == 2 and isinstance(args[0], (tuple, list)) and \
-                isinstance(args[1], (tuple, list)):
-            properties = zip(args[0], args[1])
-        elif len(args) >= 2 and not 2 % 2:
-            properties = zip(args[::2], args[1::2])
-        elif kwargs:
-            properties = kwargs.items()
-        else:
-            raise TypeError('The arguments must be: ' +
-                    '"property", value, "property", value, ... or ' +
-                    '("property", "property", ...), (value, value, ...) ' +
-                    'or {"property": value, "property", value}')
+    def __init__(self, actor, sequence):
+        self.actor = actor
+        self.sequence = sequence
+        self.points = array.array('d')
 
-        for prop, value in properties:
-            pspec = getattr(self.__class__.props, prop)
-            value = _gvalue_from_python(pspec.value_type, value)
-            if not isinstance(prop, str):
-                raise TypeError('A property must be a string, got %s' %
-                        type(prop))
-            elif prop.startswith("fixed::"):
-                prop = prop[7:]
-                self.set_property(prop, value)
-            elif animation.has_property(prop):
-                animation.update(prop, value)
-            else:
+    def __repr__(self):
+        return '<Clutter.MotionBatch of %d points; sequence: %s>' % (
+            len(self), self.sequence)
+
+    def __len__(self):
+        return len(self.points) // 4
+
+    def __iter__(self):
+        points = self.points
+        for i in range(0, len(points), 4):
+            yield tuple(points[i:i + 4])
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if key < 0 or key >= len(self):
+                raise IndexError("index out of range: %d" % key)
+            return tuple(self.points[key * 4:key * 4 + 4])
+        else:
+            raise TypeError("indices must be integer")
+
+    def to_numpy(self):
+        """
+        Returns the points as an N×4 float64 array sharing this batch's
+        storage.
+        """
+        _require_numpy('MotionBatch')
+        return numpy.frombuffer(self.points, dtype=numpy.float64).reshape(-1, 4)
+
+__all__.append('MotionBatch')
+
+class MotionCoalescer(object):
+    """
+    Collects the Clutter.EventType.MOTION and TOUCH_UPDATE events reaching
+    an actor during a frame, and delivers them to @callback as one
+    MotionBatch per pointer or touch sequence, right before the frame is
+    painted. The coalesced events are stopped in the capture phase, so no
+    other handler sees them.
+
+    Pending points are also flushed before any other event reaches the
+    actor, so that a touch end or button release is never seen before the
+    motion preceding it. Clutter's motion throttling, which would drop
+    every motion event but the last one of each frame, is disabled on the
+    stage of the actor while the coalescer is active, from the moment the
+    actor is mapped if it is not on a stage yet.
+
+    >>> def on_motion(batch):
+    ...     points = batch.to_numpy()
+    ...     velocity = numpy.diff(points[:, :2], axis=0) / numpy.diff(points[:, 2:3], axis=0)
+    >>> coalescer = canvas.coalesce_motion_events(on_motion)
+    """
+    def __init__(self, actor, callback, touch=True):
+        self.actor = actor
+        self._callback = callback
+        self._types = set([Clutter.EventType.MOTION])
+        if touch and clutter_version >= (1, 10, 0):
+            self._types.add(Clutter.EventType.TOUCH_UPDATE)
+        self._pending = {}
+        self._pressure_axes = {}
+        self._stage = None
+        self._throttle = None
+        self._handler_id = actor.connect('captured-event', self._on_captured_event)
+        self._mapped_id = actor.connect('notify::mapped', self._on_mapped)
+        self._repaint_id = Clutter.threads_add_repaint_func_full(
+            Clutter.RepaintFlags.PRE_PAINT, self._on_repaint)
+        self._update_stage()
+
+    def _restore_throttle(self):
+        if self._stage is not None:
+            self._stage.set_throttle_motion_events(self._throttle)
+            self._stage = None
+
+    def _update_stage(self):
+        stage = self.actor.get_stage()
+        if stage is None or stage == self._stage:
+            return
+        self._restore_throttle()
+        self._stage = stage
+        self._throttle = stage.get_throttle_motion_events()
+        stage.set_throttle_motion_events(False)
+
+    def _on_mapped(self, actor, pspec):
+        if actor.is_mapped():
+            self._update_stage()
+
+    def _get_pressure(self, event):
+        device = event.get_device()
+        if device is None:
+            return _NAN
+        device_id = device.get_device_id()
+        index = self._pressure_axes.get(device_id)
+        if index is None:
+            index = -1
+            for i in range(device.get_n_axes()):
+                if device.get_axis(i) == Clutter.InputAxis.PRESSURE:
+                    index = i
+                    break
+            self._pressure_axes[device_id] = index
+        if index < 0:
+            return _NAN
+        axes = event.get_axes()
+        if not axes or index >= len(axes):
+            return _NAN
+        return axes[index]
+
+    def _on_captured_event(self, actor, event):
+        event_type = event.type()
+        if event_type not in self._types:
+            if self._pending:
+                self.flush()
+            return False
+
+        if event_type == Clutter.EventType.MOTION:
+            sequence = None
+        else:
+            sequence = event.get_event_sequence()
+        batch = self._pending.get(sequence)
+        if batch is None:
+            batch = self._pending[sequence] = MotionBatch(self.actor, sequence)
+        x, y = event.get_coords()
+        batch.points.extend((x, y, event.get_time(), self._get_pressure(event)))
+        return True
+
+    def _on_repaint(self):
+        if self._pending:
+            self.flush()
+        return True
+
+    def flush(self):
+        """
+        Delivers the pending batches immediately.
+        """
+        pending = self._pending
+        self._pending = {}
+        for batch in pending.values():
+            self._callback(batch)
+
+    def disconnect(self):
+        """
+        Flushes the pending batches and stops coalescing events.
+        """
+        if self._handler_id == 0:
+            return
+        self.flush()
+        self.actor.disconnect(self._handler_id)
+        self.actor.disconnect(self._mapped_id)
+        self._handler_id = 0
+        self._mapped_id = 0
+        Clutter.threads_remove_repaint_func(self._repaint_id)
+        self._repaint_id = 0
+        self._restore_throttle()
+
+__all__.append('MotionCoalescer')
+
+# One recorded event: recording time (us), type, flags, time, modifier
+# state, x, y, two type specific details (button and click count, keyval
+# and keycode, scroll direction, or stage state mask and new state), the
+# key unicode value, the touch sequence number and the device id
+_EVENT_RECORD = struct.Struct('<qHHIIffIIIIi')
+_EVENT_RECORDING_MAGIC = b'CLEV'
+_EVENT_RECORDING_HEADER = struct.Struct('<4sHH')
+_EVENT_RECORDING_VERSION = 1
+
+class EventRecording(object):
+    """
+    A sequence of recorded events in a compact binary form, as produced by
+    EventRecorder and consumed by EventReplayer.
+    """
+    def __init__(self, data=b''):
+        if len(data) % _EVENT_RECORD.size:
+            raise ValueError('truncated event recording')
+        self._data = bytes(data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            header = f.read(_EVENT_RECORDING_HEADER.size)
+            if len(header) != _EVENT_RECORDING_HEADER.size:
+                raise ValueError("'%s' is not an event recording" % path)
+            magic, version, record_size = _EVENT_RECORDING_HEADER.unpack(header)
+            if magic != _EVENT_RECORDING_MAGIC:
+                raise ValueError("'%s' is not an event recording" % path)
+            if version != _EVENT_RECORDING_VERSION or \
+                    record_size != _EVENT_RECORD.size:
+                raise ValueError("unsupported event recording version %d" % version)
+            return cls(f.read())
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(_EVENT_RECORDING_HEADER.pack(_EVENT_RECORDING_MAGIC,
+                                                 _EVENT_RECORDING_VERSION,
+                                                 _EVENT_RECORD.size))
+            f.write(self._data)
+
+    def to_bytes(self):
+        return self._data
+
+    def __repr__(self):
+        return '<Clutter.EventRecording of %d events>' % len(self)
+
+    def __len__(self):
+        return len(self._data) // _EVENT_RECORD.size
+
+    def __iter__(self):
+        for i in range(0, len(self._data), _EVENT_RECORD.size):
+            yield _EVENT_RECORD.unpack_from(self._data, i)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if key < 0 or key >= len(self):
+                raise IndexError("index out of range: %d" % key)
+            return _EVENT_RECORD.unpack_from(self._data, key * _EVENT_RECORD.size)
+        else:
+            raise TypeError("indices must be integer")
+
+__all__.append('EventRecording')
+
+class EventRecorder(object):
+    """
+    Records every event reaching @stage, without interfering with its
+    delivery. With a @capacity, the recorder keeps only the most recent
+    @capacity events in a ring buffer.
+
+    >>> recorder = Clutter.EventRecorder(stage)
+    >>> ...
+    >>> recorder.stop()
+    >>> recorder.get_recording().save('session.clev')
+    """
+    def __init__(self, stage, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError('capacity must be positive')
+        self.stage = stage
+        self._capacity = capacity
+        if capacity is not None:
+            self._buffer = bytearray(capacity * _EVENT_RECORD.size)
+        else:
+            self._buffer = bytearray()
+        self._count = 0
+        self._sequences = {}
+        self._handler_id = 0
+        self.start()
+
+    def __len__(self):
+        if self._capacity is not None:
+            return min(self._count, self._capacity)
+        return self._count
+
+    def start(self):
+        if self._handler_id == 0:
+            self._handler_id = self.stage.connect('captured-event',
+                                                  self._on_captured_event)
+
+    def stop(self):
+        if self._handler_id != 0:
+            self.stage.disconnect(self._handler_id)
+            self._handler_id = 0
+
+    def clear(self):
+        self._count = 0
+        self._sequences = {}
+        if self._capacity is None:
+            self._buffer = bytearray()
+
+    def _pack(self, event):
+        event_type = event.type()
+        member = Event._UNION_MEMBERS.get(event_type)
+        x = y = 0.0
+        detail1 = detail2 = unicode_value = sequence_id = 0
+        if event_type in Event._COORDS_TYPES:
+            x, y = event.get_coords()
+        if member == 'key':
+            detail1 = event.get_key_symbol()
+            detail2 = event.get_key_code()
+            unicode_value = event.get_key_unicode()
+        elif member == 'button':
+            detail1 = event.get_button()
+            detail2 = event.get_click_count()
+        elif member == 'scroll':
+            detail1 = int(event.get_scroll_direction())
+        elif member == 'stage_state':
+            detail1 = int(event.stage_state.changed_mask)
+            detail2 = int(event.stage_state.new_state)
+        elif member == 'touch':
+            sequence = event.get_event_sequence()
+            if sequence is not None:
+                sequence_id = self._sequences.setdefault(
+                    sequence, len(self._sequences) + 1)
+        device = event.get_device()
+        device_id = device.get_device_id() if device is not None else -1
+        return _EVENT_RECORD.pack(GLib.get_monotonic_time(), int(event_type),
+                                  int(event.get_flags()), event.get_time(),
+                                  int(event.get_state()), x, y, detail1,
+                                  detail2, unicode_value, sequence_id,
+                                  device_id)
+
+    def _on_captured_event(self, stage, event):
+        if event.type() not in Event._UNION_MEMBERS:
+            return False
+        record = self._pack(event)
+        if self._capacity is None:
+            self._buffer.extend(record)
+        else:
+            offset = (self._count % self._capacity) * _EVENT_RECORD.size
+            self._buffer[offset:offset + _EVENT_RECORD.size] = record
+        self._count += 1
+        return False
+
+    def get_recording(self):
+        """
+        Returns the recorded events, oldest first, as an EventRecording.
+        """
+        if self._capacity is None or self._count <= self._capacity:
+            return EventRecording(self._buffer[:len(self) * _EVENT_RECORD.size])
+        split = (self._count % self._capacity) * _EVENT_RECORD.size
+        return EventRecording(self._buffer[split:] + self._buffer[:split])
+
+__all__.append('EventRecorder')
+
+class EventReplayer(object):
+    """
+    Injects the events of an EventRecording into @stage with
+    Clutter.Event.put(), either with the recorded timing divided by
+    @speed, or as fast as the main loop allows when @speed is 0. Replay
+    only needs a stage and a main loop, so it works on offscreen stages.
+
+    Pointer and keyboard events are attributed to the core devices of the
+    default device manager. Enter and leave events are not replayed, since
+    Clutter synthesizes them from the motion events, and neither are stage
+    state changes. Touch sequences cannot be created from Python, so touch
+    events are not replayed either, rather than replayed without their
+    sequence.
+
+    >>> replayer = Clutter.EventReplayer(stage, recording, speed=4.0)
+    >>> replayer.start(on_completed=lambda r: Clutter.main_quit())
+    """
+    # number of events injected per main loop iteration at full speed
+    BATCH_SIZE = 256
+
+    _SKIPPED_TYPES = frozenset([Clutter.EventType.ENTER,
+                                Clutter.EventType.LEAVE,
+                                Clutter.EventType.STAGE_STATE])
+    if clutter_version >= (1, 10, 0):
+        _SKIPPED_TYPES |= frozenset([Clutter.EventType.TOUCH_BEGIN,
+                                     Clutter.EventType.TOUCH_UPDATE,
+                                     Clutter.EventType.TOUCH_END,
+                                     Clutter.EventType.TOUCH_CANCEL])
+
+    def __init__(self, stage, recording, speed=1.0):
+        if not isinstance(recording, EventRecording):
+            recording = EventRecording.load(recording)
+        self.stage = stage
+        self.recording = recording
+        self.speed = speed
+        self._position = 0
+        self._source_id = 0
+        self._start_time = 0
+        self._on_completed = None
+
+        manager = Clutter.DeviceManager.get_default()
+        self._pointer = manager.get_core_device(Clutter.InputDeviceType.POINTER_DEVICE)
+        self._keyboard = manager.get_core_device(Clutter.InputDeviceType.KEYBOARD_DEVICE)
+
+    def is_playing(self):
+        return self._source_id != 0
+
+    def start(self, on_completed=None):
+        """
+        Starts replaying from the beginning. @on_completed is called with
+        the replayer once every event has been injected.
+        """
+        self.stop()
+        self._on_completed = on_completed
+        self._position = 0
+        self._start_time = GLib.get_monotonic_time()
+        if self.speed:
+            self._schedule()
+        else:
+            self._source_id = GLib.idle_add(self._inject_batch)
+
+    def stop(self):
+        if self._source_id != 0:
+            GLib.source_remove(self._source_id)
+            self._source_id = 0
+
+    def _make_event(self, record):
+        (recorded_at, event_type, flags, time, state, x, y, detail1, detail2,
+         unicode_value, sequence_id, device_id) = record
+        event_type = Clutter.EventType(event_type)
+        if event_type in self._SKIPPED_TYPES:
+            return None
+        member = Event._UNION_MEMBERS.get(event_type)
+        event = Clutter.Event.new(event_type)
+        event.set_stage(self.stage)
+        event.set_time(time)
+        event.set_flags(Clutter.EventFlags(flags))
+        event.set_state(Clutter.ModifierType(state))
+        if member == 'key':
+            event.set_device(self._keyboard)
+            event.set_key_symbol(detail1)
+            event.set_key_code(detail2)
+            event.set_key_unicode(unicode_value)
+        else:
+            event.set_device(self._pointer)
+            event.set_coords(x, y)
+            if member == 'button':
+                event.set_button(detail1)
+                # there is no setter for the click count
+                event.button.click_count = detail2
+            elif member == 'scroll':
+                event.set_scroll_direction(Clutter.ScrollDirection(detail1))
+        return event
+
+    def _inject(self, record):
+        event = self._make_event(record)
+        if event is not None:
+            event.put()
+
+    def _finish(self):
+        self._source_id = 0
+        if self._on_completed is not None:
+            self._on_completed(self)
+
+    def _inject_batch(self):
+        recording = self.recording
+        end = min(self._position + self.BATCH_SIZE, len(recording))
+        for i in range(self._position, end):
+            self._inject(recording[i])
+        self._position = end
+        if end == len(recording):
+            self._finish()
+            return False
+        return True
+
+    def _schedule(self):
+        recording = self.recording
+        if self._position >= len(recording):
+            self._finish()
+            return
+        first = recording[0][0]
+        due = self._start_time + (recording[self._position][0] - first) / self.speed
+        delay = max(int((due - GLib.get_monotonic_time()) // 1000), 0)
+        self._source_id = GLib.timeout_add(delay, self._on_timeout)
+
+    def _on_timeout(self):
+        recording = self.recording
+        first = recording[0][0]
+        elapsed = (GLib.get_monotonic_time() - self._start_time) * self.speed
+        while self._position < len(recording) and \
+                recording[self._position][0] - first <= elapsed:
+            self._inject(recording[self._position])
+            self._position += 1
+        self._schedule()
+        return False
+
+__all__.append('EventReplayer')
+
+if asyncio is not None:
+    def _fileobj_to_fd(fileobj):
+        if isinstance(fileobj, int):
+            fd = fileobj
+        else:
+            try:
+                fd = int(fileobj.fileno())
+            except (AttributeError, TypeError, ValueError):
+                raise ValueError('Invalid file object: %r' % (fileobj,))
+        if fd < 0:
+            raise ValueError('Invalid file descriptor: %d' % fd)
+        return fd
+
+    class _SelectorMapping(_Mapping):
+        # the registered keys, looked up by file object or descriptor
+        def __init__(self, keys):
+            self._keys = keys
+
+        def __len__(self):
+            return len(self._keys)
+
+        def __getitem__(self, fileobj):
+            try:
+                return self._keys[_fileobj_to_fd(fileobj)]
+            except ValueError:
+                raise KeyError('%r is not registered' % (fileobj,))
+
+        def __iter__(self):
+            return iter(self._keys)
+
+    class _GLibSelector(selectors.BaseSelector):
+        # A selector waiting on the GLib main context, so that Clutter keeps
+        # dispatching events and painting frames while asyncio waits for
+        # its file descriptors or timers
+
+        # the number of main context iterations run by a non-blocking
+        # select(), so that sources always ready cannot starve asyncio
+        MAX_ITERATIONS = 16
+
+        def __init__(self, context):
+            self._context = context
+            self._keys = {}
+            self._map = _SelectorMapping(self._keys)
+            self._watches = {}
+            self._ready = {}
+
+        def _on_fd_ready(self, fd, condition):
+            key = self._keys.get(fd)
+            if key is None:
+                return False
+            events = 0
+            if condition & (GLib.IOCondition.HUP | GLib.IOCondition.ERR):
+                # let the callbacks of whatever was registered see the error
+                events = key.events
+            if condition & GLib.IOCondition.IN:
+                events |= selectors.EVENT_READ
+            if condition & GLib.IOCondition.OUT:
+                events |= selectors.EVENT_WRITE
+            events &= key.events
+            if events:
+                previous = self._ready.get(fd, (key, 0))[1]
+                self._ready[fd] = (key, previous | events)
+            return True
+
+        def register(self, fileobj, events, data=None):
+            if not events or events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+                raise ValueError('Invalid events: %r' % (events,))
+            fd = _fileobj_to_fd(fileobj)
+            if fd in self._keys:
+                raise KeyError('%r (FD %d) is already registered' % (fileobj, fd))
+            key = selectors.SelectorKey(fileobj, fd, events, data)
+            self._keys[fd] = key
+
+            condition = GLib.IOCondition.HUP | GLib.IOCondition.ERR
+            if events & selectors.EVENT_READ:
+                condition |= GLib.IOCondition.IN
+            if events & selectors.EVENT_WRITE:
+                condition |= GLib.IOCondition.OUT
+            self._watches[fd] = GLib.io_add_watch(fd, GLib.PRIORITY_DEFAULT,
+                                                  condition, self._on_fd_ready)
+            return key
+
+        def unregister(self, fileobj):
+            key = self._map[fileobj]
+            del self._keys[key.fd]
+            source_id = self._watches.pop(key.fd, None)
+            if source_id is not None:
+                GLib.source_remove(source_id)
+            self._ready.pop(key.fd, None)
+            return key
+
+        def select(self, timeout=None):
+            if timeout is not None and timeout <= 0:
+                for i in range(self.MAX_ITERATIONS):
+                    if not self._context.iteration(False):
+                        break
+            else:
+                expired = []
+                source_id = 0
+                if timeout is not None:
+                    source_id = GLib.timeout_add(int(math.ceil(timeout * 1000)),
+                                                 lambda: expired.append(True))
+                while not self._ready and not expired:
+                    self._context.iteration(True)
+                if source_id and not expired:
+                    GLib.source_remove(source_id)
+            ready = list(self._ready.values())
+            self._ready = {}
+            return ready
+
+        def close(self):
+            for source_id in self._watches.values():
+                GLib.source_remove(source_id)
+            self._watches = {}
+            self._keys.clear()
+            self._ready = {}
+
+        def get_map(self):
+            return self._map
+
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        """
+        An asyncio event loop policy whose loops wait on the default GLib
+        main context instead of a plain selector, so that coroutines and the
+        Clutter main loop run together in the main thread without polling.
+
+        >>> asyncio.set_event_loop_policy(Clutter.EventLoopPolicy())
+        >>> asyncio.new_event_loop().run_until_complete(main())
+        """
+        def new_event_loop(self):
+            return asyncio.SelectorEventLoop(
+                _GLibSelector(GLib.MainContext.default()))
+
+    __all__.append('EventLoopPolicy')
+
+def run_async(coroutine):
+    """
+    Runs @coroutine to completion on a new asyncio event loop driven by
+    the GLib main context, in place of Clutter.main().
+
+    >>> Clutter.run_async(main())
+    """
+    _require_asyncio('run_async')
+    loop = EventLoopPolicy().new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+__all__.append('run_async')
+
+class SignalStream(object):
+    """
+    An asynchronous iterator over the emissions of a signal, created by
+    Actor.events(). Clutter.Event arguments are copied, since events are
+    only valid during their dispatch.
+    """
+    def __init__(self, obj, signal_name, stop=False, loop=None):
+        _require_asyncio('SignalStream')
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        self._obj = obj
+        self._stop = stop
+        self._loop = loop
+        self._queue = collections.deque()
+        self._waiter = None
+        self._handler_ids = [obj.connect(signal_name, self._on_signal)]
+        if isinstance(obj, Clutter.Actor):
+            self._handler_ids.append(obj.connect('destroy', self._on_destroy))
+
+    def _on_signal(self, obj, *args):
+        args = tuple(arg.copy() if isinstance(arg, Clutter.Event) else arg
+                     for arg in args)
+        item = args[0] if len(args) == 1 else args
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(item)
+            self._waiter = None
+        else:
+            self._queue.append(item)
+        return self._stop
+
+    def _on_destroy(self, obj):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        future = self._loop.create_future()
+        if self._queue:
+            future.set_result(self._queue.popleft())
+        elif not self._handler_ids:
+            future.set_exception(StopAsyncIteration())
+        else:
+            self._waiter = future
+        return future
+
+    def close(self):
+        """
+        Disconnects from the signal; a pending iteration stops.
+        """
+        for handler_id in self._handler_ids:
+            self._obj.disconnect(handler_id)
+        self._handler_ids = []
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_exception(StopAsyncIteration())
+        self._waiter = None
+
+__all__.append('SignalStream')
+
+@giclassoverride
+class Actor(Clutter.Actor):
+    def _update_animation(self, *args, **kwargs):
+        def _detach_animation(animation):
+            delattr(self, '_animation')
+            del animation
+
+        # check if we already have a running animation
+        if hasattr(self, '_animation'):
+            animation = getattr(self, '_animation')
+        else:
+            animation = Clutter.Animation()
+            animation.set_object(self)
+            animation.connect('completed', _detach_animation)
+            setattr(self, '_animation', animation)
+
+        # check arguments
+        if len(args) == 1 and isinstance(args[0], dict):
+            properties = args[0].items()
+        elif len(args) == 2 and isinstance(args[0], (tuple, list)) and \
+                isinstance(args[1], (tuple, list)):
+            properties = zip(args[0], args[1])
+        elif len(args) >= 2 and not 2 % 2:
+            properties = zip(args[::2], args[1::2])
+        elif kwargs:
+            properties = kwargs.items()
+        else:
+            raise TypeError('The arguments must be: ' +
+                    '"property", value, "property", value, ... or ' +
+                    '("property", "property", ...), (value, value, ...) ' +
+                    'or {"property": value, "property", value}')
+
+        for prop, value in properties:
+            if not isinstance(prop, _basestring):
+                raise TypeError('A property must be a string, got %s' %
+                        type(prop))
+            elif prop.startswith("fixed::"):
+                prop = prop[7:]
+                pspec, convert = _lookup_property(self, prop)
+                self.set_property(prop, convert(value))
+                continue
+            pspec, convert = _lookup_property(self, prop)
+            value = convert(value)
+            if animation.has_property(prop):
+                animation.update(prop, value)
+            else:
                 animation.bind(prop, value)
         return animation
 
@@ -696,6 +2282,63 @@ class Actor(Clutter.Actor):
         animation.get_timeline().start()
         return animation
 
+    def coalesce_motion_events(self, callback, touch=True):
+        """
+        @callback: A callable receiving a Clutter.MotionBatch
+        @touch: Whether touch updates are coalesced as well
+
+        The coalesce_motion_events() method delivers the motion events
+        reaching this actor once per frame, as batches of points. Returns a
+        Clutter.MotionCoalescer; call its disconnect() method to go back to
+        per-event delivery.
+        """
+        return MotionCoalescer(self, callback, touch)
+
+    def events(self, signal_name, stop=False, loop=None):
+        """
+        @signal_name: The name of the signal, like 'button-press-event'
+        @stop: The value returned to the signal emission
+        @loop: The asyncio event loop, or None for the running one
+
+        The events() method returns an asynchronous iterator over the
+        emissions of a signal of this actor. It requires a running asyncio
+        event loop, like the ones of Clutter.EventLoopPolicy.
+
+        >>> async for event in actor.events('button-press-event'):
+        ...     print(event.get_coords())
+        """
+        return SignalStream(self, signal_name, stop, loop)
+
+    def transition_completed(self, name, loop=None):
+        """
+        @name: The name of a transition, like 'x' for an implicit one
+        @loop: The asyncio event loop, or None for the running one
+
+        Returns an asyncio future resolved with whether the transition ran
+        to completion once it stops, or immediately with True if there is
+        no such transition.
+
+        >>> with actor.easing_state(250):
+        ...     actor.set_x(200)
+        >>> await actor.transition_completed('x')
+        """
+        _require_asyncio('Actor.transition_completed')
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.get_transition(name) is None:
+            future.set_result(True)
+            return future
+
+        def on_transition_stopped(actor, transition_name, is_finished):
+            actor.disconnect(handler_id[0])
+            if not future.done():
+                future.set_result(is_finished)
+
+        handler_id = [self.connect('transition-stopped::' + name,
+                                   on_transition_stopped)]
+        return future
+
     def raise_actor(self, below):
         parent = self.get_parent()
         if not parent:
@@ -756,68 +2399,1182 @@ class Actor(Clutter.Actor):
             yield
             self.restore_easing_state()
 
-@giclassoverride
-class Container(Clutter.Container):
+        @contextmanager
+        def batch_update(self):
+            """
+            The batch_update() method freezes property notifications on this
+            actor and all of its descendants, and turns the relayout
+            requests that reach this actor into a single request issued when
+            the block ends.
+
+            >>> with grid.batch_update() as stats:
+            ...     for tile in grid:
+            ...         tile.set_opacity(128)
+            ...         tile.set_size(64, 64)
+            >>> print(stats)
+
+            The BatchUpdateStats yielded by the context manager counts the
+            relayout requests that reached this actor during the block. This
+            is not a measure of the requests saved: Clutter stops requests at
+            an actor already needing a relayout, which the batched actor
+            never does until the block ends. Notifications emitted while
+            frozen cannot be observed, so only the number delivered once
+            thawed, one per changed property and actor, is reported.
+
+            Redraws are not affected: Clutter already merges them, and
+            emits queue-redraw only when the stage is about to paint.
+            """
+            stats = BatchUpdateStats()
+
+            def on_queue_relayout(actor):
+                stats.relayouts_requested += 1
+                actor.stop_emission_by_name('queue-relayout')
+
+            def on_notify(actor, pspec):
+                stats.notifications += 1
+
+            actors = [self]
+            i = 0
+            while i < len(actors):
+                actors.extend(actors[i].get_children())
+                i += 1
+            for actor in actors:
+                actor.freeze_notify()
+
+            handler_id = self.connect('queue-relayout', on_queue_relayout)
+            try:
+                yield stats
+            finally:
+                self.disconnect(handler_id)
+                if stats.relayouts_requested:
+                    self.queue_relayout()
+
+                notify_handlers = [(actor, actor.connect('notify', on_notify))
+                                   for actor in actors]
+                for actor in reversed(actors):
+                    actor.thaw_notify()
+                for actor, handler_id in notify_handlers:
+                    actor.disconnect(handler_id)
+
+class BatchUpdateStats(object):
+    """
+    The counters collected by Actor.batch_update(): the notifications
+    delivered when the block ended, and the relayout requests that reached
+    the batched actor, which were replaced by a single one.
+    """
+    def __init__(self):
+        self.notifications = 0
+        self.relayouts_requested = 0
+
+    def __repr__(self):
+        return ('<Clutter.BatchUpdateStats notifications: %d; ' +
+                'relayouts requested: %d>') % (self.notifications,
+                                               self.relayouts_requested)
+
+__all__.append('BatchUpdateStats')
+
+_NUMERIC_FUNDAMENTALS = {
+    GObject.TYPE_CHAR: True,
+    GObject.TYPE_UCHAR: True,
+    GObject.TYPE_INT: True,
+    GObject.TYPE_UINT: True,
+    GObject.TYPE_LONG: True,
+    GObject.TYPE_ULONG: True,
+    GObject.TYPE_INT64: True,
+    GObject.TYPE_UINT64: True,
+    GObject.TYPE_FLOAT: False,
+    GObject.TYPE_DOUBLE: False,
+}
+
+class AnimationGroup(object):
+    """
+    A group of property animations on many actors, driven by a single
+    Clutter.Timeline. Use animate_many() to create one.
+
+    Numeric properties are interpolated in Python; every other type is
+    interpolated by a Clutter.Interval created once per property.
+    """
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self._tracks = []
+        self._handler_id = 0
+        self._connect()
+        timeline.connect('completed', self._on_completed)
+
+    def _connect(self):
+        if self._handler_id == 0:
+            self._handler_id = self.timeline.connect('new-frame',
+                                                     self._on_new_frame)
+
+    def _disconnect(self):
+        if self._handler_id:
+            self.timeline.disconnect(self._handler_id)
+            self._handler_id = 0
+
+    def _add(self, actor, property_name, final):
+        pspec, convert = _lookup_property(actor, property_name)
+        initial = actor.get_property(property_name)
+        fundamental = GObject.type_fundamental(pspec.value_type)
+        if fundamental in _NUMERIC_FUNDAMENTALS:
+            track = (actor, property_name, initial, final - initial,
+                     _NUMERIC_FUNDAMENTALS[fundamental], None)
+        else:
+            interval = Clutter.Interval.new_with_values(pspec.value_type,
+                                                        convert(initial),
+                                                        convert(final))
+            track = (actor, property_name, None, None, False, interval)
+        self._tracks.append(track)
+
+    def _apply(self, progress):
+        for actor, name, initial, delta, integral, interval in self._tracks:
+            if interval is not None:
+                actor.set_property(name, interval.compute(progress))
+            elif integral:
+                actor.set_property(name, int(round(initial + delta * progress)))
+            else:
+                actor.set_property(name, initial + delta * progress)
+
+    def _on_new_frame(self, timeline, msecs):
+        self._apply(timeline.get_progress())
+
+    def _on_completed(self, timeline):
+        self._disconnect()
+
     def __len__(self):
-        return len(self.get_children())
+        return len(self._tracks)
 
-    def __bool__(self):
+    def connect(self, signal_name, handler, *args):
+        """
+        Connects @handler to a signal of the underlying timeline, like
+        'completed'.
+        """
+        return self.timeline.connect(signal_name, handler, *args)
+
+    def start(self):
+        self._connect()
+        self.timeline.start()
+
+    def pause(self):
+        self.timeline.pause()
+
+    def is_playing(self):
+        return self.timeline.is_playing()
+
+    def reverse(self):
+        """
+        Reverses the direction of the group, resuming it if it was not
+        playing.
+        """
+        if self.timeline.get_direction() == Clutter.TimelineDirection.FORWARD:
+            self.timeline.set_direction(Clutter.TimelineDirection.BACKWARD)
+        else:
+            self.timeline.set_direction(Clutter.TimelineDirection.FORWARD)
+        if not self.timeline.is_playing():
+            self.start()
+
+    def cancel(self):
+        """
+        Stops the group, leaving the properties at their current values.
+        'completed' is not emitted.
+        """
+        self._disconnect()
+        self.timeline.stop()
+
+    def complete(self):
+        """
+        Jumps to the end of the group in its current direction. The
+        properties are set to their final values right away, and the
+        timeline emits 'completed' on its next frame.
+        """
+        if self._handler_id == 0:
+            # already completed or cancelled
+            return
+        if self.timeline.get_direction() == Clutter.TimelineDirection.FORWARD:
+            self._apply(1.0)
+            self.timeline.advance(self.timeline.get_duration())
+        else:
+            self._apply(0.0)
+            self.timeline.advance(0)
+        if not self.timeline.is_playing():
+            self.timeline.start()
+
+__all__.append('AnimationGroup')
+
+def animate_many(actors, mode, duration, properties):
+    """
+    @actors: A sequence of actors
+    @mode: A Clutter.AnimationMode used for every actor
+    @duration: The duration of the animation in ms
+    @properties: A dictionary of property names and final values used
+        for every actor, or a sequence with one such dictionary per actor
+
+    The animate_many() function animates many actors from a single
+    timeline, updating all of their properties in one pass on every frame.
+    It returns an AnimationGroup that has already been started.
+
+    >>> group = Clutter.animate_many(tiles,
+    ...     Clutter.AnimationMode.EASE_OUT_CUBIC, 500,
+    ...     [{'x': col * 64.0, 'opacity': 255} for col in range(len(tiles))])
+    >>> group.connect('completed', on_grid_shown)
+    """
+    actors = list(actors)
+    if isinstance(properties, dict):
+        properties = [properties] * len(actors)
+    else:
+        properties = list(properties)
+        if len(properties) != len(actors):
+            raise ValueError('expected %d property dictionaries, got %d' %
+                             (len(actors), len(properties)))
+
+    timeline = Clutter.Timeline(duration=duration)
+    timeline.set_progress_mode(mode)
+
+    group = AnimationGroup(timeline)
+    for actor, actor_properties in zip(actors, properties):
+        for name, value in actor_properties.items():
+            group._add(actor, name, value)
+    group.start()
+    return group
+
+__all__.append('animate_many')
+
+def _ease_out_bounce(p):
+    p = numpy.asarray(p, dtype=numpy.float64)
+    return numpy.select(
+        [p < 1 / 2.75, p < 2 / 2.75, p < 2.5 / 2.75],
+        [7.5625 * p * p,
+         7.5625 * (p - 1.5 / 2.75) ** 2 + 0.75,
+         7.5625 * (p - 2.25 / 2.75) ** 2 + 0.9375],
+        7.5625 * (p - 2.625 / 2.75) ** 2 + 0.984375)
+
+def _ease_in_out(ease_in, ease_out):
+    return lambda p: numpy.where(p < 0.5,
+                                 ease_in(p * 2.0) * 0.5,
+                                 ease_out(p * 2.0 - 1.0) * 0.5 + 0.5)
+
+_ease_in_quad = lambda p: p * p
+_ease_out_quad = lambda p: -p * (p - 2.0)
+_ease_in_cubic = lambda p: p ** 3
+_ease_out_cubic = lambda p: (p - 1.0) ** 3 + 1.0
+_ease_in_quart = lambda p: p ** 4
+_ease_out_quart = lambda p: -((p - 1.0) ** 4 - 1.0)
+_ease_in_quint = lambda p: p ** 5
+_ease_out_quint = lambda p: (p - 1.0) ** 5 + 1.0
+_ease_in_sine = lambda p: 1.0 - numpy.cos(p * numpy.pi / 2.0)
+_ease_out_sine = lambda p: numpy.sin(p * numpy.pi / 2.0)
+_ease_in_expo = lambda p: numpy.where(p == 0.0, 0.0, 2.0 ** (10.0 * (p - 1.0)))
+_ease_out_expo = lambda p: numpy.where(p == 1.0, 1.0, 1.0 - 2.0 ** (-10.0 * p))
+_ease_in_circ = lambda p: 1.0 - numpy.sqrt(numpy.maximum(1.0 - p * p, 0.0))
+_ease_out_circ = lambda p: numpy.sqrt(numpy.maximum(1.0 - (p - 1.0) ** 2, 0.0))
+_ease_in_elastic = lambda p: numpy.where(
+    p == 1.0, 1.0,
+    -(2.0 ** (10.0 * (p - 1.0))) *
+    numpy.sin((p - 1.0 - 0.075) * (2.0 * numpy.pi) / 0.3))
+_ease_out_elastic = lambda p: numpy.where(
+    p == 1.0, 1.0,
+    2.0 ** (-10.0 * p) * numpy.sin((p - 0.075) * (2.0 * numpy.pi) / 0.3) + 1.0)
+_ease_in_back = lambda p: p * p * (2.70158 * p - 1.70158)
+_ease_out_back = lambda p: (p - 1.0) ** 2 * (2.70158 * (p - 1.0) + 1.70158) + 1.0
+_ease_in_bounce = lambda p: 1.0 - _ease_out_bounce(1.0 - p)
+
+def _ease_in_out_elastic(p):
+    # clutter uses a longer period for the combined curve
+    q = p * 2.0 - 1.0
+    wave = numpy.sin((q - 0.1125) * (2.0 * numpy.pi) / 0.45)
+    return numpy.where(p == 1.0, 1.0,
+                       numpy.where(p < 0.5,
+                                   -0.5 * (2.0 ** (10.0 * q)) * wave,
+                                   (2.0 ** (-10.0 * q)) * wave * 0.5 + 1.0))
+
+def _ease_in_out_back(p):
+    s = 1.70158 * 1.525
+    q = p * 2.0
+    return numpy.where(q < 1.0,
+                       0.5 * (q * q * ((s + 1.0) * q - s)),
+                       0.5 * ((q - 2.0) ** 2 * ((s + 1.0) * (q - 2.0) + s) + 2.0))
+
+# The easing functions of clutter-easing.c, as functions of the normalized
+# elapsed time
+_EASING_FUNCTIONS = {
+    'LINEAR': lambda p: p,
+    'EASE_IN_QUAD': _ease_in_quad,
+    'EASE_OUT_QUAD': _ease_out_quad,
+    'EASE_IN_OUT_QUAD': _ease_in_out(_ease_in_quad, _ease_out_quad),
+    'EASE_IN_CUBIC': _ease_in_cubic,
+    'EASE_OUT_CUBIC': _ease_out_cubic,
+    'EASE_IN_OUT_CUBIC': _ease_in_out(_ease_in_cubic, _ease_out_cubic),
+    'EASE_IN_QUART': _ease_in_quart,
+    'EASE_OUT_QUART': _ease_out_quart,
+    'EASE_IN_OUT_QUART': _ease_in_out(_ease_in_quart, _ease_out_quart),
+    'EASE_IN_QUINT': _ease_in_quint,
+    'EASE_OUT_QUINT': _ease_out_quint,
+    'EASE_IN_OUT_QUINT': _ease_in_out(_ease_in_quint, _ease_out_quint),
+    'EASE_IN_SINE': _ease_in_sine,
+    'EASE_OUT_SINE': _ease_out_sine,
+    'EASE_IN_OUT_SINE': lambda p: -0.5 * (numpy.cos(numpy.pi * p) - 1.0),
+    'EASE_IN_EXPO': _ease_in_expo,
+    'EASE_OUT_EXPO': _ease_out_expo,
+    'EASE_IN_OUT_EXPO': _ease_in_out(_ease_in_expo, _ease_out_expo),
+    'EASE_IN_CIRC': _ease_in_circ,
+    'EASE_OUT_CIRC': _ease_out_circ,
+    'EASE_IN_OUT_CIRC': _ease_in_out(_ease_in_circ, _ease_out_circ),
+    'EASE_IN_ELASTIC': _ease_in_elastic,
+    'EASE_OUT_ELASTIC': _ease_out_elastic,
+    'EASE_IN_OUT_ELASTIC': _ease_in_out_elastic,
+    'EASE_IN_BACK': _ease_in_back,
+    'EASE_OUT_BACK': _ease_out_back,
+    'EASE_IN_OUT_BACK': _ease_in_out_back,
+    'EASE_IN_BOUNCE': _ease_in_bounce,
+    'EASE_OUT_BOUNCE': _ease_out_bounce,
+    'EASE_IN_OUT_BOUNCE': _ease_in_out(_ease_in_bounce, _ease_out_bounce),
+}
+
+_EASING_TABLE_SIZE = 1024
+_easing_tables = {}
+
+def get_easing_table(mode):
+    """
+    Returns the lookup table used by EasingEngine for @mode, a
+    Clutter.AnimationMode: a read-only float array holding the eased
+    progress for evenly spaced values of the elapsed time, from 0 to 1.
+    """
+    _require_numpy('EasingEngine')
+    try:
+        return _easing_tables[mode]
+    except KeyError:
+        pass
+
+    func = None
+    for name, candidate in _EASING_FUNCTIONS.items():
+        if getattr(Clutter.AnimationMode, name, None) == mode:
+            func = candidate
+            break
+    if func is None:
+        raise ValueError('animation mode %s has no easing table' % (mode,))
+
+    table = func(numpy.linspace(0.0, 1.0, _EASING_TABLE_SIZE))
+    table = numpy.asarray(table, dtype=numpy.float64)
+    table.flags.writeable = False
+    _easing_tables[mode] = table
+    return table
+
+__all__.append('get_easing_table')
+
+class EasingBatch(object):
+    """
+    A set of transitions of one property on many actors, started together
+    by EasingEngine.ease().
+    """
+    def __init__(self, engine, actors, property_name, kind, initial, final,
+                 start, duration, table, on_completed):
+        self._engine = engine
+        self.actors = actors
+        self.property_name = property_name
+        self._kind = kind
+        self._initial = initial
+        self._delta = final - initial
+        self._start = start
+        self._duration = duration
+        self._table = table
+        self._grid = numpy.linspace(0.0, 1.0, len(table))
+        self._live = numpy.ones(len(actors), dtype=bool)
+        self._on_completed = on_completed
+
+    def __len__(self):
+        return int(self._live.sum())
+
+    def _values_at(self, now):
+        # returns the values, which actors are past their delay, and
+        # whether every transition has completed
+        elapsed = (now - self._start) / self._duration
+        started = numpy.broadcast_to(elapsed > 0.0, self._live.shape)
+        elapsed = numpy.clip(elapsed, 0.0, 1.0)
+        progress = numpy.interp(elapsed, self._grid, self._table)
+        if progress.ndim == 1:
+            progress = progress[:, numpy.newaxis]
+        return (self._initial + self._delta * progress, started,
+                bool(numpy.all(elapsed >= 1.0)))
+
+    def _write(self, values, started=None):
+        name = self.property_name
+        kind = self._kind
+        live = self._live
+        if started is not None:
+            # actors still waiting for their delay keep whatever value the
+            # property has meanwhile
+            live = live & started
+        if kind == 'int':
+            values = numpy.rint(values).astype(numpy.int64)
+        for i, actor in enumerate(self.actors):
+            if not live[i]:
+                continue
+            if kind == 'color':
+                row = numpy.clip(values[i], 0.0, 255.0).astype(numpy.uint8)
+                actor.set_property(name, Color(*row.tolist()))
+            elif kind == 'point':
+                actor.set_property(name, Point(float(values[i, 0]),
+                                               float(values[i, 1])))
+            elif kind == 'int':
+                actor.set_property(name, int(values[i, 0]))
+            else:
+                actor.set_property(name, float(values[i, 0]))
+
+    def cancel(self):
+        """
+        Stops the transitions, leaving the properties at their current
+        values.
+        """
+        self._engine._remove(self)
+
+    def complete(self):
+        """
+        Stops the transitions, moving the properties to their final values.
+        """
+        self._write(self._initial + self._delta)
+        self._engine._remove(self)
+        if self._on_completed is not None:
+            self._on_completed(self)
+
+class EasingEngine(object):
+    """
+    An animation engine evaluating Clutter.AnimationMode curves from
+    precomputed lookup tables. Float, integer, Clutter.Color and
+    Clutter.Point properties of many actors are interpolated at once as
+    NumPy arrays, and written back from a single pre-paint repaint function
+    once per frame, without creating a Clutter.Transition per actor.
+
+    >>> engine = Clutter.EasingEngine.get_default()
+    >>> engine.ease(tiles, 'opacity', 255, 250,
+    ...             Clutter.AnimationMode.EASE_OUT_CUBIC,
+    ...             delay=[i * 20 for i in range(len(tiles))])
+    """
+    _default = None
+
+    def __init__(self):
+        _require_numpy('EasingEngine')
+        self._batches = []
+        self._owners = {}
+        self._repaint_id = 0
+
+    @classmethod
+    def get_default(cls):
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self):
+        return len(self._batches)
+
+    def _get_kind(self, actor, property_name):
+        pspec, convert = _lookup_property(actor, property_name)
+        value_type = pspec.value_type
+        fundamental = GObject.type_fundamental(value_type)
+        if fundamental in _NUMERIC_FUNDAMENTALS:
+            if _NUMERIC_FUNDAMENTALS[fundamental]:
+                return 'int', 1
+            return 'float', 1
+        elif value_type == Clutter.Color.__gtype__:
+            return 'color', 4
+        elif value_type == Clutter.Point.__gtype__:
+            return 'point', 2
+        raise TypeError("property '%s' of type %s cannot be eased" %
+                        (property_name, value_type.name))
+
+    def ease(self, actors, property_name, final, duration, mode,
+             delay=0, initial=None, on_completed=None):
+        """
+        @actors: A sequence of actors
+        @property_name: The name of the property to ease
+        @final: The final value, either shared by all actors or an array
+            with one value per actor
+        @duration: The duration in ms, a scalar or one value per actor
+        @mode: A Clutter.AnimationMode
+        @delay: The delay in ms, a scalar or one value per actor
+        @initial: The initial values; by default the current values
+        @on_completed: A callable receiving the EasingBatch once all of its
+            transitions have completed
+
+        Returns an EasingBatch. Transitions of the same property already
+        running on any of @actors are superseded.
+        """
+        actors = list(actors)
+        if not actors:
+            return None
+        kind, width = self._get_kind(actors[0], property_name)
+
+        if initial is None:
+            initial = [tuple(actor.get_property(property_name))
+                       if width > 1 else actor.get_property(property_name)
+                       for actor in actors]
+        initial = numpy.asarray(initial, dtype=numpy.float64)
+        initial = numpy.broadcast_to(initial.reshape(-1, width),
+                                     (len(actors), width)).copy()
+        if isinstance(final, (Clutter.Color, Clutter.Point)):
+            final = tuple(final)
+        final = numpy.asarray(final, dtype=numpy.float64)
+        final = numpy.broadcast_to(final.reshape(-1, width),
+                                   (len(actors), width))
+
+        now = GLib.get_monotonic_time() / 1000.0
+        start = now + numpy.asarray(delay, dtype=numpy.float64)
+        duration = numpy.maximum(numpy.asarray(duration, dtype=numpy.float64), 1.0)
+
+        batch = EasingBatch(self, actors, property_name, kind, initial, final,
+                            start, duration, get_easing_table(mode),
+                            on_completed)
+        for i, actor in enumerate(actors):
+            key = (actor, property_name)
+            owner = self._owners.get(key)
+            if owner is not None:
+                owner[0]._live[owner[1]] = False
+            self._owners[key] = (batch, i)
+        self._batches.append(batch)
+
+        if self._repaint_id == 0:
+            self._repaint_id = Clutter.threads_add_repaint_func_full(
+                Clutter.RepaintFlags.PRE_PAINT, self._on_repaint)
+        actors[0].queue_redraw()
+        return batch
+
+    def cancel(self, actor, property_name=None):
+        """
+        @actor: An actor
+        @property_name: The name of an eased property, or None for all of
+            them
+
+        Stops the transitions of @actor, leaving its properties at their
+        current values. The other actors of their batches are not affected.
+        """
+        if property_name is not None:
+            keys = [(actor, property_name)]
+        else:
+            keys = [key for key in self._owners if key[0] is actor]
+        for key in keys:
+            owner = self._owners.pop(key, None)
+            if owner is not None:
+                owner[0]._live[owner[1]] = False
+
+    def _remove(self, batch):
+        if batch in self._batches:
+            self._batches.remove(batch)
+        for i, actor in enumerate(batch.actors):
+            key = (actor, batch.property_name)
+            owner = self._owners.get(key)
+            if owner is not None and owner[0] is batch:
+                del self._owners[key]
+        batch._live[:] = False
+
+    def _on_repaint(self):
+        now = GLib.get_monotonic_time() / 1000.0
+        finished = []
+        for batch in self._batches:
+            values, started, done = batch._values_at(now)
+            if done:
+                # land exactly on the final values, whatever the table
+                batch._write(batch._initial + batch._delta)
+            else:
+                batch._write(values, started)
+            if done or not batch._live.any():
+                finished.append((batch, done))
+
+        for batch, done in finished:
+            self._remove(batch)
+            if done and batch._on_completed is not None:
+                # an exception would make PyGObject drop this repaint
+                # function while _repaint_id is still set
+                try:
+                    batch._on_completed(batch)
+                except Exception:
+                    _report_exception()
+
+        if not self._batches:
+            self._repaint_id = 0
+            return False
+
+        # transitions waiting for their delay do not change anything, so
+        # keep the frames of every stage involved coming until every batch
+        # has completed
+        stages = set()
+        for batch in self._batches:
+            for actor in batch.actors:
+                stage = actor.get_stage()
+                if stage is not None and stage not in stages:
+                    stages.add(stage)
+                    stage.queue_redraw()
         return True
 
+__all__.append('EasingBatch')
+__all__.append('EasingEngine')
+
+def _run_in_future(future, fn, args, kwargs):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as err:
+        future.set_exception(err)
+    else:
+        future.set_result(result)
+
+class DispatcherStats(object):
+    """
+    The counters collected by a MainThreadDispatcher. Latencies are in ms,
+    from the call being queued to it starting to run.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.frames = 0
+        self.max_queue_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def mean_latency(self):
+        if self.calls == 0:
+            return 0.0
+        return self.total_latency / self.calls
+
+    def __repr__(self):
+        return ('<Clutter.DispatcherStats calls: %d; frames: %d; ' +
+                'max queue depth: %d; latency: %.2f ms mean, %.2f ms max>') % (
+                        self.calls, self.frames, self.max_queue_depth,
+                        self.mean_latency, self.max_latency)
+
+class MainThreadDispatcher(object):
+    """
+    Runs callables queued from any thread in the main thread. Calls are
+    appended to a deque, which needs no lock, and drained by a pre-paint
+    repaint function once per frame, for at most @budget ms per frame; the
+    main loop is woken up with a single idle source however many calls
+    are queued.
+
+    >>> dispatcher = Clutter.MainThreadDispatcher.get_default()
+    >>> future = dispatcher.submit(label.set_text, 'Done')
+    """
+    _default = None
+
+    def __init__(self, budget=4.0):
+        _require_futures('MainThreadDispatcher')
+        self.budget = budget
+        self.stats = DispatcherStats()
+        self._queue = collections.deque()
+        self._scheduled = False
+        self._repaint_id = 0
+
+    @classmethod
+    def get_default(cls):
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self):
+        return len(self._queue)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        @fn: A callable
+        @args: The positional arguments of @fn
+        @kwargs: The keyword arguments of @fn
+
+        Queues a call to @fn in the main thread and returns a
+        concurrent.futures.Future for its result. This method can be
+        called from any thread.
+        """
+        future = _futures.Future()
+        self._queue.append((GLib.get_monotonic_time(), future, fn, args, kwargs))
+        if not self._scheduled:
+            self._scheduled = True
+            GLib.idle_add(self._on_wakeup, priority=GLib.PRIORITY_HIGH_IDLE)
+        return future
+
+    @staticmethod
+    def _get_mapped_stages():
+        return [stage for stage in
+                Clutter.StageManager.get_default().list_stages()
+                if stage.is_mapped()]
+
+    def _on_wakeup(self):
+        stages = self._get_mapped_stages()
+        if not stages:
+            # without a mapped stage no frame is ever painted, and Clutter
+            # ignores queue_redraw(), so drain from the idle source instead
+            return self._drain()
+        if self._repaint_id == 0:
+            self._repaint_id = Clutter.threads_add_repaint_func_full(
+                Clutter.RepaintFlags.PRE_PAINT, self._on_repaint)
+        for stage in stages:
+            stage.queue_redraw()
+        return False
+
+    def _on_repaint(self):
+        if self._drain():
+            stages = self._get_mapped_stages()
+            if stages:
+                for stage in stages:
+                    stage.queue_redraw()
+                return True
+            # the stages were hidden meanwhile, go on from an idle source
+            GLib.idle_add(self._on_wakeup, priority=GLib.PRIORITY_HIGH_IDLE)
+        self._repaint_id = 0
+        return False
+
+    def _drain(self):
+        stats = self.stats
+        stats.frames += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, len(self._queue))
+
+        deadline = GLib.get_monotonic_time() + int(self.budget * 1000)
+        queue = self._queue
+        while queue:
+            queued, future, fn, args, kwargs = queue.popleft()
+            latency = (GLib.get_monotonic_time() - queued) / 1000.0
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            _run_in_future(future, fn, args, kwargs)
+            if GLib.get_monotonic_time() >= deadline:
+                break
+
+        if queue:
+            return True
+        # a call queued after this point schedules a new wake-up, one
+        # queued before it is caught by the second check
+        self._scheduled = False
+        if queue:
+            self._scheduled = True
+            return True
+        return False
+
+    def reset_stats(self):
+        self.stats = DispatcherStats()
+
+def run_in_main(fn, *args, **kwargs):
+    """
+    @fn: A callable
+    @args: The positional arguments of @fn
+    @kwargs: The keyword arguments of @fn
+
+    The run_in_main() function queues a call to @fn on the default
+    MainThreadDispatcher and returns a concurrent.futures.Future for its
+    result. It can be called from any thread.
+
+    >>> def worker(path):
+    ...     pixels = load(path)
+    ...     Clutter.run_in_main(image.set_data, pixels, ...)
+    """
+    return MainThreadDispatcher.get_default().submit(fn, *args, **kwargs)
+
+if _futures is not None:
+    class MainLoopExecutor(_futures.ThreadPoolExecutor):
+        """
+        A thread pool whose futures complete in the main thread, so that
+        their done callbacks can update actors directly.
+
+        >>> executor = Clutter.MainLoopExecutor(max_workers=4)
+        >>> future = executor.submit(load_thumbnail, path)
+        >>> future.add_done_callback(lambda f: tile.set_content(f.result()))
+        """
+        def __init__(self, max_workers=None, dispatcher=None, **kwargs):
+            super(MainLoopExecutor, self).__init__(max_workers, **kwargs)
+            if dispatcher is None:
+                dispatcher = MainThreadDispatcher.get_default()
+            self._dispatcher = dispatcher
+
+        def submit(self, fn, *args, **kwargs):
+            future = _futures.Future()
+            worker_future = super(MainLoopExecutor, self).submit(fn, *args, **kwargs)
+
+            def on_worker_done(worker_future):
+                if worker_future.cancelled():
+                    self._dispatcher.submit(future.cancel)
+                else:
+                    self._dispatcher.submit(_run_in_future, future,
+                                            worker_future.result, (), {})
+
+            def on_done(future):
+                if future.cancelled():
+                    worker_future.cancel()
+
+            worker_future.add_done_callback(on_worker_done)
+            future.add_done_callback(on_done)
+            return future
+
+    __all__.append('MainLoopExecutor')
+
+__all__.append('DispatcherStats')
+__all__.append('MainThreadDispatcher')
+__all__.append('run_in_main')
+
+class FrameTask(object):
+    """
+    A callable scheduled on a FrameScheduler.
+    """
+    __slots__ = ('callback', 'args', 'key', 'priority', 'cancelled')
+
+    def __init__(self, callback, args, key, priority):
+        self.callback = callback
+        self.args = args
+        self.key = key
+        self.priority = priority
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class FrameSchedulerStats(object):
+    """
+    The counters collected by a FrameScheduler.
+    """
+    def __init__(self):
+        self.frames = 0
+        self.tasks_run = 0
+        self.tasks_merged = 0
+        self.tasks_deferred = 0
+
+    def __repr__(self):
+        return ('<Clutter.FrameSchedulerStats frames: %d; run: %d; ' +
+                'merged: %d; deferred: %d>') % (self.frames, self.tasks_run,
+                        self.tasks_merged, self.tasks_deferred)
+
+class FrameScheduler(object):
+    """
+    Runs work right before the next frame is painted, from a pre-paint
+    repaint function, instead of on arbitrary timers. Tasks run in order of
+    priority, lower values first; a task scheduled with the key of a pending
+    one replaces its callback and arguments instead of running twice. Tasks
+    left over once @budget ms have been spent in a frame are deferred to the
+    next one.
+
+    >>> scheduler = Clutter.FrameScheduler.get_default()
+    >>> actor.connect('allocation-changed', lambda actor, box, flags:
+    ...     scheduler.schedule(resize_canvas, actor, key=actor))
+    """
+    PRIORITY_HIGH = -100
+    PRIORITY_DEFAULT = 0
+    PRIORITY_LOW = 100
+
+    _default = None
+
+    def __init__(self, budget=8.0, stage=None):
+        self.budget = budget
+        self.stage = stage
+        self.stats = FrameSchedulerStats()
+        self._heap = []
+        # the tasks of the frame being run
+        self._frame_heap = []
+        self._keys = {}
+        self._counter = 0
+        self._repaint_id = 0
+
+    @classmethod
+    def get_default(cls):
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self):
+        return sum(1 for entry in self._heap if not entry[2].cancelled)
+
+    def _raise_priority(self, task, priority):
+        task.priority = priority
+        for heap in (self._heap, self._frame_heap):
+            for i, entry in enumerate(heap):
+                if entry[2] is task:
+                    heap[i] = (priority, entry[1], task)
+                    heapq.heapify(heap)
+                    return
+
+    def schedule(self, callback, *args, **kwargs):
+        """
+        @callback: The callable to run before the next frame
+        @args: The arguments of @callback
+        @key: A hashable key; only the latest task scheduled with a key
+            runs, with the highest of the requested priorities
+        @priority: The priority of the task, PRIORITY_DEFAULT by default
+
+        Returns a FrameTask that can be cancelled; scheduling with the key
+        of a pending task returns that task.
+        """
+        key = kwargs.pop('key', None)
+        priority = kwargs.pop('priority', self.PRIORITY_DEFAULT)
+        if kwargs:
+            raise TypeError("unexpected keyword argument '%s'" % next(iter(kwargs)))
+
+        if key is not None:
+            task = self._keys.get(key)
+            if task is not None and not task.cancelled:
+                self.stats.tasks_merged += 1
+                task.callback = callback
+                task.args = args
+                if priority < task.priority:
+                    self._raise_priority(task, priority)
+                return task
+
+        task = FrameTask(callback, args, key, priority)
+        if key is not None:
+            self._keys[key] = task
+        heapq.heappush(self._heap, (priority, self._counter, task))
+        self._counter += 1
+
+        if self._repaint_id == 0:
+            self._repaint_id = Clutter.threads_add_repaint_func_full(
+                Clutter.RepaintFlags.PRE_PAINT, self._on_repaint)
+        self._queue_redraw()
+        return task
+
+    def cancel(self, key):
+        """
+        Cancels the pending task scheduled with @key, if any.
+        """
+        task = self._keys.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def _queue_redraw(self):
+        if self.stage is not None:
+            self.stage.queue_redraw()
+        else:
+            for stage in Clutter.StageManager.get_default().list_stages():
+                stage.queue_redraw()
+
+    def _on_repaint(self):
+        self.stats.frames += 1
+        # tasks scheduled while running this frame's tasks wait for the
+        # next frame
+        heap, self._heap = self._heap, []
+        self._frame_heap = heap
+        deadline = GLib.get_monotonic_time() + int(self.budget * 1000)
+        ran = False
+        while heap:
+            task = heapq.heappop(heap)[2]
+            if task.cancelled:
+                continue
+            if ran and GLib.get_monotonic_time() >= deadline:
+                heapq.heappush(heap, (task.priority, -1, task))
+                self.stats.tasks_deferred += sum(1 for entry in heap
+                                                 if not entry[2].cancelled)
+                break
+            task.cancelled = True
+            if task.key is not None and self._keys.get(task.key) is task:
+                del self._keys[task.key]
+            # an exception would make PyGObject drop this repaint function
+            # with _repaint_id still set, and lose the rest of the frame
+            try:
+                task.callback(*task.args)
+            except Exception:
+                _report_exception()
+            self.stats.tasks_run += 1
+            ran = True
+
+        self._frame_heap = []
+        for entry in heap:
+            heapq.heappush(self._heap, entry)
+        if not self._heap:
+            self._repaint_id = 0
+            return False
+        self._queue_redraw()
+        return True
+
+__all__.append('FrameTask')
+__all__.append('FrameSchedulerStats')
+__all__.append('FrameScheduler')
+
+def _set_meta_properties(meta, properties):
+    # pspecs and converters are cached per child meta class, and the
+    # notifications are emitted once all the properties are set
+    meta.freeze_notify()
+    try:
+        for name, value in properties.items():
+            pspec, convert = _lookup_property(meta, name)
+            meta.set_property(pspec.name, convert(value))
+    finally:
+        meta.thaw_notify()
+
+def _get_meta_properties(meta, names):
+    values = []
+    for name in names:
+        pspec, convert = _lookup_property(meta, name)
+        values.append(meta.get_property(pspec.name))
+    return tuple(values)
+
+def _layout_child_set_properties(layout_manager, container, child, properties):
+    _set_meta_properties(layout_manager.get_child_meta(container, child),
+                         properties)
+
+class ChildrenView(object):
+    """
+    A live, read-only sequence over the children of a container.
+
+    The length and membership tests map directly to get_n_children() and
+    get_parent(), and indexing to get_child_at_index(), so no list of the
+    children is built for them. Iteration and slicing walk
+    get_next_sibling() into a snapshot list. Nothing is cached, so the view
+    always reflects the current order of the children, however they were
+    reordered.
+    """
+    __slots__ = ('_container',)
+
+    def __init__(self, container):
+        self._container = container
+
+    def _get_children(self):
+        children = []
+        child = self._container.get_first_child()
+        while child is not None:
+            children.append(child)
+            child = child.get_next_sibling()
+        return children
+
+    def __repr__(self):
+        return '<Clutter.ChildrenView of %r; %d children>' % (
+            self._container, len(self))
+
+    def __len__(self):
+        return self._container.get_n_children()
+
+    def __bool__(self):
+        return self._container.get_n_children() > 0
+
     # alias for Python 2.x object protocol
     __nonzero__ = __bool__
 
     def __contains__(self, actor):
-        return actor in self.get_children()
+        if not isinstance(actor, Clutter.Actor):
+            return False
+        return actor.get_parent() == self._container
 
     def __iter__(self):
-        return iter(self.get_children())
+        return iter(self._get_children())
+
+    def __reversed__(self):
+        children = []
+        child = self._container.get_last_child()
+        while child is not None:
+            children.append(child)
+            child = child.get_previous_sibling()
+        return iter(children)
 
     def __getitem__(self, key):
-        children = self.get_children()
-        n_children = len(children)
         if isinstance(key, int):
-            if key < 0:
-                key += n_children
-            if key < 0 or key >= n_children:
+            container = self._container
+            if key == 0:
+                child = container.get_first_child()
+            elif key == -1:
+                child = container.get_last_child()
+            else:
+                n_children = container.get_n_children()
+                if key < 0:
+                    key += n_children
+                if key < 0 or key >= n_children:
+                    raise IndexError("index out of range: %d" % key)
+                child = container.get_child_at_index(key)
+            if child is None:
                 raise IndexError("index out of range: %d" % key)
-            return children[key]
+            return child
         elif isinstance(key, slice):
-            start, stop, step = key.indices(n_children)
-            ret = []
-            for i in range(start, stop, step):
-                ret.append(children[i])
-            return ret
+            return self._get_children()[key]
         else:
             raise TypeError("indices must be integer or slice")
 
+    def index(self, actor):
+        """
+        Returns the position of @actor among the children.
+        """
+        if actor not in self:
+            raise ValueError("%r is not a child of %r" % (actor, self._container))
+        position = 0
+        sibling = actor.get_previous_sibling()
+        while sibling is not None:
+            position += 1
+            sibling = sibling.get_previous_sibling()
+        return position
+
+__all__.append('ChildrenView')
+
+@giclassoverride
+class Container(Clutter.Container):
+    @property
+    def children(self):
+        """
+        A live ChildrenView over the children of this container.
+        """
+        return ChildrenView(self)
+
+    def __len__(self):
+        return self.get_n_children()
+
+    def __bool__(self):
+        return True
+
+    # alias for Python 2.x object protocol
+    __nonzero__ = __bool__
+
+    def __contains__(self, actor):
+        return actor in ChildrenView(self)
+
+    def __iter__(self):
+        return iter(ChildrenView(self))
+
+    def __getitem__(self, key):
+        return ChildrenView(self)[key]
+
     def __setitem__(self, key, value):
-        children = self.get_children()
-        n_children = len(children)
         if isinstance(key, int):
-            if key < 0:
-                key += n_children
-            if key >= n_children:
-                raise IndexError("index out of range: %d" % key)
-            old = children[key]
-            if key < n_children:
-                silbing = children[key + 1]
-            else:
-                silbing = None
-            self.remove(old)
-            self.add(value)
-            if silbing:
-                self.lower_child(value, silbing)
+            old = ChildrenView(self)[key]
+            self.replace_child(old, value)
         else:
             raise TypeError("indices must be integer")
 
+    @contextmanager
+    def _bulk_update(self):
+        # Clutter already coalesces the relayouts queued by each child; what
+        # is left is the notifications, which only need to run once at the
+        # end
+        self.freeze_notify()
+        try:
+            yield
+        finally:
+            self.thaw_notify()
+
     def add(self, *actors):
-        for actor in actors:
-            Clutter.Container.add_actor(self, actor)
+        with self._bulk_update():
+            for actor in actors:
+                Clutter.Container.add_actor(self, actor)
 
     def remove(self, *actors):
-        for actor in actors:
-            Clutter.Container.remove_actor(self, actor)
+        with self._bulk_update():
+            for actor in actors:
+                Clutter.Container.remove_actor(self, actor)
+
+    def insert_children(self, children, index=-1, **child_properties):
+        """
+        @children: A sequence of actors or of (actor, properties) pairs
+        @index: The position of the first inserted actor, or -1 to append
+        @child_properties: Layout properties set on every inserted actor
+
+        The insert_children() method adds many actors at once, setting
+        their layout manager child properties while notifications on the
+        container are frozen.
+
+        >>> box.insert_children([(label, {'expand': True}), icon], 0,
+        ...                     x_align=Clutter.BoxAlignment.START)
+        """
+        layout_manager = self.get_layout_manager()
+        with self._bulk_update():
+            for child in children:
+                if isinstance(child, tuple):
+                    child, properties = child
+                    properties = dict(child_properties, **properties)
+                else:
+                    properties = child_properties
+                if index < 0:
+                    self.add_child(child)
+                else:
+                    self.insert_child_at_index(child, index)
+                    index += 1
+                if layout_manager and properties:
+                    _layout_child_set_properties(layout_manager, self, child,
+                                                 properties)
 
     def child_get_property(self, child, property_name):
         meta = self.get_child_meta(child)
@@ -827,6 +3584,1043 @@ class Container(Clutter.Container):
         meta = self.get_child_meta(child)
         meta.set_property(property_name, value)
 
+    def child_set_properties(self, child, **properties):
+        """
+        @child: A child of this container
+        @properties: The child properties to set
+
+        The child_set_properties() method sets many child properties of
+        @child, looking its Clutter.ChildMeta up once and notifying the
+        changes once they are all set.
+
+        >>> container.child_set_properties(child, expand=True, x_fill=True)
+        """
+        _set_meta_properties(self.get_child_meta(child), properties)
+
+    def child_get_properties(self, child, *names):
+        """
+        Returns a tuple with the values of the child properties @names of
+        @child.
+        """
+        return _get_meta_properties(self.get_child_meta(child), names)
+
+    def children_set_properties(self, children, **properties):
+        """
+        @children: A sequence of children of this container
+        @properties: The child properties to set on each of them
+
+        The bulk form of child_set_properties().
+        """
+        with self._bulk_update():
+            for child in children:
+                _set_meta_properties(self.get_child_meta(child), properties)
+
+class IncrementalBuilder(object):
+    """
+    Runs the steps of a scene construction across frames, spending at most
+    @budget ms per frame, so that building a large actor tree does not block
+    the main loop.
+
+    @steps is an iterable, typically a generator; each step is an actor to
+    add to @parent, an (actor, child properties) pair, or None for a step
+    that only does some work. The actors built during a frame are added to
+    @parent at once with Container.insert_children(). Slices run as tasks of
+    @scheduler, by default FrameScheduler.get_default().
+
+    >>> def build_catalogue():
+    ...     for product in products:
+    ...         yield ProductTile(product)
+    >>> builder = Clutter.IncrementalBuilder(grid, build_catalogue(),
+    ...                                      total=len(products),
+    ...                                      on_completed=on_catalogue_shown)
+    >>> builder.start()
+    """
+    def __init__(self, parent, steps, total=None, budget=4.0, scheduler=None,
+                 on_progress=None, on_completed=None):
+        if total is None and hasattr(steps, '__len__'):
+            total = len(steps)
+        if scheduler is None:
+            scheduler = FrameScheduler.get_default()
+        self.parent = parent
+        self.total = total
+        self.steps_run = 0
+        self.built = 0
+        self.budget = budget
+        self._steps = iter(steps)
+        self._scheduler = scheduler
+        self._task = None
+        self._complete = False
+        self._on_progress = on_progress
+        self._on_completed = on_completed
+        self._model = None
+
+    @classmethod
+    def from_model(cls, parent, model, create_func, **kwargs):
+        """
+        @parent: The actor receiving one child per item of @model
+        @model: A Gio.ListModel
+        @create_func: A callable returning the actor for an item
+
+        Creates a builder doing the same as Clutter.Actor.bind_model(),
+        across frames. Items added or removed before the builder completes
+        are taken into account, and items added later, even among the ones
+        already built, are built incrementally as well; like with
+        bind_model(), @parent should have no other children.
+        """
+        builder = cls(parent, (), total=model.get_n_items(), **kwargs)
+        builder._model = model
+        builder._create_func = create_func
+        builder._model_position = 0
+        # positions of items inserted among the built ones, waiting for a
+        # slice to build them
+        builder._model_pending = []
+        builder._steps = builder._iter_model()
+        builder._model_handler = model.connect('items-changed',
+                                               builder._on_items_changed)
+        return builder
+
+    def _iter_model(self):
+        while True:
+            if self._model_pending:
+                # the lowest pending position is also the child index, since
+                # every built item before it has its actor
+                position = self._model_pending.pop(0)
+                child = self._create_func(self._model.get_item(position))
+                self.parent.insert_child_at_index(child, position)
+                self.built += 1
+                yield None
+            elif self._model_position < self._model.get_n_items():
+                item = self._model.get_item(self._model_position)
+                self._model_position += 1
+                yield self._create_func(item)
+            else:
+                return
+
+    def _on_items_changed(self, model, position, removed, added):
+        self.total = model.get_n_items()
+        if position < self._model_position:
+            n_built_removed = min(removed, self._model_position - position)
+            pending = self._model_pending
+            children = []
+            for i in range(position, position + n_built_removed):
+                index = bisect.bisect_left(pending, i)
+                if index == len(pending) or pending[index] != i:
+                    children.append(self.parent.get_child_at_index(i - index))
+            for child in children:
+                child.destroy()
+            self.steps_run -= len(children)
+            self.built -= len(children)
+
+            end = position + n_built_removed
+            shift = added - n_built_removed
+            self._model_pending = ([i for i in pending if i < position] +
+                                   list(range(position, position + added)) +
+                                   [i + shift for i in pending if i >= end])
+            self._model_position += shift
+
+        if self._complete and (self._model_pending or
+                               self._model_position < self.total):
+            self._complete = False
+            self._steps = self._iter_model()
+            self.start()
+
+    @property
+    def progress(self):
+        """
+        The fraction of the steps run so far, or None if the number of
+        steps is not known.
+        """
+        if self._complete:
+            return 1.0
+        if not self.total:
+            return None
+        return min(float(self.steps_run) / self.total, 1.0)
+
+    def is_complete(self):
+        return self._complete
+
+    def start(self):
+        """
+        Schedules the next slice of steps, unless the builder completed.
+        """
+        if not self._complete and self._task is None:
+            self._task = self._scheduler.schedule(self._run_slice)
+
+    def cancel(self):
+        """
+        Stops running steps; the actors already added are kept.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._model is not None:
+            self._model.disconnect(self._model_handler)
+            self._model = None
+
+    def finish(self):
+        """
+        Runs every remaining step now.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if not self._complete:
+            self._run_slice(unlimited=True)
+
+    def _run_slice(self, unlimited=False):
+        self._task = None
+        deadline = GLib.get_monotonic_time() + int(self.budget * 1000)
+
+        batch = []
+        complete = False
+        try:
+            while True:
+                try:
+                    step = next(self._steps)
+                except StopIteration:
+                    complete = True
+                    break
+                self.steps_run += 1
+                if step is not None:
+                    batch.append(step)
+                if not unlimited and GLib.get_monotonic_time() >= deadline:
+                    break
+        finally:
+            # the actors built before a step raised are still added
+            if batch:
+                if self.parent is not None:
+                    self.parent.insert_children(batch)
+                self.built += len(batch)
+        if self._on_progress is not None:
+            self._on_progress(self)
+
+        if complete:
+            self._complete = True
+            if self._on_completed is not None:
+                self._on_completed(self)
+        else:
+            self.start()
+
+__all__.append('IncrementalBuilder')
+
+class VirtualList(object):
+    """
+    A vertically scrolling list or grid over a Gio.ListModel that only
+    creates actors for the rows visible in @scroll, plus @overscan rows on
+    each side. Views of the rows scrolled away are recycled for the rows
+    scrolled into view, and items-changed only touches the affected views.
+
+    Items have a fixed @item_height and are laid out in @columns columns
+    of @item_width, by default the width of @scroll divided by @columns.
+    @create_func is called with an item and returns a view for it; with a
+    @bind_func, called with a recycled view and its new item, views are
+    pooled instead of being destroyed.
+
+    >>> scroll = Clutter.ScrollActor(scroll_mode=Clutter.ScrollMode.VERTICALLY)
+    >>> view = Clutter.VirtualList(scroll, store, create_row, bind_row,
+    ...                            item_height=48)
+    >>> scroll.scroll_to_point(Clutter.Point.alloc().init(0, 4800))
+    """
+    def __init__(self, scroll, model, create_func, bind_func=None,
+                 item_height=32.0, columns=1, item_width=None, overscan=2,
+                 scheduler=None):
+        if item_height <= 0:
+            raise ValueError('item_height must be positive')
+        if columns < 1:
+            raise ValueError('columns must be at least 1')
+        if scheduler is None:
+            scheduler = FrameScheduler.get_default()
+        self.scroll = scroll
+        self.model = model
+        self.item_height = float(item_height)
+        self.columns = columns
+        self.item_width = item_width
+        self.overscan = overscan
+        self.n_created = 0
+        self._create_func = create_func
+        self._bind_func = bind_func
+        self._scheduler = scheduler
+        self._views = {}
+        self._pool = []
+        self._placed_width = None
+
+        self.actor = Clutter.Actor()
+        scroll.add_child(self.actor)
+        self._handlers = [
+            (scroll, scroll.connect('notify::child-transform', self._queue_update)),
+            (scroll, scroll.connect('allocation-changed', self._queue_update)),
+            (model, model.connect('items-changed', self._on_items_changed)),
+        ]
+        self._queue_update()
+
+    def __len__(self):
+        return self.model.get_n_items()
+
+    @property
+    def n_materialized(self):
+        return len(self._views)
+
+    @property
+    def n_pooled(self):
+        return len(self._pool)
+
+    def get_view(self, index):
+        """
+        Returns the view of the item at @index, or None if that item is
+        not materialized.
+        """
+        return self._views.get(index)
+
+    def _get_viewport(self):
+        matrix = self.scroll.get_child_transform()
+        offset = -matrix.yw if matrix is not None else 0.0
+        return offset, self.scroll.get_height()
+
+    def _get_item_width(self):
+        if self.item_width is not None:
+            return self.item_width
+        return self.scroll.get_width() / self.columns
+
+    def _queue_update(self, *args):
+        self._scheduler.schedule(self.update, key=self)
+
+    def _place(self, view, index):
+        row, column = divmod(index, self.columns)
+        view.set_position(column * self._get_item_width(),
+                          row * self.item_height)
+
+    def _release(self, view):
+        if self._bind_func is not None:
+            view.hide()
+            self._pool.append(view)
+        else:
+            view.destroy()
+
+    def _acquire(self, index):
+        item = self.model.get_item(index)
+        if self._pool:
+            view = self._pool.pop()
+            self._bind_func(view, item)
+            view.show()
+        else:
+            view = self._create_func(item)
+            self.actor.add_child(view)
+            self.n_created += 1
+        self._place(view, index)
+        return view
+
+    def update(self):
+        """
+        Materializes the rows visible in the viewport now, instead of right
+        before the next frame.
+        """
+        n_items = self.model.get_n_items()
+        n_rows = (n_items + self.columns - 1) // self.columns
+        item_width = self._get_item_width()
+        self.actor.set_size(item_width * self.columns,
+                            n_rows * self.item_height)
+        if item_width != self._placed_width:
+            # the views placed before an allocation, or before a resize of
+            # @scroll, are in the wrong columns
+            self._placed_width = item_width
+            if self.columns > 1:
+                for index, view in self._views.items():
+                    self._place(view, index)
+
+        offset, height = self._get_viewport()
+        first_row = max(int(offset // self.item_height) - self.overscan, 0)
+        last_row = int((offset + height) // self.item_height) + self.overscan
+        start = min(first_row * self.columns, n_items)
+        end = min((last_row + 1) * self.columns, n_items)
+
+        for index in [i for i in self._views if i < start or i >= end]:
+            self._release(self._views.pop(index))
+        for index in range(start, end):
+            if index not in self._views:
+                self._views[index] = self._acquire(index)
+
+    def _on_items_changed(self, model, position, removed, added):
+        shift = added - removed
+        views = {}
+        for index, view in self._views.items():
+            if index < position:
+                views[index] = view
+            elif index < position + removed:
+                self._release(view)
+            else:
+                views[index + shift] = view
+                if shift:
+                    self._place(view, index + shift)
+        self._views = views
+        self._queue_update()
+
+    def destroy(self):
+        """
+        Disconnects from @scroll and the model and destroys every view.
+        """
+        for obj, handler_id in self._handlers:
+            obj.disconnect(handler_id)
+        self._handlers = []
+        self._scheduler.cancel(self)
+        self._views = {}
+        self._pool = []
+        self.actor.destroy()
+
+__all__.append('VirtualList')
+
+class ActorPool(object):
+    """
+    Recycles actors of the same class and construction properties, to save
+    the cost of constructing GObjects and their Python wrappers in views
+    creating and destroying many actors.
+
+    Released actors are removed from their parent and reset: transitions,
+    including the ones of the default EasingEngine, constraints, actions,
+    effects, the signal handlers connected with ActorPool.connect() and the
+    animation set up by Actor.animate() are removed, and the construction
+    properties are set again. Children, other signal handlers and other
+    properties are left as they are; use @reset_func, called with each
+    released actor, to reset those.
+
+    >>> pool = Clutter.ActorPool()
+    >>> pool.prewarm(Clutter.Text, 50, font_name='Sans 12px')
+    >>> label = pool.acquire(Clutter.Text, font_name='Sans 12px')
+    >>> ...
+    >>> pool.release(label)
+    """
+    def __init__(self, max_free=256, reset_func=None):
+        self.max_free = max_free
+        self.hits = 0
+        self.misses = 0
+        self._reset_func = reset_func
+        self._free = {}
+        self._keys = {}
+        self._handlers = {}
+        self._prewarm_id = 0
+        self._prewarm_queue = collections.deque()
+
+    @staticmethod
+    def _make_key(actor_type, properties):
+        return (actor_type, tuple(sorted(properties.items())))
+
+    @property
+    def hit_rate(self):
+        requests = self.hits + self.misses
+        if requests == 0:
+            return 0.0
+        return float(self.hits) / requests
+
+    @property
+    def n_live(self):
+        """
+        The number of acquired actors not released yet.
+        """
+        return len(self._keys)
+
+    @property
+    def n_free(self):
+        return sum(len(free) for free in self._free.values())
+
+    def __repr__(self):
+        return '<Clutter.ActorPool live: %d; free: %d; hit rate: %.2f>' % (
+                self.n_live, self.n_free, self.hit_rate)
+
+    def acquire(self, actor_type, **properties):
+        """
+        @actor_type: A Clutter.Actor subclass
+        @properties: The construction properties, with hashable values
+
+        Returns a pooled actor created with @properties, or a new one.
+        """
+        key = self._make_key(actor_type, properties)
+        free = self._free.get(key)
+        if free:
+            actor = free.pop()
+            self.hits += 1
+        else:
+            actor = actor_type(**properties)
+            self.misses += 1
+        self._keys[actor] = key
+        return actor
+
+    def connect(self, actor, signal_name, handler, *args):
+        """
+        @actor: An actor acquired from the pool
+        @signal_name: The name of a signal of @actor
+        @handler: The signal handler
+        @args: Extra arguments of @handler
+
+        Connects @handler to a signal of @actor until @actor is released.
+        Returns the handler id.
+        """
+        handler_id = actor.connect(signal_name, handler, *args)
+        self._handlers.setdefault(actor, []).append(handler_id)
+        return handler_id
+
+    def release(self, actor):
+        """
+        Resets @actor and returns it to the pool. Actors beyond @max_free
+        for their key are destroyed instead.
+        """
+        key = self._keys.pop(actor)
+        self._reset(actor, key)
+        free = self._free.setdefault(key, [])
+        if len(free) < self.max_free:
+            free.append(actor)
+        else:
+            actor.destroy()
+
+    def _reset(self, actor, key):
+        parent = actor.get_parent()
+        if parent is not None:
+            parent.remove_child(actor)
+
+        animation = actor.__dict__.pop('_animation', None)
+        if animation is not None:
+            GObject.signal_handlers_destroy(animation)
+            animation.get_timeline().stop()
+
+        engine = EasingEngine._default
+        if engine is not None:
+            engine.cancel(actor)
+
+        if clutter_version >= (1, 10, 0):
+            actor.remove_all_transitions()
+        actor.clear_constraints()
+        actor.clear_actions()
+        actor.clear_effects()
+        for handler_id in self._handlers.pop(actor, ()):
+            actor.disconnect(handler_id)
+
+        actor_type, properties = key
+        if properties:
+            actor.set_properties(**dict(properties))
+        if self._reset_func is not None:
+            self._reset_func(actor)
+
+    def prewarm(self, actor_type, count, budget=2.0, **properties):
+        """
+        @actor_type: A Clutter.Actor subclass
+        @count: The number of free actors wanted for this key
+        @budget: The time spent creating actors per idle callback, in ms
+        @properties: The construction properties
+
+        Creates actors in idle callbacks until @count of them are free for
+        the key of @actor_type and @properties.
+        """
+        key = self._make_key(actor_type, properties)
+        self._prewarm_queue.append((key, min(count, self.max_free)))
+        if self._prewarm_id == 0:
+            self._prewarm_id = GLib.idle_add(self._on_prewarm, budget,
+                                             priority=GLib.PRIORITY_LOW)
+
+    def _on_prewarm(self, budget):
+        deadline = GLib.get_monotonic_time() + int(budget * 1000)
+        while self._prewarm_queue:
+            key, count = self._prewarm_queue[0]
+            free = self._free.setdefault(key, [])
+            if len(free) >= count:
+                self._prewarm_queue.popleft()
+                continue
+            actor_type, properties = key
+            free.append(actor_type(**dict(properties)))
+            if GLib.get_monotonic_time() >= deadline:
+                return True
+        self._prewarm_id = 0
+        return False
+
+    def clear(self):
+        """
+        Destroys every free actor and stops pre-warming.
+        """
+        if self._prewarm_id:
+            GLib.source_remove(self._prewarm_id)
+            self._prewarm_id = 0
+        self._prewarm_queue.clear()
+        for free in self._free.values():
+            for actor in free:
+                actor.destroy()
+        self._free = {}
+
+__all__.append('ActorPool')
+
+class Element(collections.namedtuple('Element',
+                                     'actor_type props children key')):
+    """
+    The description of an actor rendered by a Reconciler: its class, the
+    properties set on it, the elements of its children and an optional
+    key identifying it among its siblings. Children without a key are
+    matched by position among the unkeyed siblings of the same class.
+
+    >>> Clutter.Element(Clutter.Text, {'text': item.title}, key=item.id)
+
+    Dictionaries with 'type', 'props', 'children' and 'key' items are
+    accepted wherever an Element is.
+    """
+    __slots__ = ()
+
+    def __new__(cls, actor_type, props=None, children=(), key=None):
+        return super(Element, cls).__new__(cls, actor_type, props or {},
+                                           tuple(children), key)
+
+    @classmethod
+    def from_dict(cls, spec):
+        if isinstance(spec, Element):
+            return spec
+        return cls(spec['type'], spec.get('props'),
+                   spec.get('children', ()), spec.get('key'))
+
+class ReconcileStats(object):
+    """
+    The mutations applied by Reconciler.render().
+    """
+    def __init__(self):
+        self.created = 0
+        self.removed = 0
+        self.moved = 0
+        self.properties_set = 0
+
+    @property
+    def mutations(self):
+        return self.created + self.removed + self.moved + self.properties_set
+
+    def __repr__(self):
+        return ('<Clutter.ReconcileStats created: %d; removed: %d; ' +
+                'moved: %d; properties set: %d>') % (self.created,
+                        self.removed, self.moved, self.properties_set)
+
+def _longest_increasing_subsequence(values):
+    # indices into @values of one longest strictly increasing subsequence
+    tails = []
+    tail_indices = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        pos = bisect.bisect_left(tails, value)
+        if pos > 0:
+            previous[i] = tail_indices[pos - 1]
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+    result = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i >= 0:
+        result.add(i)
+        i = previous[i]
+    return result
+
+# the flags to unset once properties of Clutter.Actor are reset to their
+# default value, since setting them also sets a *-set property
+_RESET_FLAGS = {
+    'x': ('fixed-position-set',),
+    'y': ('fixed-position-set',),
+    'position': ('fixed-position-set',),
+    'width': ('min-width-set', 'natural-width-set'),
+    'min-width': ('min-width-set',),
+    'natural-width': ('natural-width-set',),
+    'height': ('min-height-set', 'natural-height-set'),
+    'min-height': ('min-height-set',),
+    'natural-height': ('natural-height-set',),
+    'size': ('min-width-set', 'natural-width-set',
+             'min-height-set', 'natural-height-set'),
+}
+
+class Reconciler(object):
+    """
+    Keeps the children of @root in sync with a tree of Element, applying
+    only the property changes, insertions, moves and removals needed to go
+    from the previously rendered tree to the new one, inside a single
+    Actor.batch_update() of @root.
+
+    Properties are compared with the values rendered last, not with the
+    live values of the actors; a property dropped from an element is reset
+    to its default value, and a dropped position or size request is unset.
+    Children of @root not created by the reconciler are left alone, and
+    rendered actors destroyed elsewhere are created again by the next
+    render().
+
+    >>> reconciler = Clutter.Reconciler(stage)
+    >>> stats = reconciler.render([
+    ...     Clutter.Element(Clutter.Text, {'text': item.title}, key=item.id)
+    ...     for item in items])
+    """
+    def __init__(self, root):
+        self.root = root
+        self._rendered = {}
+        self._children = {}
+        self._destroy_handlers = {}
+
+    def render(self, elements):
+        """
+        @elements: A sequence of Element, or a single one, for the
+            children of @root
+
+        Returns a ReconcileStats with the mutations applied.
+        """
+        if isinstance(elements, (Element, dict)):
+            elements = [elements]
+        stats = ReconcileStats()
+        with self.root.batch_update():
+            self._reconcile_children(self.root, elements, stats)
+        return stats
+
+    @staticmethod
+    def _set_properties(actor, old_props, props):
+        # returns the number of properties set
+        n_set = 0
+        flags = set()
+        actor.freeze_notify()
+        try:
+            for name in old_props:
+                if name in props:
+                    continue
+                pspec, convert = _lookup_property(actor, name)
+                actor.set_property(pspec.name, pspec.default_value)
+                flags.update(_RESET_FLAGS.get(pspec.name, ()))
+                n_set += 1
+            for flag in flags:
+                actor.set_property(flag, False)
+                n_set += 1
+            for name, value in props.items():
+                pspec, convert = _lookup_property(actor, name)
+                if name in old_props and old_props[name] == value and \
+                        flags.isdisjoint(_RESET_FLAGS.get(pspec.name, ())):
+                    continue
+                actor.set_property(pspec.name, convert(value))
+                n_set += 1
+        finally:
+            actor.thaw_notify()
+        return n_set
+
+    def _create(self, parent, element, stats):
+        actor = element.actor_type()
+        self._set_properties(actor, {}, element.props)
+        stats.created += 1
+        self._rendered[actor] = element
+        self._destroy_handlers[actor] = actor.connect('destroy',
+                                                      self._on_actor_destroy,
+                                                      parent)
+        if element.children:
+            self._reconcile_children(actor, element.children, stats)
+        return actor
+
+    def _update(self, actor, element, stats):
+        stats.properties_set += self._set_properties(
+            actor, self._rendered[actor].props, element.props)
+        self._rendered[actor] = element
+        self._reconcile_children(actor, element.children, stats)
+
+    def _on_actor_destroy(self, actor, parent):
+        self._forget(actor)
+        siblings = self._children.get(parent)
+        if siblings is not None and actor in siblings:
+            siblings.remove(actor)
+            if not siblings:
+                del self._children[parent]
+
+    def _forget(self, actor):
+        self._rendered.pop(actor, None)
+        handler_id = self._destroy_handlers.pop(actor, 0)
+        if handler_id:
+            actor.disconnect(handler_id)
+        for child in self._children.pop(actor, ()):
+            self._forget(child)
+
+    @staticmethod
+    def _get_keys(elements):
+        keys = []
+        positions = {}
+        for element in elements:
+            if element.key is not None:
+                key = ('key', element.key)
+            else:
+                position = positions.get(element.actor_type, 0)
+                positions[element.actor_type] = position + 1
+                key = ('position', element.actor_type, position)
+            keys.append(key)
+        if len(set(keys)) != len(keys):
+            raise ValueError('duplicate keys among siblings')
+        return keys
+
+    def _reconcile_children(self, parent, elements, stats):
+        elements = [Element.from_dict(element) for element in elements
+                    if element is not None]
+        old_actors = self._children.get(parent, [])
+        old_keys = self._get_keys([self._rendered[actor] for actor in old_actors])
+        old_by_key = dict(zip(old_keys, range(len(old_actors))))
+
+        actors = []
+        old_indices = []
+        for key, element in zip(self._get_keys(elements), elements):
+            index = old_by_key.get(key)
+            if index is not None and \
+                    self._rendered[old_actors[index]].actor_type is element.actor_type:
+                del old_by_key[key]
+                actor = old_actors[index]
+                self._update(actor, element, stats)
+            else:
+                index = -1
+                actor = self._create(parent, element, stats)
+            actors.append(actor)
+            old_indices.append(index)
+
+        for index in old_by_key.values():
+            actor = old_actors[index]
+            self._forget(actor)
+            actor.destroy()
+            stats.removed += 1
+
+        if actors:
+            self._children[parent] = actors
+        else:
+            self._children.pop(parent, None)
+
+        if not old_actors:
+            parent.insert_children(actors)
+            return
+
+        # actors forming the longest run already in order stay in place;
+        # every other actor is placed right below its next sibling, from
+        # the last one to the first
+        kept = [i for i, index in enumerate(old_indices) if index >= 0]
+        stable = set(kept[i] for i in _longest_increasing_subsequence(
+                         [old_indices[i] for i in kept]))
+        sibling = None
+        for i in range(len(actors) - 1, -1, -1):
+            actor = actors[i]
+            if old_indices[i] < 0:
+                if sibling is None:
+                    parent.add_child(actor)
+                else:
+                    parent.insert_child_below(actor, sibling)
+            elif i not in stable:
+                if sibling is None:
+                    parent.set_child_above_sibling(actor, None)
+                else:
+                    parent.set_child_below_sibling(actor, sibling)
+                stats.moved += 1
+            sibling = actor
+
+__all__.append('Element')
+__all__.append('ReconcileStats')
+__all__.append('Reconciler')
+
+class ActorIndex(object):
+    """
+    A uniform grid over the stage-space extents of a set of actors, used to
+    answer picking queries from Python without walking every actor.
+
+    Extents are taken from Clutter.Actor.get_transformed_extents() unless
+    they are passed explicitly as a Clutter.Rect or Clutter.ActorBox. An
+    actor whose allocation changes is marked as stale and its extents are
+    refreshed lazily by the next query; changes to the allocation of an
+    ancestor are not tracked, so call update() on the affected actors.
+
+    When several actors match a point, those added last are assumed to be
+    on top, matching the default paint order of Clutter.Actor.add_child().
+    Like Clutter.ActorBox.contains(), points on the edges of an actor are
+    not inside it.
+
+    >>> index = Clutter.ActorIndex(cell_size=64)
+    >>> index.add(*grid)
+    >>> actor = index.pick(event.x, event.y)
+    """
+    def __init__(self, cell_size=64.0):
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self._cell_size = float(cell_size)
+        self._extents = {}
+        self._cells = {}
+        self._serials = {}
+        self._handlers = {}
+        self._stale = set()
+        self._next_serial = 0
+
+    def __len__(self):
+        return len(self._extents)
+
+    def __contains__(self, actor):
+        return actor in self._extents
+
+    def __iter__(self):
+        return iter(list(self._extents))
+
+    def _cell_range(self, x1, y1, x2, y2):
+        size = self._cell_size
+        return (int(x1 // size), int(y1 // size),
+                int(x2 // size), int(y2 // size))
+
+    def _insert(self, actor, extents):
+        self._extents[actor] = extents
+        cx1, cy1, cx2, cy2 = self._cell_range(*extents)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self._cells.setdefault((cx, cy), set()).add(actor)
+
+    def _discard(self, actor):
+        extents = self._extents.pop(actor, None)
+        if extents is None:
+            return
+        cx1, cy1, cx2, cy2 = self._cell_range(*extents)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(actor)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def _get_extents(self, actor, box=None):
+        if box is None:
+            if clutter_version >= (1, 16, 0):
+                x, y, width, height = actor.get_transformed_extents()
+            else:
+                x, y = actor.get_transformed_position()
+                width, height = actor.get_transformed_size()
+            return (x, y, x + width, y + height)
+        elif isinstance(box, Clutter.ActorBox):
+            return tuple(box)
+        else:
+            x, y, width, height = box
+            return (x, y, x + width, y + height)
+
+    def _on_allocation_changed(self, actor, box, flags):
+        self._stale.add(actor)
+
+    def _on_destroy(self, actor):
+        self.remove(actor)
+
+    def _refresh(self):
+        if not self._stale:
+            return
+        stale = self._stale
+        self._stale = set()
+        for actor in stale:
+            if actor in self._extents:
+                self._discard(actor)
+                self._insert(actor, self._get_extents(actor))
+
+    def add(self, *actors):
+        """
+        Adds @actors to the index, using their current transformed extents.
+        """
+        for actor in actors:
+            self.update(actor)
+
+    def update(self, actor, box=None):
+        """
+        Inserts @actor or refreshes its extents. @box is an optional
+        Clutter.Rect or Clutter.ActorBox in stage coordinates; if it is
+        given, the extents are no longer refreshed on allocation changes.
+        Destroyed actors are removed from the index in either case.
+        """
+        if actor not in self._serials:
+            self._serials[actor] = self._next_serial
+            self._next_serial += 1
+        handlers = self._handlers.get(actor)
+        if handlers is None:
+            handlers = self._handlers[actor] = [
+                actor.connect('destroy', self._on_destroy), 0]
+        if box is None and handlers[1] == 0:
+            handlers[1] = actor.connect('allocation-changed',
+                                        self._on_allocation_changed)
+        elif box is not None and handlers[1] != 0:
+            actor.disconnect(handlers[1])
+            handlers[1] = 0
+        self._stale.discard(actor)
+        self._discard(actor)
+        self._insert(actor, self._get_extents(actor, box))
+
+    def _disconnect(self, actor):
+        handlers = self._handlers.pop(actor, None)
+        if handlers is not None:
+            for handler_id in handlers:
+                if handler_id != 0:
+                    actor.disconnect(handler_id)
+
+    def remove(self, *actors):
+        for actor in actors:
+            self._disconnect(actor)
+            self._discard(actor)
+            self._stale.discard(actor)
+            self._serials.pop(actor, None)
+
+    def clear(self):
+        self.remove(*list(self._serials))
+
+    def _sorted(self, actors):
+        serials = self._serials
+        return sorted(actors, key=lambda a: serials[a], reverse=True)
+
+    def _at_point(self, x, y):
+        size = self._cell_size
+        cell = self._cells.get((int(x // size), int(y // size)))
+        if not cell:
+            return ()
+        extents = self._extents
+        return [actor for actor in cell
+                if extents[actor][0] < x < extents[actor][2] and
+                   extents[actor][1] < y < extents[actor][3]]
+
+    def query_point(self, x, y):
+        """
+        Returns the actors containing the stage point (@x, @y), topmost
+        first.
+        """
+        self._refresh()
+        return self._sorted(self._at_point(x, y))
+
+    def query_rect(self, rect):
+        """
+        Returns the actors overlapping @rect, a Clutter.Rect or
+        Clutter.ActorBox in stage coordinates, topmost first.
+        """
+        self._refresh()
+        x1, y1, x2, y2 = self._get_extents(None, rect)
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        found = set()
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        extents = self._extents
+        return self._sorted([actor for actor in found
+                             if extents[actor][0] < x2 and extents[actor][2] > x1 and
+                                extents[actor][1] < y2 and extents[actor][3] > y1])
+
+    def pick(self, x, y):
+        """
+        Returns the topmost actor containing the stage point (@x, @y), or
+        None.
+        """
+        self._refresh()
+        actors = self._at_point(x, y)
+        if not actors:
+            return None
+        serials = self._serials
+        return max(actors, key=lambda a: serials[a])
+
+    def pick_many(self, points):
+        """
+        Returns the topmost actor, or None, for each (x, y) pair in
+        @points.
+        """
+        self._refresh()
+        serials = self._serials
+        ret = []
+        for x, y in points:
+            actors = self._at_point(x, y)
+            if actors:
+                ret.append(max(actors, key=lambda a: serials[a]))
+            else:
+                ret.append(None)
+        return ret
+
+__all__.append('ActorIndex')
+
 @giclassoverride
 class Texture(Clutter.Texture, Actor):
     __init__ = deprecated_init(Clutter.Texture.__init__,
@@ -872,6 +4666,435 @@ class LayoutManager(Clutter.LayoutManager):
         meta = self.get_child_meta(container, child)
         return meta.get_property(property_name)
 
+    def child_set_properties(self, container, child, **properties):
+        """
+        @container: The container using this layout manager
+        @child: A child of @container
+        @properties: The layout properties to set
+
+        The child_set_properties() method sets many layout properties of
+        @child, looking its Clutter.LayoutMeta up once and notifying the
+        changes once they are all set.
+
+        >>> layout.child_set_properties(box, child, expand=True,
+        ...                             x_align=Clutter.BoxAlignment.START)
+        """
+        _layout_child_set_properties(self, container, child, properties)
+
+    def child_get_properties(self, container, child, *names):
+        """
+        Returns a tuple with the values of the layout properties @names of
+        @child.
+        """
+        return _get_meta_properties(self.get_child_meta(container, child),
+                                    names)
+
+    def children_set_properties(self, container, children, **properties):
+        """
+        @container: The container using this layout manager
+        @children: A sequence of children of @container
+        @properties: The layout properties to set on each of them
+
+        The bulk form of child_set_properties().
+        """
+        for child in children:
+            _layout_child_set_properties(self, container, child, properties)
+
+# the properties of a child changing its preferred size, or whether it
+# counts in the layout, without necessarily queueing a relayout on it
+_SIZE_PROPERTIES = frozenset([
+    'visible', 'request-mode',
+    'width', 'height',
+    'min-width', 'min-width-set', 'min-height', 'min-height-set',
+    'natural-width', 'natural-width-set',
+    'natural-height', 'natural-height-set',
+    'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
+])
+
+class CachedLayoutManager(LayoutManager):
+    """
+    A base class for layout managers implemented in Python that memoizes
+    preferred sizes per container and for-size. Clutter queries them
+    several times per allocation, and each query usually walks every child.
+
+    Subclasses implement compute_preferred_width() and
+    compute_preferred_height() instead of the corresponding virtual
+    functions. The cache of a container is cleared when layout_changed() is
+    called, when a child is added or removed, and when a child queues a
+    relayout or changes a size property, like its visibility, size requests
+    or margins.
+
+    >>> class ColumnLayout(Clutter.CachedLayoutManager):
+    ...     def compute_preferred_width(self, container, for_height):
+    ...         widths = [child.get_preferred_width(-1) for child in container]
+    ...         return (max(w[0] for w in widths), max(w[1] for w in widths))
+    """
+    def __init__(self, **kwargs):
+        LayoutManager.__init__(self, **kwargs)
+        self._size_cache = {}
+        self._size_cache_handlers = {}
+        self._size_cache_child_handlers = {}
+        self._container = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.connect('layout-changed', self._on_layout_changed)
+
+    def compute_preferred_width(self, container, for_height):
+        raise NotImplementedError
+
+    def compute_preferred_height(self, container, for_width):
+        raise NotImplementedError
+
+    def _on_layout_changed(self, layout_manager):
+        for cache in self._size_cache.values():
+            cache.clear()
+
+    def _invalidate(self, container):
+        cache = self._size_cache.get(container)
+        if cache:
+            cache.clear()
+
+    def _on_child_relayout(self, child, container):
+        self._invalidate(container)
+
+    def _on_child_notify(self, child, pspec, container):
+        if pspec.name in _SIZE_PROPERTIES:
+            self._invalidate(container)
+
+    def _watch_child(self, container, child):
+        self._size_cache_child_handlers[container][child] = (
+            child.connect('queue-relayout', self._on_child_relayout, container),
+            child.connect('notify', self._on_child_notify, container),
+        )
+
+    def _on_actor_added(self, container, child):
+        self._watch_child(container, child)
+        self._invalidate(container)
+
+    def _on_actor_removed(self, container, child):
+        handlers = self._size_cache_child_handlers[container].pop(child, ())
+        for handler_id in handlers:
+            child.disconnect(handler_id)
+        self._invalidate(container)
+
+    def _on_container_destroy(self, container):
+        self._forget(container)
+
+    def do_set_container(self, container):
+        # replacing the layout manager of a container, or setting it on
+        # another one, would otherwise leave the handlers on the previous
+        # container and its children
+        if self._container is not None and self._container is not container:
+            self._forget(self._container)
+        self._container = container
+        LayoutManager.do_set_container(self, container)
+
+    def _forget(self, container):
+        self._size_cache.pop(container, None)
+        for handler_id in self._size_cache_handlers.pop(container, ()):
+            container.disconnect(handler_id)
+        children = self._size_cache_child_handlers.pop(container, {})
+        for child, handlers in children.items():
+            for handler_id in handlers:
+                child.disconnect(handler_id)
+
+    def _get_cache(self, container):
+        cache = self._size_cache.get(container)
+        if cache is None:
+            cache = self._size_cache[container] = {}
+            self._size_cache_handlers[container] = (
+                container.connect('actor-added', self._on_actor_added),
+                container.connect('actor-removed', self._on_actor_removed),
+                container.connect('destroy', self._on_container_destroy),
+            )
+            self._size_cache_child_handlers[container] = {}
+            for child in container.get_children():
+                self._watch_child(container, child)
+        return cache
+
+    def do_get_preferred_width(self, container, for_height):
+        cache = self._get_cache(container)
+        key = (True, for_height)
+        size = cache.get(key)
+        if size is None:
+            self.cache_misses += 1
+            size = cache[key] = tuple(self.compute_preferred_width(container,
+                                                                   for_height))
+        else:
+            self.cache_hits += 1
+        return size
+
+    def do_get_preferred_height(self, container, for_width):
+        cache = self._get_cache(container)
+        key = (False, for_width)
+        size = cache.get(key)
+        if size is None:
+            self.cache_misses += 1
+            size = cache[key] = tuple(self.compute_preferred_height(container,
+                                                                    for_width))
+        else:
+            self.cache_hits += 1
+        return size
+
+    def get_cache_stats(self):
+        """
+        Returns a tuple with the number of cache hits, cache misses and
+        cached sizes.
+        """
+        return (self.cache_hits, self.cache_misses,
+                sum(len(cache) for cache in self._size_cache.values()))
+
+    def clear_cache(self):
+        for container in list(self._size_cache):
+            self._forget(container)
+
+__all__.append('CachedLayoutManager')
+
+def get_preferred_sizes(children):
+    """
+    @children: A sequence of actors
+
+    The get_preferred_sizes() function returns an N×4 float32 NumPy array
+    with the preferred sizes of @children, one row per child in the order
+    of Clutter.Actor.get_preferred_size(): [min_width, min_height,
+    natural_width, natural_height].
+    """
+    _require_numpy('get_preferred_sizes')
+    sizes = numpy.empty((len(children), 4), dtype=numpy.float32)
+    for i, child in enumerate(children):
+        sizes[i] = child.get_preferred_size()
+    return sizes
+
+def allocate_children(children, allocations, flags, origin=(0.0, 0.0)):
+    """
+    @children: A sequence of actors
+    @allocations: An ActorBoxArray or N×4 array of [x1, y1, x2, y2], one row
+        per child
+    @flags: The Clutter.AllocationFlags passed to every child
+    @origin: An offset added to every allocation
+
+    The allocate_children() function allocates each of @children its box
+    from @allocations, reusing a single Clutter.ActorBox.
+    """
+    if isinstance(allocations, ActorBoxArray):
+        allocations = allocations.to_numpy()
+    if len(allocations) != len(children):
+        raise ValueError('expected %d allocations, got %d' %
+                         (len(children), len(allocations)))
+    x, y = origin
+    box = Clutter.ActorBox()
+    for child, (x1, y1, x2, y2) in zip(children, allocations.tolist()):
+        box.x1 = x1 + x
+        box.y1 = y1 + y
+        box.x2 = x2 + x
+        box.y2 = y2 + y
+        child.allocate(box, flags)
+
+__all__.append('get_preferred_sizes')
+__all__.append('allocate_children')
+
+class VectorLayoutManager(CachedLayoutManager):
+    """
+    A base class for layout managers computing the allocations of all of
+    their visible children at once with NumPy.
+
+    Subclasses implement compute_allocations(), which receives the
+    preferred sizes of the visible children as returned by
+    get_preferred_sizes() and the available size, and returns an
+    ActorBoxArray or N×4 array of allocations relative to the origin of the
+    container's content box; as well as the compute_preferred_width() and
+    compute_preferred_height() methods of CachedLayoutManager.
+    """
+    def __init__(self, **kwargs):
+        _require_numpy(self.__class__.__name__)
+        self._spacing = 0.0
+        CachedLayoutManager.__init__(self, **kwargs)
+
+    @GObject.Property(type=float, default=0.0)
+    def spacing(self):
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, value):
+        if self._spacing != value:
+            self._spacing = value
+            self.layout_changed()
+
+    def get_visible_children(self, container):
+        return [child for child in container if child.is_visible()]
+
+    def compute_allocations(self, sizes, width, height):
+        raise NotImplementedError
+
+    def do_allocate(self, container, allocation, flags):
+        children = self.get_visible_children(container)
+        if not children:
+            return
+        sizes = get_preferred_sizes(children)
+        width, height = allocation.get_size()
+        allocations = self.compute_allocations(sizes, width, height)
+        allocate_children(children, allocations, flags, allocation.get_origin())
+
+__all__.append('VectorLayoutManager')
+
+class VectorGridLayout(VectorLayoutManager):
+    """
+    Lays out children in uniform cells as large as the largest natural
+    size of the children, in rows of @columns cells, or of as many cells as
+    fit in the available width if @columns is 0.
+    """
+    def __init__(self, **kwargs):
+        self._columns = 0
+        VectorLayoutManager.__init__(self, **kwargs)
+
+    @GObject.Property(type=int, default=0, minimum=0)
+    def columns(self):
+        return self._columns
+
+    @columns.setter
+    def columns(self, value):
+        if self._columns != value:
+            self._columns = value
+            self.layout_changed()
+
+    def _get_n_columns(self, n_children, cell_width, for_width):
+        if self._columns > 0:
+            return self._columns
+        if for_width < 0 or cell_width <= 0:
+            return max(n_children, 1)
+        n_columns = int((for_width + self._spacing) // (cell_width + self._spacing))
+        return max(n_columns, 1)
+
+    def compute_preferred_width(self, container, for_height):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        n_columns = min(self._get_n_columns(len(sizes), -1, -1), len(sizes))
+        spacing = self._spacing * (n_columns - 1)
+        return (float(sizes[:, 0].max()) * n_columns + spacing,
+                float(sizes[:, 2].max()) * n_columns + spacing)
+
+    def compute_preferred_height(self, container, for_width):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        n_columns = self._get_n_columns(len(sizes), float(sizes[:, 2].max()),
+                                        for_width)
+        n_rows = (len(sizes) + n_columns - 1) // n_columns
+        spacing = self._spacing * (n_rows - 1)
+        return (float(sizes[:, 1].max()) * n_rows + spacing,
+                float(sizes[:, 3].max()) * n_rows + spacing)
+
+    def compute_allocations(self, sizes, width, height):
+        cell_width = sizes[:, 2].max()
+        cell_height = sizes[:, 3].max()
+        n_columns = self._get_n_columns(len(sizes), cell_width, width)
+        rows, columns = numpy.divmod(numpy.arange(len(sizes)), n_columns)
+
+        allocations = numpy.empty((len(sizes), 4), dtype=numpy.float32)
+        allocations[:, 0] = columns * (cell_width + self._spacing)
+        allocations[:, 1] = rows * (cell_height + self._spacing)
+        allocations[:, 2] = allocations[:, 0] + cell_width
+        allocations[:, 3] = allocations[:, 1] + cell_height
+        return ActorBoxArray.from_numpy(allocations)
+
+__all__.append('VectorGridLayout')
+
+class VectorFlowLayout(VectorLayoutManager):
+    """
+    Lays out children at their natural size from left to right, wrapping
+    to a new line when the available width is exhausted. Each line is as
+    tall as its tallest child.
+    """
+    def _get_lines(self, widths, for_width):
+        # the start of every line, found with one search per line over the
+        # running sum of the widths
+        advance = numpy.cumsum(widths + self._spacing)
+        if for_width < 0:
+            return numpy.array([0])
+        starts = [0]
+        consumed = 0.0
+        while True:
+            end = int(numpy.searchsorted(advance, consumed + for_width + self._spacing,
+                                         side='right'))
+            end = max(end, starts[-1] + 1)
+            if end >= len(widths):
+                break
+            starts.append(end)
+            consumed = advance[end - 1]
+        return numpy.array(starts)
+
+    def compute_preferred_width(self, container, for_height):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        spacing = self._spacing * (len(sizes) - 1)
+        return (float(sizes[:, 0].max()), float(sizes[:, 2].sum()) + spacing)
+
+    def compute_preferred_height(self, container, for_width):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        starts = self._get_lines(sizes[:, 2], for_width)
+        heights = numpy.maximum.reduceat(sizes[:, 3], starts)
+        height = float(heights.sum()) + self._spacing * (len(starts) - 1)
+        return (height, height)
+
+    def compute_allocations(self, sizes, width, height):
+        widths = sizes[:, 2]
+        starts = self._get_lines(widths, width)
+        line_heights = numpy.maximum.reduceat(sizes[:, 3], starts)
+        line_y = numpy.concatenate(([0.0], numpy.cumsum(line_heights + self._spacing)[:-1]))
+
+        # the line of every child, and its offset from the start of it
+        lines = numpy.zeros(len(sizes), dtype=numpy.intp)
+        lines[starts[1:]] = 1
+        lines = numpy.cumsum(lines)
+        advance = numpy.cumsum(widths + self._spacing) - (widths + self._spacing)
+        x = advance - advance[starts][lines]
+
+        allocations = numpy.empty((len(sizes), 4), dtype=numpy.float32)
+        allocations[:, 0] = x
+        allocations[:, 1] = line_y[lines]
+        allocations[:, 2] = x + widths
+        allocations[:, 3] = allocations[:, 1] + sizes[:, 3]
+        return ActorBoxArray.from_numpy(allocations)
+
+__all__.append('VectorFlowLayout')
+
+class VectorCircleLayout(VectorLayoutManager):
+    """
+    Lays out children in uniform cells as large as the largest natural
+    size of the children, evenly spaced on the largest circle fitting in
+    the available space.
+    """
+    def compute_preferred_width(self, container, for_height):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        return (float(sizes[:, 0].max()), float(sizes[:, 2].max()))
+
+    def compute_preferred_height(self, container, for_width):
+        sizes = get_preferred_sizes(self.get_visible_children(container))
+        if not len(sizes):
+            return (0.0, 0.0)
+        return (float(sizes[:, 1].max()), float(sizes[:, 3].max()))
+
+    def compute_allocations(self, sizes, width, height):
+        cell_width = sizes[:, 2].max()
+        cell_height = sizes[:, 3].max()
+        radius = max(min((width - cell_width) / 2, (height - cell_height) / 2), 0)
+        theta = numpy.arange(len(sizes)) * (2.0 * math.pi / len(sizes))
+
+        allocations = numpy.empty((len(sizes), 4), dtype=numpy.float32)
+        allocations[:, 0] = width / 2 + radius * numpy.sin(theta) - cell_width / 2
+        allocations[:, 1] = height / 2 + radius * numpy.cos(theta) - cell_height / 2
+        allocations[:, 2] = allocations[:, 0] + cell_width
+        allocations[:, 3] = allocations[:, 1] + cell_height
+        return ActorBoxArray.from_numpy(allocations)
+
+__all__.append('VectorCircleLayout')
+
 @giclassoverride
 class BinLayout(Clutter.BinLayout):
     __init__ = deprecated_init(Clutter.BinLayout.__init__,
@@ -893,25 +5116,22 @@ class Box(Clutter.Box, Actor):
     def pack(self, actor, **kwargs):
         self.add_actor(actor)
         layout_manager = self.get_layout_manager()
-        if layout_manager:
-            for k, v in kwargs.items():
-                layout_manager.child_set_property(self, actor, k, v)
+        if layout_manager and kwargs:
+            _layout_child_set_properties(layout_manager, self, actor, kwargs)
 
     def pack_after(self, actor, silbing, **kwargs):
         self.add_actor(actor)
         self.raise_child(actor, silbing)
         layout_manager = self.get_layout_manager()
-        if layout_manager:
-            for k, v in kwargs.items():
-                layout_manager.child_set_property(self, actor, k, v)
+        if layout_manager and kwargs:
+            _layout_child_set_properties(layout_manager, self, actor, kwargs)
 
     def pack_before(self, actor, silbing, **kwargs):
         self.add_actor(actor)
         self.lower_child(actor, silbing)
         layout_manager = self.get_layout_manager()
-        if layout_manager:
-            for k, v in kwargs.items():
-                layout_manager.child_set_property(self, actor, k, v)
+        if layout_manager and kwargs:
+            _layout_child_set_properties(layout_manager, self, actor, kwargs)
 
 @giclassoverride
 class Model(Clutter.Model):
@@ -1109,27 +5329,17 @@ class Shader(Clutter.Shader):
 @giclassoverride
 class Animator(Clutter.Animator):
     def set_key(self, obj, property_name, mode, progress, value):
-        try:
-            pspec = getattr(obj.__class__.props, property_name)
-        except AttributeError:
-            raise AttributeError(("Objects of type '%s' don't have a " +
-                "property '%s'") % (type(obj), property_name))
+        pspec, convert = _lookup_property(obj, property_name)
         return Clutter.Animator.set_key(self, obj, property_name, mode,
-                progress, _gvalue_from_python(pspec.value_type, value))
+                progress, convert(value))
 
 @giclassoverride
 class State(Clutter.State):
     def set_key(self, source_state, target_state, obj, property_name, mode,
                 value, pre_delay=0.0, post_delay=0.0):
-        try:
-            pspec = getattr(obj.__class__.props, property_name)
-        except AttributeError:
-            raise AttributeError(("Objects of type '%s' don't have a " +
-                "property '%s'") % (type(obj), property_name))
+        pspec, convert = _lookup_property(obj, property_name)
         return Clutter.State.set_key(self, source_state, target_state, obj,
-                property_name, mode,
-                _gvalue_from_python(pspec.value_type, value),
-                pre_delay, post_delay)
+                property_name, mode, convert(value), pre_delay, post_delay)
 
 @giclassoverride
 class Interval(Clutter.Interval):
@@ -1214,21 +5424,36 @@ if clutter_version >= (1, 10, 0):
             return '<Clutter.Margin(left=%f, right=%f, top=%f, bottom=%f)>' \
                     % (self.left, self.right, self.top, self.bottom)
 
+        _fields_type = ctypes.c_float * 4
+
+        # ClutterMargin stores left, right, top, bottom; the sequence
+        # protocol uses the CSS order top, right, bottom, left
+        _fields_order = (2, 1, 3, 0)
+
+        def as_memoryview(self):
+            """
+            Returns a writable memoryview of format 'f' over the underlying
+            ClutterMargin, in the C field order [left, right, top, bottom].
+            """
+            return _struct_memoryview(
+                _struct_fields(self, Clutter.Margin, self._fields_type), 'f')
+
+        def __buffer__(self, flags):
+            return self.as_memoryview()
+
+        def __iter__(self):
+            fields = _struct_fields(self, Clutter.Margin, self._fields_type)
+            return iter([fields[i] for i in self._fields_order])
+
         def __len__(self):
             return 4
 
         def __getitem__(self, key):
             if isinstance(key, int):
-                if key == 0:
-                    return self.top
-                elif key == 1:
-                    return self.right
-                elif key == 2:
-                    return self.bottom
-                elif key == 3:
-                    return self.left
-                else:
+                if key < 0 or key >= 4:
                     raise IndexError("index out of range")
+                fields = _struct_fields(self, Clutter.Margin, self._fields_type)
+                return fields[self._fields_order[key]]
             else:
                 raise TypeError("sequence index must be integer")
 
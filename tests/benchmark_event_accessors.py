@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- Mode: Python -*-
+#
+# Compares reading event fields through the union member structures with
+# the precomputed accessors of the Clutter.Event override.
+#
+# Usage: ./benchmark_event_accessors.py [iterations]
+
+import sys
+import timeit
+
+from gi.repository import Clutter
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    motion = Clutter.Event.new(Clutter.EventType.MOTION)
+    motion.set_coords(12.0, 34.0)
+    key = Clutter.Event.new(Clutter.EventType.KEY_PRESS)
+    key.set_key_symbol(Clutter.KEY_a)
+
+    cases = [
+        ('motion x, y', motion,
+         lambda: (motion.motion.x, motion.motion.y),
+         lambda: (motion.x, motion.y)),
+        ('motion coords', motion,
+         lambda: (motion.motion.x, motion.motion.y),
+         lambda: motion.coords),
+        ('key keyval', key,
+         lambda: key.key.keyval,
+         lambda: key.keyval),
+        ('key modifier_state', key,
+         lambda: key.key.modifier_state,
+         lambda: key.modifier_state),
+    ]
+
+    print('%-20s %12s %12s %8s' % ('field', 'member (us)', 'accessor (us)', 'speedup'))
+    for name, event, member, accessor in cases:
+        member_time = min(timeit.repeat(member, number=n, repeat=3)) / n * 1e6
+        accessor_time = min(timeit.repeat(accessor, number=n, repeat=3)) / n * 1e6
+        print('%-20s %12.3f %12.3f %7.2fx' % (name, member_time, accessor_time,
+                                              member_time / accessor_time))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterBatchUpdate(unittest.TestCase):
+    def setUp(self):
+        self.parent = Clutter.Actor()
+        self.a = Clutter.Actor()
+        self.b = Clutter.Actor()
+        self.parent.add_child(self.a)
+        self.parent.add_child(self.b)
+        # clear the relayout flags, so that changes emit queue-relayout
+        self.parent.allocate_preferred_size(Clutter.AllocationFlags.ALLOCATION_NONE)
+
+    def test_relayouts(self):
+        relayouts = []
+        self.parent.connect_after('queue-relayout', lambda actor: relayouts.append(actor))
+        with self.parent.batch_update() as stats:
+            self.a.set_width(10)
+            self.b.set_width(20)
+            self.a.set_height(5)
+            self.assertEqual(relayouts, [])
+        # the second change of a does not emit, a already needs a relayout
+        self.assertEqual(stats.relayouts_requested, 2)
+        self.assertEqual(relayouts, [self.parent])
+
+    def test_notifications(self):
+        opacities = []
+        self.a.connect('notify::opacity', lambda actor, pspec: opacities.append(actor.get_opacity()))
+        with self.parent.batch_update() as stats:
+            self.a.set_opacity(10)
+            self.a.set_opacity(30)
+            self.a.set_name('a')
+            self.b.set_opacity(5)
+            self.assertEqual(opacities, [])
+        self.assertEqual(opacities, [30])
+        # one per changed property and actor: opacity and name of a, and
+        # opacity of b
+        self.assertEqual(stats.notifications, 3)
+        self.assertEqual(stats.relayouts_requested, 0)
+
+    def test_no_changes(self):
+        with self.parent.batch_update() as stats:
+            pass
+        self.assertEqual((stats.notifications, stats.relayouts_requested),
+                         (0, 0))
@@ -0,0 +1,72 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterActorBox(unittest.TestCase):
+    def test_actor_box_sequence(self):
+        box = Clutter.ActorBox(1.0, 2.0, 11.0, 22.0)
+        self.assertEqual(list(box), [1.0, 2.0, 11.0, 22.0])
+        self.assertEqual(box[3], 22.0)
+        self.assertEqual(box.size, (10.0, 20.0))
+
+    def test_actor_box_memoryview(self):
+        box = Clutter.ActorBox(1.0, 2.0, 11.0, 22.0)
+        view = box.as_memoryview()
+        self.assertEqual(view.format, 'f')
+        view[2] = 5.0
+        self.assertEqual(box.x2, 5.0)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(numpy, 'NumPy not available')
+class TestClutterActorBoxArray(unittest.TestCase):
+    def setUp(self):
+        self.boxes = Clutter.ActorBoxArray.from_boxes([
+            Clutter.ActorBox(0.0, 0.0, 10.0, 10.0),
+            Clutter.ActorBox(5.0, 5.0, 20.0, 30.0)])
+
+    def test_actor_box_array_round_trip(self):
+        boxes = self.boxes.to_boxes()
+        self.assertEqual(len(boxes), 2)
+        self.assertEqual(boxes[1], Clutter.ActorBox(5.0, 5.0, 20.0, 30.0))
+        self.assertEqual(list(self.boxes.width), [10.0, 15.0])
+
+    def test_actor_box_array_getitem(self):
+        box = self.boxes[-1]
+        self.assertTrue(isinstance(box, Clutter.ActorBox))
+        self.assertEqual((box.x1, box.y1, box.x2, box.y2), (5.0, 5.0, 20.0, 30.0))
+        self.assertRaises(IndexError, lambda: self.boxes[2])
+
+    def test_actor_box_array_union_intersect(self):
+        other = Clutter.ActorBox(2.0, 2.0, 4.0, 40.0)
+        self.assertEqual(self.boxes.union(other)[0], [0.0, 0.0, 10.0, 40.0])
+        self.assertEqual(self.boxes.intersect(other)[0], [2.0, 2.0, 4.0, 10.0])
+        self.assertEqual(list(self.boxes.intersects(other)), [True, False])
+        self.assertEqual(self.boxes.bounds(), [0.0, 0.0, 20.0, 30.0])
+
+    def test_actor_box_array_contains_points(self):
+        hits = self.boxes.contains_points([(6.0, 6.0), (1.0, 1.0)])
+        self.assertEqual(hits.tolist(), [[True, True], [True, False]])
+
+    def test_actor_box_array_clamp_to_pixel(self):
+        boxes = Clutter.ActorBoxArray.from_numpy([[0.5, 0.5, 9.2, 9.7]])
+        boxes.clamp_to_pixel()
+        self.assertEqual(boxes[0], [0.0, 0.0, 10.0, 10.0])
+
+    def test_actor_box_array_interpolate(self):
+        final = Clutter.ActorBox(10.0, 10.0, 20.0, 20.0)
+        result = self.boxes.interpolate(final, [0.5, 1.0])
+        self.assertEqual(result[0], [5.0, 5.0, 15.0, 15.0])
+        self.assertEqual(result[1], [10.0, 10.0, 20.0, 20.0])
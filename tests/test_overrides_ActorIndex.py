@@ -0,0 +1,49 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterActorIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = Clutter.ActorIndex(cell_size=16)
+        self.bottom = Clutter.Actor()
+        self.top = Clutter.Actor()
+        self.index.update(self.bottom, Clutter.ActorBox(0, 0, 40, 40))
+        self.index.update(self.top, Clutter.ActorBox(20, 20, 60, 60))
+
+    def test_pick(self):
+        self.assertTrue(self.index.pick(10, 10) is self.bottom)
+        self.assertTrue(self.index.pick(30, 30) is self.top)
+        self.assertEqual(self.index.pick(100, 100), None)
+        self.assertEqual(self.index.query_point(30, 30), [self.top, self.bottom])
+        self.assertEqual(self.index.pick_many([(10, 10), (50, 50), (70, 70)]),
+                         [self.bottom, self.top, None])
+
+    def test_edges(self):
+        # like clutter_actor_box_contains(), edges are outside
+        self.assertEqual(self.index.pick(0, 10), None)
+        self.assertTrue(self.index.pick(40, 10) is None)
+        self.assertTrue(self.index.pick(20, 30) is self.bottom)
+
+    def test_query_rect(self):
+        found = self.index.query_rect(Clutter.ActorBox(45, 45, 50, 50))
+        self.assertEqual(found, [self.top])
+
+    def test_destroy_with_explicit_box(self):
+        self.top.destroy()
+        self.assertFalse(self.top in self.index)
+        self.assertTrue(self.index.pick(50, 50) is None)
+        self.assertEqual(len(self.index), 1)
+
+    def test_remove(self):
+        self.index.remove(self.bottom)
+        self.assertEqual(self.index.pick(10, 10), None)
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
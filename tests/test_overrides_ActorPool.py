@@ -0,0 +1,62 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterActorPool(unittest.TestCase):
+    def test_recycle(self):
+        pool = Clutter.ActorPool()
+        label = pool.acquire(Clutter.Text, text='a')
+        self.assertEqual(pool.misses, 1)
+        self.assertEqual(pool.n_live, 1)
+
+        parent = Clutter.Actor()
+        parent.add_child(label)
+        label.add_action(Clutter.ClickAction())
+        label.set_text('b')
+
+        pool.release(label)
+        self.assertEqual(pool.n_live, 0)
+        self.assertEqual(pool.n_free, 1)
+        self.assertEqual(label.get_parent(), None)
+        self.assertEqual(label.get_actions(), [])
+        self.assertEqual(label.get_text(), 'a')
+
+        self.assertTrue(pool.acquire(Clutter.Text, text='a') is label)
+        self.assertEqual(pool.hits, 1)
+        self.assertEqual(pool.hit_rate, 0.5)
+
+    def test_keys(self):
+        pool = Clutter.ActorPool()
+        pool.release(pool.acquire(Clutter.Text, text='a'))
+        label = pool.acquire(Clutter.Text, text='b')
+        self.assertEqual(label.get_text(), 'b')
+        self.assertEqual(pool.hits, 0)
+        self.assertEqual(pool.n_free, 1)
+
+    def test_max_free(self):
+        pool = Clutter.ActorPool(max_free=1)
+        actors = [pool.acquire(Clutter.Actor) for i in range(3)]
+        for actor in actors:
+            pool.release(actor)
+        self.assertEqual(pool.n_free, 1)
+
+    def test_handlers(self):
+        pool = Clutter.ActorPool()
+        actor = pool.acquire(Clutter.Actor)
+        pooled = []
+        kept = []
+        pool.connect(actor, 'notify::name', lambda *args: pooled.append(True))
+        actor.connect('notify::name', lambda *args: kept.append(True))
+
+        pool.release(actor)
+        actor.set_name('a')
+        self.assertEqual(pooled, [])
+        self.assertEqual(kept, [True])
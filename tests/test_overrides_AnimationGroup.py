@@ -0,0 +1,75 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, GLib
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+def init_clutter():
+    # timelines need the master clock of an initialized backend
+    if Clutter is None:
+        return False
+    try:
+        Clutter.init_with_args([], None, None, None)
+    except GLib.GError:
+        return False
+    return True
+
+@unittest.skipUnless(init_clutter(), 'Clutter cannot be initialized')
+class TestClutterAnimationGroup(unittest.TestCase):
+    def setUp(self):
+        self.actors = [Clutter.Actor() for i in range(3)]
+        self.group = Clutter.animate_many(
+            self.actors, Clutter.AnimationMode.LINEAR, 100,
+            [{'x': 10.0 * (i + 1), 'opacity': 0} for i in range(3)])
+        self.completed = []
+        self.group.connect('completed', self.completed.append)
+
+    def tearDown(self):
+        self.group.cancel()
+
+    def run_until_completed(self):
+        loop = GLib.MainLoop()
+        self.group.connect('completed', lambda timeline: loop.quit())
+        source_id = GLib.timeout_add(2000, loop.quit)
+        loop.run()
+        GLib.source_remove(source_id)
+        # a few more iterations, to catch any later emission
+        context = GLib.MainContext.default()
+        for i in range(10):
+            context.iteration(False)
+
+    def test_values_at_completion(self):
+        self.assertEqual(len(self.group), 6)
+        self.run_until_completed()
+        self.assertEqual([actor.get_x() for actor in self.actors],
+                         [10.0, 20.0, 30.0])
+        self.assertEqual([actor.get_opacity() for actor in self.actors],
+                         [0, 0, 0])
+        self.assertEqual(len(self.completed), 1)
+
+    def test_complete(self):
+        self.group.complete()
+        self.assertEqual([actor.get_x() for actor in self.actors],
+                         [10.0, 20.0, 30.0])
+        self.assertEqual(self.completed, [])
+        self.run_until_completed()
+        self.assertEqual(len(self.completed), 1)
+        self.assertFalse(self.group.is_playing())
+
+        # completing twice does nothing
+        self.group.complete()
+        self.assertFalse(self.group.is_playing())
+
+    def test_cancel(self):
+        self.group.cancel()
+        self.assertFalse(self.group.is_playing())
+        self.assertEqual([actor.get_x() for actor in self.actors],
+                         [0.0, 0.0, 0.0])
+        self.group.timeline.emit('new-frame', 50)
+        self.assertEqual(self.actors[0].get_x(), 0.0)
+        self.assertEqual(self.completed, [])
@@ -0,0 +1,90 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+if Clutter:
+    class CountingLayout(Clutter.CachedLayoutManager):
+        def __init__(self):
+            Clutter.CachedLayoutManager.__init__(self)
+            self.computed = 0
+
+        def compute_preferred_width(self, container, for_height):
+            self.computed += 1
+            return (0.0, sum(child.get_width() for child in container))
+
+        def compute_preferred_height(self, container, for_width):
+            self.computed += 1
+            return (0.0, max([child.get_height() for child in container] or [0.0]))
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterCachedLayoutManager(unittest.TestCase):
+    def setUp(self):
+        self.layout = CountingLayout()
+        self.box = Clutter.Actor(layout_manager=self.layout)
+        self.child = Clutter.Actor(width=10, height=20)
+        self.box.add_child(self.child)
+
+    def test_hits(self):
+        self.assertEqual(self.box.get_preferred_width(-1), (0.0, 10.0))
+        self.layout.do_get_preferred_width(self.box, -1)
+        self.layout.do_get_preferred_width(self.box, -1)
+        hits, misses, size = self.layout.get_cache_stats()
+        self.assertEqual(self.layout.computed, 1)
+        self.assertEqual((hits, misses, size), (2, 1, 1))
+
+    def test_invalidate_on_child_relayout(self):
+        self.layout.do_get_preferred_width(self.box, -1)
+        self.child.set_width(30)
+        self.assertEqual(self.layout.do_get_preferred_width(self.box, -1), (0.0, 30.0))
+        self.assertEqual(self.layout.computed, 2)
+
+    def test_invalidate_on_layout_changed(self):
+        self.layout.do_get_preferred_height(self.box, -1)
+        self.layout.layout_changed()
+        self.layout.do_get_preferred_height(self.box, -1)
+        self.assertEqual(self.layout.computed, 2)
+
+    def test_invalidate_on_each_child_change(self):
+        for width in (30, 40, 50):
+            self.child.set_width(width)
+            self.assertEqual(self.layout.do_get_preferred_width(self.box, -1),
+                             (0.0, width))
+
+    def test_invalidate_on_child_hidden(self):
+        other = Clutter.Actor(width=5, height=5)
+        self.box.add_child(other)
+        self.layout.do_get_preferred_width(self.box, -1)
+        other.hide()
+        self.layout.do_get_preferred_width(self.box, -1)
+        self.assertEqual(self.layout.computed, 2)
+
+    def test_invalidate_on_children_changed(self):
+        self.layout.do_get_preferred_width(self.box, -1)
+        other = Clutter.Actor(width=5)
+        self.box.add_child(other)
+        self.assertEqual(self.layout.do_get_preferred_width(self.box, -1), (0.0, 15.0))
+        self.box.remove_child(other)
+        self.assertEqual(self.layout.do_get_preferred_width(self.box, -1), (0.0, 10.0))
+
+        # removed children no longer clear the cache
+        other.set_width(50)
+        self.layout.do_get_preferred_width(self.box, -1)
+        self.assertEqual(self.layout.computed, 3)
+
+    def test_replaced(self):
+        self.layout.do_get_preferred_width(self.box, -1)
+        self.box.set_layout_manager(Clutter.BinLayout())
+        # the replaced layout manager no longer watches the box
+        self.assertEqual(self.layout.get_cache_stats()[2], 0)
+        self.assertNotIn(self.box, self.layout._size_cache_handlers)
+        self.assertNotIn(self.box, self.layout._size_cache_child_handlers)
+        self.box.add_child(Clutter.Actor(width=5))
+        self.child.set_width(30)
+        self.assertEqual(self.layout.computed, 1)
@@ -32,3 +32,22 @@ class TestClutterColor(unittest.TestCase):
         self.assertEqual(color.green, 0)
         self.assertEqual(color.blue, 0)
         self.assertEqual(color.alpha, 128)
+
+    def test_color_sequence(self):
+        color = Clutter.Color(32, 64, 128, 255)
+        self.assertEqual(list(color), [32, 64, 128, 255])
+        self.assertEqual(color[2], 128)
+        self.assertRaises(IndexError, lambda: color[4])
+        self.assertRaises(TypeError, lambda: color['red'])
+
+    def test_color_memoryview(self):
+        color = Clutter.Color(32, 64, 128, 255)
+        view = color.as_memoryview()
+        self.assertEqual(view.format, 'B')
+        self.assertEqual(view.tolist(), [32, 64, 128, 255])
+
+        view[:] = bytearray([1, 2, 3, 4])
+        self.assertEqual(color.red, 1)
+        self.assertEqual(color.green, 2)
+        self.assertEqual(color.blue, 3)
+        self.assertEqual(color.alpha, 4)
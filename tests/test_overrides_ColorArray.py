@@ -0,0 +1,50 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(numpy, 'NumPy not available')
+class TestClutterColorArray(unittest.TestCase):
+    def test_color_array_from_numpy(self):
+        data = numpy.array([[32, 64, 128, 255], [0, 0, 0, 0]], dtype=numpy.uint8)
+        colors = Clutter.ColorArray.from_numpy(data)
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(list(colors[0]), [32, 64, 128, 255])
+        self.assertTrue(colors.to_numpy() is data)
+
+    def test_color_array_to_colors(self):
+        colors = Clutter.ColorArray.from_colors([Clutter.Color(1, 2, 3, 4),
+                                                 Clutter.Color(5, 6, 7, 8)])
+        self.assertEqual(colors.to_bytes(), b'\x01\x02\x03\x04\x05\x06\x07\x08')
+        color = colors[1].to_color()
+        self.assertTrue(isinstance(color, Clutter.Color))
+        self.assertEqual(color, Clutter.Color(5, 6, 7, 8))
+
+    def test_color_array_interpolate(self):
+        colors = Clutter.ColorArray.from_colors([Clutter.Color(0, 0, 0, 0)] * 2)
+        result = colors.interpolate(Clutter.Color(200, 100, 50, 255), [0.0, 0.5])
+        self.assertEqual(list(result[0]), [0, 0, 0, 0])
+        self.assertEqual(list(result[1]), [100, 50, 25, 127])
+
+    def test_color_array_shade(self):
+        color = Clutter.Color(10, 200, 30, 128)
+        colors = Clutter.ColorArray.from_colors([color])
+        self.assertEqual(colors.lighten()[0].to_color(), color.lighten())
+        self.assertEqual(colors.darken()[0].to_color(), color.darken())
+
+    def test_color_array_hls(self):
+        colors = Clutter.ColorArray.from_hls([0.0, 120.0], 0.5, 1.0)
+        self.assertEqual(list(colors[0]), [255, 0, 0, 255])
+        self.assertEqual(list(colors[1]), [0, 255, 0, 255])
@@ -0,0 +1,179 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, GObject
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+if Clutter:
+    class ChildMeta(Clutter.ChildMeta):
+        expand = GObject.Property(type=bool, default=False)
+        padding = GObject.Property(type=float, default=0.0)
+
+    class MetaContainer(Clutter.Actor):
+        def __init__(self):
+            Clutter.Actor.__init__(self)
+            self.metas = {}
+
+        def get_child_meta(self, child):
+            meta = self.metas.get(child)
+            if meta is None:
+                meta = self.metas[child] = ChildMeta(container=self,
+                                                     actor=child)
+            return meta
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterChildProperties(unittest.TestCase):
+    def setUp(self):
+        self.layout = Clutter.BoxLayout()
+        self.box = Clutter.Actor(layout_manager=self.layout)
+        self.children = [Clutter.Actor() for i in range(3)]
+        for child in self.children:
+            self.box.add_child(child)
+
+    def test_layout_child_properties(self):
+        child = self.children[0]
+        self.layout.child_set_properties(self.box, child, expand=True,
+                                         x_fill=True)
+        self.assertEqual(self.layout.child_get_properties(self.box, child,
+                                                          'expand', 'x-fill'),
+                         (True, True))
+        self.assertEqual(self.layout.child_get_property(self.box, child,
+                                                        'expand'), True)
+
+    def test_layout_children_properties(self):
+        self.layout.children_set_properties(self.box, self.children[1:],
+                                            expand=True)
+        self.assertEqual([self.layout.child_get_properties(self.box, child,
+                                                           'expand')
+                          for child in self.children],
+                         [(False,), (True,), (True,)])
+
+    def test_unknown_property(self):
+        self.assertRaises(AttributeError, self.layout.child_set_properties,
+                          self.box, self.children[0], no_such_property=1)
+
+    def test_container_child_properties(self):
+        container = MetaContainer()
+        child = Clutter.Actor()
+        container.add_child(child)
+        meta = container.get_child_meta(child)
+        notified = []
+        meta.connect('notify', lambda meta, pspec:
+                     notified.append((pspec.name, meta.props.expand,
+                                      meta.props.padding)))
+
+        container.child_set_properties(child, expand=True, padding=3)
+        self.assertEqual(container.child_get_properties(child, 'expand',
+                                                        'padding'),
+                         (True, 3.0))
+        # notifications are emitted once everything is set
+        self.assertEqual(sorted(notified), [('expand', True, 3.0),
+                                            ('padding', True, 3.0)])
+
+    def test_container_children_properties(self):
+        container = MetaContainer()
+        children = [Clutter.Actor() for i in range(3)]
+        for child in children:
+            container.add_child(child)
+        container.children_set_properties(children[1:], padding=2.0)
+        self.assertEqual([container.child_get_properties(child, 'padding')
+                          for child in children],
+                         [(0.0,), (2.0,), (2.0,)])
+        self.assertRaises(AttributeError, container.child_set_properties,
+                          children[0], no_such_property=1)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterChildrenView(unittest.TestCase):
+    def setUp(self):
+        self.container = Clutter.Actor()
+        self.a, self.b, self.c = [Clutter.Actor() for i in range(3)]
+        for child in (self.a, self.b, self.c):
+            self.container.add_child(child)
+        self.assertEqual(list(self.container.children), [self.a, self.b, self.c])
+
+    def test_set_child_above_sibling(self):
+        self.container.set_child_above_sibling(self.a, None)
+        self.assertEqual(list(self.container.children), [self.b, self.c, self.a])
+        self.assertTrue(self.container.children[1] is self.c)
+
+    def test_set_child_below_sibling(self):
+        self.container.set_child_below_sibling(self.c, self.a)
+        self.assertEqual(list(self.container.children), [self.c, self.a, self.b])
+        self.assertEqual(self.container.children.index(self.b), 2)
+
+    def test_set_child_at_index(self):
+        self.container.set_child_at_index(self.a, 1)
+        self.assertEqual(list(self.container.children), [self.b, self.a, self.c])
+
+    def test_raise_lower(self):
+        self.a.raise_top()
+        self.assertEqual(list(self.container.children), [self.b, self.c, self.a])
+        self.a.lower_bottom()
+        self.assertEqual(list(self.container.children), [self.a, self.b, self.c])
+
+    def test_add_remove(self):
+        self.container.remove_child(self.b)
+        self.assertEqual(list(self.container.children), [self.a, self.c])
+        d = Clutter.Actor()
+        self.container.insert_child_at_index(d, 1)
+        self.assertTrue(self.container.children[1] is d)
+        self.assertEqual(len(self.container.children), 3)
+
+    def test_reorder_in_the_middle(self):
+        d = Clutter.Actor()
+        self.container.add_child(d)
+        # reordered without going through any Python override
+        Clutter.Actor.set_child_above_sibling(self.container, self.b, self.c)
+        self.assertTrue(self.container.children[1] is self.c)
+        self.assertTrue(self.container.children[2] is self.b)
+        self.assertEqual(self.container.children.index(self.b), 2)
+        self.assertEqual(list(reversed(self.container.children)),
+                         [d, self.b, self.c, self.a])
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterInsertChildren(unittest.TestCase):
+    def setUp(self):
+        self.layout = Clutter.BoxLayout()
+        self.box = Clutter.Actor(layout_manager=self.layout)
+        self.a, self.b, self.c, self.d = [Clutter.Actor() for i in range(4)]
+
+    def get_expand(self, child):
+        return self.layout.child_get_property(self.box, child, 'expand')
+
+    def get_x_fill(self, child):
+        return self.layout.child_get_property(self.box, child, 'x-fill')
+
+    def test_append(self):
+        self.box.add_child(self.a)
+        self.box.insert_children([self.b, self.c])
+        self.assertEqual(list(self.box.children), [self.a, self.b, self.c])
+
+    def test_insert_at_index(self):
+        self.box.insert_children([self.a, self.d])
+        self.box.insert_children([self.b, self.c], 1)
+        self.assertEqual(list(self.box.children),
+                         [self.a, self.b, self.c, self.d])
+        self.assertEqual(self.box.children.index(self.c), 2)
+
+    def test_child_properties(self):
+        self.box.insert_children([(self.a, {'expand': True}), self.b,
+                                  (self.c, {'x_fill': False})],
+                                 x_fill=True)
+        self.assertEqual([self.get_expand(child) for child in
+                          (self.a, self.b, self.c)], [True, False, False])
+        self.assertEqual([self.get_x_fill(child) for child in
+                          (self.a, self.b, self.c)], [True, True, False])
+
+    def test_add_remove(self):
+        self.box.add(self.a, self.b, self.c)
+        self.assertEqual(list(self.box.children), [self.a, self.b, self.c])
+        self.assertEqual(self.box.children[-1], self.c)
+        self.box.remove(self.a, self.c)
+        self.assertEqual(list(self.box.children), [self.b])
+        self.assertEqual(len(self.box.children), 1)
+        self.assertFalse(self.a in self.box.children)
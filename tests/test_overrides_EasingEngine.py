@@ -0,0 +1,133 @@
+import sys
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(numpy, 'NumPy not available')
+class TestClutterEasingTable(unittest.TestCase):
+    def test_easing_table_linear(self):
+        table = Clutter.get_easing_table(Clutter.AnimationMode.LINEAR)
+        grid = numpy.linspace(0.0, 1.0, len(table))
+        self.assertTrue(numpy.allclose(table, grid))
+
+    def test_easing_table_end_points(self):
+        for mode in (Clutter.AnimationMode.EASE_IN_QUAD,
+                     Clutter.AnimationMode.EASE_OUT_CUBIC,
+                     Clutter.AnimationMode.EASE_IN_OUT_SINE,
+                     Clutter.AnimationMode.EASE_OUT_BOUNCE):
+            table = Clutter.get_easing_table(mode)
+            self.assertAlmostEqual(table[0], 0.0)
+            self.assertAlmostEqual(table[-1], 1.0)
+
+    def test_easing_table_elastic_end_point(self):
+        for mode in (Clutter.AnimationMode.EASE_IN_ELASTIC,
+                     Clutter.AnimationMode.EASE_OUT_ELASTIC,
+                     Clutter.AnimationMode.EASE_IN_OUT_ELASTIC):
+            self.assertEqual(Clutter.get_easing_table(mode)[-1], 1.0)
+
+    def test_easing_table_cached(self):
+        mode = Clutter.AnimationMode.EASE_IN_OUT_CUBIC
+        self.assertTrue(Clutter.get_easing_table(mode) is
+                        Clutter.get_easing_table(mode))
+        self.assertAlmostEqual(Clutter.get_easing_table(mode)[0], 0.0)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(numpy, 'NumPy not available')
+class TestClutterEasingEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = Clutter.EasingEngine()
+
+    def tearDown(self):
+        if self.engine._repaint_id:
+            Clutter.threads_remove_repaint_func(self.engine._repaint_id)
+
+    def test_cancel(self):
+        actors = [Clutter.Actor() for i in range(3)]
+        opacity = self.engine.ease(actors, 'opacity', 0, 250,
+                                   Clutter.AnimationMode.LINEAR)
+        x = self.engine.ease(actors, 'x', 100, 250,
+                             Clutter.AnimationMode.LINEAR)
+
+        self.engine.cancel(actors[0], 'opacity')
+        self.assertEqual(len(opacity), 2)
+        self.assertEqual(len(x), 3)
+
+        self.engine.cancel(actors[1])
+        self.assertEqual(len(opacity), 1)
+        self.assertEqual(len(x), 2)
+
+        # cancelling again does nothing
+        self.engine.cancel(actors[1])
+        self.assertEqual(len(x), 2)
+
+    def advance(self, batch, msecs):
+        # moves the transitions of @batch @msecs further, then runs a frame
+        batch._start = batch._start - msecs
+        return self.engine._on_repaint()
+
+    def test_frames(self):
+        actors = [Clutter.Actor() for i in range(2)]
+        completed = []
+        batch = self.engine.ease(actors, 'opacity', 0, 100,
+                                 Clutter.AnimationMode.LINEAR,
+                                 delay=[0, 1000], initial=255,
+                                 on_completed=completed.append)
+        actors[1].set_opacity(50)
+
+        self.assertTrue(self.advance(batch, 50))
+        self.assertAlmostEqual(actors[0].get_opacity(), 128, delta=2)
+        # still waiting for its delay, so left alone
+        self.assertEqual(actors[1].get_opacity(), 50)
+
+        self.assertTrue(self.advance(batch, 60))
+        self.assertEqual(actors[0].get_opacity(), 0)
+        self.assertEqual(actors[1].get_opacity(), 50)
+
+        self.assertTrue(self.advance(batch, 940))
+        self.assertAlmostEqual(actors[1].get_opacity(), 128, delta=2)
+        self.assertEqual(completed, [])
+
+        self.assertFalse(self.advance(batch, 1000))
+        self.assertEqual([actor.get_opacity() for actor in actors], [0, 0])
+        self.assertEqual(completed, [batch])
+        self.assertEqual(len(self.engine), 0)
+
+    def test_completed_callback_raises(self):
+        first, second = Clutter.Actor(), Clutter.Actor()
+
+        def on_completed(batch):
+            raise ValueError('oops')
+
+        short = self.engine.ease([first], 'x', 100, 10,
+                                 Clutter.AnimationMode.LINEAR,
+                                 on_completed=on_completed)
+        long = self.engine.ease([second], 'x', 100, 1000,
+                                Clutter.AnimationMode.LINEAR)
+
+        errors = []
+        old_excepthook = sys.excepthook
+        sys.excepthook = lambda *args: errors.append(args[0])
+        try:
+            self.assertTrue(self.advance(short, 20))
+        finally:
+            sys.excepthook = old_excepthook
+        self.assertEqual(errors, [ValueError])
+        self.assertEqual(first.get_x(), 100.0)
+
+        # the engine keeps running the other batch
+        self.assertEqual(len(self.engine), 1)
+        self.assertFalse(self.advance(long, 2000))
+        self.assertEqual(second.get_x(), 100.0)
@@ -0,0 +1,337 @@
+import gc
+import os
+import struct
+import tempfile
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, GLib
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterKeyval(unittest.TestCase):
+    def test_keyval_name(self):
+        self.assertEqual(Clutter.keyval_name(Clutter.KEY_Return), 'Return')
+        self.assertEqual(Clutter.keyval_name(Clutter.KEY_q), 'q')
+        self.assertEqual(Clutter.keyval_name(-1), None)
+
+    def test_keyval_from_name(self):
+        self.assertEqual(Clutter.keyval_from_name('KP_Enter'), Clutter.KEY_KP_Enter)
+        self.assertEqual(Clutter.keyval_from_name('NoSuchKey'), None)
+
+def init_clutter():
+    # the replayer needs the input devices of an initialized backend
+    if Clutter is None:
+        return False
+    try:
+        Clutter.init_with_args([], None, None, None)
+    except GLib.GError:
+        return False
+    return True
+
+def _make_event(event_type, x=0.0, y=0.0, time=0):
+    event = Clutter.Event.new(event_type)
+    event.set_coords(x, y)
+    event.set_time(time)
+    return event
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterEventAccessors(unittest.TestCase):
+    def test_key(self):
+        event = _make_event(Clutter.EventType.KEY_PRESS, time=42)
+        event.set_key_symbol(Clutter.KEY_a)
+        event.set_key_code(38)
+        event.set_state(Clutter.ModifierType.SHIFT_MASK)
+        self.assertEqual(event.keyval, Clutter.KEY_a)
+        self.assertEqual(event.hardware_keycode, 38)
+        self.assertEqual(event.key_name, 'a')
+        self.assertEqual(event.modifier_state, Clutter.ModifierType.SHIFT_MASK)
+        self.assertEqual(event.time, 42)
+        # the raw field, which get_key_unicode() would fill from the keyval
+        self.assertEqual(event.unicode_value, 0)
+        self.assertRaises(AttributeError, getattr, event, 'x')
+        self.assertRaises(AttributeError, getattr, event, 'coords')
+
+    def test_button(self):
+        event = _make_event(Clutter.EventType.BUTTON_PRESS, 3.0, 4.0)
+        event.set_button(2)
+        event.set_state(Clutter.ModifierType.CONTROL_MASK)
+        self.assertEqual((event.x, event.y), (3.0, 4.0))
+        self.assertEqual(event.coords, (3.0, 4.0))
+        self.assertEqual(event.get_button(), 2)
+        self.assertEqual(event.modifier_state, Clutter.ModifierType.CONTROL_MASK)
+        self.assertRaises(AttributeError, getattr, event, 'keyval')
+
+    def test_motion(self):
+        event = _make_event(Clutter.EventType.MOTION, 5.5, 6.5)
+        self.assertEqual((event.x, event.y), (5.5, 6.5))
+        self.assertEqual(event.coords, (5.5, 6.5))
+        self.assertEqual(event.modifier_state, 0)
+
+    def test_scroll(self):
+        event = _make_event(Clutter.EventType.SCROLL, 1.0, 2.0)
+        event.set_scroll_direction(Clutter.ScrollDirection.DOWN)
+        self.assertEqual(event.coords, (1.0, 2.0))
+        self.assertEqual(event.direction, Clutter.ScrollDirection.DOWN)
+
+    def test_crossing(self):
+        related = Clutter.Actor()
+        event = _make_event(Clutter.EventType.ENTER, 7.0, 8.0)
+        event.set_related(related)
+        self.assertEqual((event.x, event.y), (7.0, 8.0))
+        self.assertTrue(event.related is related)
+        self.assertRaises(AttributeError, getattr, event, 'modifier_state')
+
+    @unittest.skipUnless(Clutter and hasattr(Clutter.EventType, 'TOUCH_BEGIN'),
+                         'touch events not available')
+    def test_touch(self):
+        event = _make_event(Clutter.EventType.TOUCH_BEGIN, 9.0, 10.0)
+        self.assertEqual((event.x, event.y), (9.0, 10.0))
+        self.assertEqual(event.coords, (9.0, 10.0))
+
+    def test_stage_state(self):
+        event = Clutter.Event.new(Clutter.EventType.STAGE_STATE)
+        self.assertRaises(AttributeError, getattr, event, 'x')
+        self.assertRaises(AttributeError, getattr, event, 'coords')
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterEventSnapshot(unittest.TestCase):
+    def snapshot(self, event_type, x=0.0, y=0.0, time=0, **setters):
+        # built here, so that the event is freed before the snapshot is read
+        event = _make_event(event_type, x, y, time)
+        for name, value in setters.items():
+            getattr(event, 'set_' + name)(value)
+        snapshot = event.snapshot()
+        del event
+        gc.collect()
+        return snapshot
+
+    def test_key(self):
+        snapshot = self.snapshot(Clutter.EventType.KEY_RELEASE, time=10,
+                                 key_symbol=Clutter.KEY_Return,
+                                 state=Clutter.ModifierType.SHIFT_MASK)
+        self.assertEqual(snapshot.type, int(Clutter.EventType.KEY_RELEASE))
+        self.assertEqual(snapshot.keyval, Clutter.KEY_Return)
+        self.assertEqual(snapshot.modifier_state, int(Clutter.ModifierType.SHIFT_MASK))
+        self.assertEqual(snapshot.time, 10)
+        self.assertEqual((snapshot.x, snapshot.y, snapshot.button), (0.0, 0.0, 0))
+
+    def test_button(self):
+        source = Clutter.Actor()
+        snapshot = self.snapshot(Clutter.EventType.BUTTON_PRESS, 3.0, 4.0, 20,
+                                 button=3, source=source)
+        self.assertEqual(snapshot.type, int(Clutter.EventType.BUTTON_PRESS))
+        self.assertEqual((snapshot.x, snapshot.y), (3.0, 4.0))
+        self.assertEqual(snapshot.button, 3)
+        self.assertEqual(snapshot.keyval, 0)
+        self.assertEqual(snapshot.source_id, hash(source))
+
+    def test_motion(self):
+        snapshot = self.snapshot(Clutter.EventType.MOTION, 5.5, 6.5, 30)
+        self.assertEqual(snapshot, (int(Clutter.EventType.MOTION), 5.5, 6.5,
+                                    30, 0, 0, 0, 0, 0))
+
+    def test_scroll(self):
+        snapshot = self.snapshot(Clutter.EventType.SCROLL, 1.0, 2.0, 40,
+                                 scroll_direction=Clutter.ScrollDirection.LEFT,
+                                 state=Clutter.ModifierType.CONTROL_MASK)
+        self.assertEqual(snapshot.type, int(Clutter.EventType.SCROLL))
+        self.assertEqual((snapshot.x, snapshot.y), (1.0, 2.0))
+        self.assertEqual(snapshot.modifier_state,
+                         int(Clutter.ModifierType.CONTROL_MASK))
+        self.assertEqual(snapshot.time, 40)
+
+    @unittest.skipUnless(numpy, 'NumPy not available')
+    def test_to_numpy(self):
+        snapshots = [self.snapshot(Clutter.EventType.MOTION, i, i * 2.0, i)
+                     for i in range(3)]
+        array = Clutter.EventSnapshot.to_numpy(snapshots)
+        self.assertEqual(array.dtype, Clutter.EventSnapshot.DTYPE)
+        self.assertEqual(array['y'].tolist(), [0.0, 2.0, 4.0])
+        self.assertEqual(array['time'].tolist(), [0, 1, 2])
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterMotionCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.actor = Clutter.Actor()
+        self.coalescer = self.actor.coalesce_motion_events(self.batches.append)
+
+    def tearDown(self):
+        self.coalescer.disconnect()
+
+    def test_batch(self):
+        batch = Clutter.MotionBatch(self.actor, None)
+        batch.points.extend((1.0, 2.0, 10.0, 0.5))
+        batch.points.extend((3.0, 4.0, 20.0, 0.5))
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch[-1], (3.0, 4.0, 20.0, 0.5))
+        self.assertEqual(list(batch)[0], (1.0, 2.0, 10.0, 0.5))
+        self.assertRaises(IndexError, batch.__getitem__, 2)
+
+    def test_coalesce(self):
+        for i in range(3):
+            stopped = self.actor.emit('captured-event',
+                                      _make_event(Clutter.EventType.MOTION, i, i * 2, i))
+            self.assertTrue(stopped)
+        self.assertEqual(self.batches, [])
+        self.coalescer.flush()
+        self.assertEqual(len(self.batches), 1)
+        batch = self.batches[0]
+        self.assertEqual([point[:3] for point in batch],
+                         [(0.0, 0.0, 0.0), (1.0, 2.0, 1.0), (2.0, 4.0, 2.0)])
+        # no pressure axis without a device
+        self.assertTrue(batch[0][3] != batch[0][3])
+
+    def test_flush_on_other_events(self):
+        self.actor.emit('captured-event', _make_event(Clutter.EventType.MOTION, 1, 1))
+        stopped = self.actor.emit('captured-event',
+                                  _make_event(Clutter.EventType.BUTTON_RELEASE, 1, 1))
+        self.assertFalse(stopped)
+        self.assertEqual(len(self.batches), 1)
+
+# the layout of the records of Clutter.EventRecording, version 1
+_RECORD = struct.Struct('<qHHIIffIIIIi')
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterEventRecording(unittest.TestCase):
+    def make_recording(self, n):
+        data = b''.join(_RECORD.pack(i * 1000, int(Clutter.EventType.MOTION),
+                                     0, i, 0, i * 2.0, i * 3.0, 0, 0, 0, 0, -1)
+                        for i in range(n))
+        return Clutter.EventRecording(data)
+
+    def test_records(self):
+        recording = self.make_recording(3)
+        self.assertEqual(len(recording), 3)
+        self.assertEqual(recording[1][3], 1)
+        self.assertEqual(recording[-1][5:7], (4.0, 6.0))
+        self.assertEqual([record[0] for record in recording], [0, 1000, 2000])
+        self.assertRaises(IndexError, recording.__getitem__, 3)
+
+    def test_truncated(self):
+        self.assertRaises(ValueError, Clutter.EventRecording, b'\0' * (_RECORD.size - 1))
+
+    def test_save_load(self):
+        recording = self.make_recording(4)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            recording.save(path)
+            loaded = Clutter.EventRecording.load(path)
+            self.assertEqual(loaded.to_bytes(), recording.to_bytes())
+
+            with open(path, 'wb') as f:
+                f.write(b'JUNK' + recording.to_bytes())
+            self.assertRaises(ValueError, Clutter.EventRecording.load, path)
+        finally:
+            os.unlink(path)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterEventRecorder(unittest.TestCase):
+    def setUp(self):
+        # any actor emits captured-event, there is no need for a stage
+        self.source = Clutter.Actor()
+
+    def record(self, recorder, n):
+        for i in range(n):
+            self.source.emit('captured-event',
+                             _make_event(Clutter.EventType.MOTION, i, i, i + 1))
+
+    def test_capacity(self):
+        self.assertRaises(ValueError, Clutter.EventRecorder, self.source, 0)
+
+    def test_unbounded(self):
+        recorder = Clutter.EventRecorder(self.source)
+        self.record(recorder, 3)
+        recorder.stop()
+        self.record(recorder, 1)
+        self.assertEqual([record[3] for record in recorder.get_recording()], [1, 2, 3])
+
+    def test_ring_buffer(self):
+        recorder = Clutter.EventRecorder(self.source, capacity=2)
+        self.record(recorder, 5)
+        self.assertEqual(len(recorder), 2)
+        recording = recorder.get_recording()
+        self.assertEqual([record[3] for record in recording], [4, 5])
+        self.assertEqual(recording[0][5:7], (3.0, 3.0))
+
+@unittest.skipUnless(init_clutter(), 'Clutter cannot be initialized')
+class TestClutterEventReplayer(unittest.TestCase):
+    def setUp(self):
+        self.stage = Clutter.Stage()
+        self.source = Clutter.Actor()
+        recorder = Clutter.EventRecorder(self.source)
+
+        key = _make_event(Clutter.EventType.KEY_PRESS, time=1)
+        key.set_key_symbol(Clutter.KEY_a)
+        key.set_key_code(38)
+        key.set_key_unicode(ord('a'))
+        key.set_state(Clutter.ModifierType.SHIFT_MASK)
+        button = _make_event(Clutter.EventType.BUTTON_PRESS, 3.0, 4.0, 2)
+        button.set_button(1)
+        button.button.click_count = 2
+        scroll = _make_event(Clutter.EventType.SCROLL, 5.0, 6.0, 3)
+        scroll.set_scroll_direction(Clutter.ScrollDirection.UP)
+        motion = _make_event(Clutter.EventType.MOTION, 7.0, 8.0, 4)
+        enter = _make_event(Clutter.EventType.ENTER, 7.0, 8.0, 5)
+        events = [key, button, scroll, motion, enter]
+        if hasattr(Clutter.EventType, 'TOUCH_BEGIN'):
+            events.append(_make_event(Clutter.EventType.TOUCH_BEGIN, 9.0, 9.0, 6))
+        for event in events:
+            self.source.emit('captured-event', event)
+        self.recording = recorder.get_recording()
+        self.replayer = Clutter.EventReplayer(self.stage, self.recording,
+                                              speed=0)
+
+    def tearDown(self):
+        self.replayer.stop()
+        self.stage.destroy()
+
+    def test_events(self):
+        events = [self.replayer._make_event(record)
+                  for record in self.recording]
+        key, button, scroll, motion, enter = events[:5]
+
+        self.assertEqual(key.type(), Clutter.EventType.KEY_PRESS)
+        self.assertEqual(key.get_key_symbol(), Clutter.KEY_a)
+        self.assertEqual(key.get_key_code(), 38)
+        self.assertEqual(key.get_key_unicode(), ord('a'))
+        self.assertEqual(key.get_state(), Clutter.ModifierType.SHIFT_MASK)
+        self.assertEqual(key.get_time(), 1)
+
+        self.assertEqual(button.type(), Clutter.EventType.BUTTON_PRESS)
+        self.assertEqual(button.get_coords(), (3.0, 4.0))
+        self.assertEqual(button.get_button(), 1)
+        self.assertEqual(button.get_click_count(), 2)
+
+        self.assertEqual(scroll.get_coords(), (5.0, 6.0))
+        self.assertEqual(scroll.get_scroll_direction(), Clutter.ScrollDirection.UP)
+
+        self.assertEqual(motion.type(), Clutter.EventType.MOTION)
+        self.assertEqual(motion.get_coords(), (7.0, 8.0))
+        self.assertTrue(motion.get_stage() is self.stage)
+        self.assertEqual(motion.get_time(), 4)
+
+        # synthesized by Clutter, and touch sequences cannot be recreated
+        self.assertEqual(events[4:], [None] * (len(events) - 4))
+
+    def test_replay(self):
+        completed = []
+        self.replayer.start(on_completed=completed.append)
+        self.assertTrue(self.replayer.is_playing())
+        context = GLib.MainContext.default()
+        while not completed:
+            context.iteration(True)
+        self.assertEqual(completed, [self.replayer])
+        self.assertFalse(self.replayer.is_playing())
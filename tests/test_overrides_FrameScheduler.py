@@ -0,0 +1,145 @@
+import sys
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Clutter.FrameScheduler()
+        self.ran = []
+
+    def tearDown(self):
+        if self.scheduler._repaint_id:
+            Clutter.threads_remove_repaint_func(self.scheduler._repaint_id)
+
+    def test_priority_order(self):
+        self.scheduler.schedule(self.ran.append, 'default')
+        self.scheduler.schedule(self.ran.append, 'low',
+                                priority=Clutter.FrameScheduler.PRIORITY_LOW)
+        self.scheduler.schedule(self.ran.append, 'high',
+                                priority=Clutter.FrameScheduler.PRIORITY_HIGH)
+        self.scheduler.schedule(self.ran.append, 'default2')
+        self.assertEqual(len(self.scheduler), 4)
+
+        self.assertFalse(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, ['high', 'default', 'default2', 'low'])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.scheduler.stats.frames, 1)
+        self.assertEqual(self.scheduler.stats.tasks_run, 4)
+
+    def test_merge_by_key(self):
+        first = self.scheduler.schedule(self.ran.append, 1, key='a')
+        second = self.scheduler.schedule(self.ran.append, 2, key='a')
+        self.assertIs(first, second)
+        self.assertEqual(len(self.scheduler), 1)
+
+        self.scheduler._on_repaint()
+        self.assertEqual(self.ran, [2])
+        self.assertEqual(self.scheduler.stats.tasks_merged, 1)
+
+    def test_merge_raises_priority(self):
+        self.scheduler.schedule(self.ran.append, 'other')
+        first = self.scheduler.schedule(self.ran.append, 1, key='a',
+                                        priority=Clutter.FrameScheduler.PRIORITY_LOW)
+        second = self.scheduler.schedule(self.ran.append, 2, key='a',
+                                         priority=Clutter.FrameScheduler.PRIORITY_HIGH)
+        self.assertTrue(first is second)
+        self.assertEqual(first.priority, Clutter.FrameScheduler.PRIORITY_HIGH)
+        self.assertEqual(len(self.scheduler), 2)
+
+        self.scheduler._on_repaint()
+        self.assertEqual(self.ran, [2, 'other'])
+
+    def test_cancel_after_priority_raise(self):
+        task = self.scheduler.schedule(self.ran.append, 1, key='a',
+                                       priority=Clutter.FrameScheduler.PRIORITY_LOW)
+        self.scheduler.schedule(self.ran.append, 2, key='a',
+                                priority=Clutter.FrameScheduler.PRIORITY_HIGH)
+        task.cancel()
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertFalse(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, [])
+
+    def test_callback_raises(self):
+        def fail():
+            raise ValueError('oops')
+
+        self.scheduler.schedule(self.ran.append, 'before',
+                                priority=Clutter.FrameScheduler.PRIORITY_HIGH)
+        self.scheduler.schedule(fail)
+        self.scheduler.schedule(self.ran.append, 'after',
+                                priority=Clutter.FrameScheduler.PRIORITY_LOW)
+
+        errors = []
+        old_excepthook = sys.excepthook
+        sys.excepthook = lambda *args: errors.append(args[0])
+        try:
+            self.assertFalse(self.scheduler._on_repaint())
+        finally:
+            sys.excepthook = old_excepthook
+        self.assertEqual(errors, [ValueError])
+        self.assertEqual(self.ran, ['before', 'after'])
+        self.assertEqual(self.scheduler.stats.tasks_run, 3)
+
+        # the scheduler registers its repaint function again
+        self.assertEqual(self.scheduler._repaint_id, 0)
+        self.scheduler.schedule(self.ran.append, 'next')
+        self.assertNotEqual(self.scheduler._repaint_id, 0)
+        self.scheduler._on_repaint()
+        self.assertEqual(self.ran, ['before', 'after', 'next'])
+
+    def test_cancel(self):
+        task = self.scheduler.schedule(self.ran.append, 1)
+        self.scheduler.schedule(self.ran.append, 2, key='a')
+        task.cancel()
+        self.scheduler.cancel('a')
+        self.assertEqual(len(self.scheduler), 0)
+
+        self.assertFalse(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, [])
+
+    def test_key_reusable_after_run(self):
+        self.scheduler.schedule(self.ran.append, 1, key='a')
+        self.scheduler._on_repaint()
+        self.scheduler.schedule(self.ran.append, 2, key='a')
+        self.scheduler._on_repaint()
+        self.assertEqual(self.ran, [1, 2])
+        self.assertEqual(self.scheduler.stats.tasks_merged, 0)
+
+    def test_budget_defers(self):
+        self.scheduler.budget = 0
+        for i in range(3):
+            self.scheduler.schedule(self.ran.append, i)
+
+        # at least one task runs per frame, the rest wait in order
+        self.assertTrue(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, [0])
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertEqual(self.scheduler.stats.tasks_deferred, 2)
+
+        self.assertTrue(self.scheduler._on_repaint())
+        self.assertFalse(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, [0, 1, 2])
+
+    def test_schedule_during_frame(self):
+        def reschedule():
+            self.ran.append('first')
+            self.scheduler.schedule(self.ran.append, 'second')
+
+        self.scheduler.schedule(reschedule)
+        self.assertTrue(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, ['first'])
+        self.assertFalse(self.scheduler._on_repaint())
+        self.assertEqual(self.ran, ['first', 'second'])
+
+    def test_unexpected_keyword(self):
+        self.assertRaises(TypeError, self.scheduler.schedule,
+                          self.ran.append, 1, delay=2)
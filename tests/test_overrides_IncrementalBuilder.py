@@ -0,0 +1,110 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, Gio, GObject
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+if Clutter is not None:
+    class Item(GObject.Object):
+        value = GObject.Property(type=int)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterIncrementalBuilder(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Clutter.FrameScheduler()
+        self.model = Gio.ListStore.new(Item)
+        for i in range(5):
+            self.model.append(Item(value=i))
+        self.parent = Clutter.Actor()
+        self.created = []
+        # a budget of 0 builds one item per frame
+        self.builder = Clutter.IncrementalBuilder.from_model(
+            self.parent, self.model, self.create, budget=0,
+            scheduler=self.scheduler)
+
+    def tearDown(self):
+        if self.scheduler._repaint_id:
+            Clutter.threads_remove_repaint_func(self.scheduler._repaint_id)
+
+    def create(self, item):
+        self.created.append(item.props.value)
+        return Clutter.Actor(name=str(item.props.value))
+
+    def frame(self):
+        return self.scheduler._on_repaint()
+
+    def get_names(self):
+        return [child.get_name() for child in self.parent.get_children()]
+
+    def get_values(self):
+        return [str(self.model.get_item(i).props.value)
+                for i in range(self.model.get_n_items())]
+
+    def test_one_step_per_frame(self):
+        self.builder.start()
+        self.frame()
+        self.assertEqual(self.get_names(), ['0'])
+        while self.frame():
+            pass
+        self.assertTrue(self.builder.is_complete())
+        self.assertEqual(self.get_names(), self.get_values())
+        self.assertEqual(self.builder.built, 5)
+
+    def test_insert_among_built_is_deferred(self):
+        self.builder.start()
+        self.frame()
+        self.frame()
+        self.model.insert(1, Item(value=10))
+        self.model.insert(0, Item(value=11))
+        # nothing is built from the signal handler
+        self.assertEqual(self.get_names(), ['0', '1'])
+        self.assertEqual(self.created, [0, 1])
+
+        self.frame()
+        self.assertEqual(self.get_names(), ['11', '0', '1'])
+        while self.frame():
+            pass
+        self.assertEqual(self.get_names(), self.get_values())
+        self.assertEqual(self.builder.built, 7)
+        self.assertEqual(self.builder.progress, 1.0)
+
+    def test_remove_pending(self):
+        self.builder.start()
+        self.frame()
+        self.model.insert(0, Item(value=10))
+        self.model.remove(0)
+        self.model.remove(0)
+        self.assertEqual(self.get_names(), [])
+        while self.frame():
+            pass
+        self.assertEqual(self.get_names(), self.get_values())
+        self.assertNotIn(10, self.created)
+
+    def test_insert_after_completion(self):
+        self.builder.finish()
+        self.assertTrue(self.builder.is_complete())
+        self.model.insert(2, Item(value=10))
+        self.assertFalse(self.builder.is_complete())
+        self.assertEqual(len(self.get_names()), 5)
+        while self.frame():
+            pass
+        self.assertTrue(self.builder.is_complete())
+        self.assertEqual(self.get_names(), self.get_values())
+
+    def test_step_raises(self):
+        def steps():
+            yield Clutter.Actor(name='0')
+            yield Clutter.Actor(name='1')
+            raise ValueError('step failed')
+
+        builder = Clutter.IncrementalBuilder(self.parent, steps(),
+                                             scheduler=self.scheduler)
+        self.assertRaises(ValueError, builder.finish)
+        # the actors built before the failing step are not lost
+        self.assertEqual(self.get_names(), ['0', '1'])
+        self.assertEqual(builder.built, 2)
@@ -0,0 +1,82 @@
+import threading
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, GLib
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+def init_clutter():
+    # stages need an initialized backend
+    if Clutter is None:
+        return False
+    try:
+        Clutter.init_with_args([], None, None, None)
+    except GLib.GError:
+        return False
+    return True
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterMainThreadDispatcher(unittest.TestCase):
+    def iterate(self, future):
+        context = GLib.MainContext.default()
+        while not future.done():
+            context.iteration(True)
+
+    def test_submit_from_thread(self):
+        dispatcher = Clutter.MainThreadDispatcher()
+        futures = []
+        results = []
+
+        def worker():
+            for i in range(10):
+                futures.append(dispatcher.submit(results.append, i))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.iterate(futures[-1])
+        self.assertEqual(results, list(range(10)))
+        self.assertEqual(dispatcher.stats.calls, 10)
+        self.assertEqual(len(dispatcher), 0)
+
+    def test_exception(self):
+        dispatcher = Clutter.MainThreadDispatcher()
+        future = dispatcher.submit(int, 'x')
+        self.iterate(future)
+        self.assertIsInstance(future.exception(), ValueError)
+
+    def test_executor(self):
+        executor = Clutter.MainLoopExecutor(max_workers=1)
+        main_thread = threading.current_thread()
+        threads = []
+        future = executor.submit(sum, [1, 2, 3])
+        future.add_done_callback(lambda f: threads.append(threading.current_thread()))
+        self.iterate(future)
+        executor.shutdown()
+        self.assertEqual(future.result(), 6)
+        self.assertEqual(threads, [main_thread])
+
+    @unittest.skipUnless(init_clutter(), 'Clutter cannot be initialized')
+    def test_hidden_stage(self):
+        # queue_redraw() does nothing on a stage that is not shown, so
+        # calls must not wait for a frame
+        stage = Clutter.Stage()
+        self.addCleanup(stage.destroy)
+        self.assertFalse(stage.is_mapped())
+
+        dispatcher = Clutter.MainThreadDispatcher()
+        future = dispatcher.submit(sum, [1, 2, 3])
+        timed_out = []
+        source_id = GLib.timeout_add(2000, lambda: timed_out.append(True))
+        context = GLib.MainContext.default()
+        while not future.done() and not timed_out:
+            context.iteration(True)
+        if not timed_out:
+            GLib.source_remove(source_id)
+        self.assertEqual(future.result(0), 6)
@@ -0,0 +1,84 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, GObject
+    from gi.overrides import Clutter as ClutterOverrides
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+if Clutter:
+    class SubActor(Clutter.Actor):
+        pass
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterPropertyCache(unittest.TestCase):
+    def setUp(self):
+        Clutter.clear_property_cache()
+
+    def tearDown(self):
+        Clutter.clear_property_cache()
+
+    def lookup(self, obj, name):
+        return ClutterOverrides._lookup_property(obj, name)
+
+    def convert(self, obj, name, value):
+        pspec, convert = self.lookup(obj, name)
+        gvalue = convert(value)
+        self.assertTrue(isinstance(gvalue, GObject.Value))
+        return gvalue.get_value()
+
+    def test_hits_across_instances(self):
+        first = self.lookup(Clutter.Actor(), 'opacity')
+        second = self.lookup(Clutter.Actor(), 'opacity')
+        self.assertTrue(first is second)
+        self.assertEqual(first[0].name, 'opacity')
+        self.assertEqual(Clutter.get_property_cache_stats(),
+                         {'hits': 1, 'misses': 1, 'size': 1})
+
+    def test_per_class_keys(self):
+        self.lookup(Clutter.Actor(), 'opacity')
+        pspec, convert = self.lookup(SubActor(), 'opacity')
+        self.lookup(Clutter.Text(), 'opacity')
+        self.assertEqual(pspec.name, 'opacity')
+        self.assertEqual(Clutter.get_property_cache_stats(),
+                         {'hits': 0, 'misses': 3, 'size': 3})
+
+        self.lookup(SubActor(), 'opacity')
+        self.assertEqual(Clutter.get_property_cache_stats()['hits'], 1)
+
+    def test_unknown_property(self):
+        self.assertRaises(AttributeError, self.lookup, Clutter.Actor(),
+                          'no-such-property')
+        self.assertEqual(Clutter.get_property_cache_stats()['size'], 0)
+
+    def test_clear(self):
+        self.lookup(Clutter.Actor(), 'x')
+        Clutter.clear_property_cache()
+        self.assertEqual(Clutter.get_property_cache_stats(),
+                         {'hits': 0, 'misses': 0, 'size': 0})
+
+    def test_converters(self):
+        actor = Clutter.Actor()
+        self.assertEqual(self.convert(actor, 'opacity', 128), 128)
+        x = self.convert(actor, 'x', 5)
+        self.assertEqual(x, 5.0)
+        self.assertTrue(isinstance(x, float))
+        self.assertEqual(self.convert(actor, 'request-mode',
+                                      Clutter.RequestMode.WIDTH_FOR_HEIGHT),
+                         Clutter.RequestMode.WIDTH_FOR_HEIGHT)
+        color = Clutter.Color(255, 0, 0, 255)
+        self.assertEqual(self.convert(actor, 'background-color', color), color)
+
+    def test_converters_shared(self):
+        pspec, x_convert = self.lookup(Clutter.Actor(), 'x')
+        pspec, y_convert = self.lookup(Clutter.Actor(), 'y')
+        self.assertTrue(x_convert is y_convert)
+
+    def test_gvalue_passthrough(self):
+        pspec, convert = self.lookup(Clutter.Actor(), 'x')
+        gvalue = GObject.Value(GObject.TYPE_FLOAT, 3.0)
+        self.assertTrue(convert(gvalue) is gvalue)
@@ -0,0 +1,96 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterReconciler(unittest.TestCase):
+    def render(self, texts):
+        return self.reconciler.render([
+            Clutter.Element(Clutter.Text, {'text': text}, key=text)
+            for text in texts])
+
+    def texts(self):
+        return [child.get_text() for child in self.root.get_children()]
+
+    def setUp(self):
+        self.root = Clutter.Actor()
+        self.reconciler = Clutter.Reconciler(self.root)
+
+    def test_create(self):
+        stats = self.render(['a', 'b', 'c'])
+        self.assertEqual(self.texts(), ['a', 'b', 'c'])
+        self.assertEqual(stats.created, 3)
+        self.assertEqual(stats.mutations, 3)
+
+    def test_move(self):
+        self.render(['a', 'b', 'c', 'd'])
+        children = self.root.get_children()
+        stats = self.render(['d', 'a', 'b', 'c'])
+        self.assertEqual(self.texts(), ['d', 'a', 'b', 'c'])
+        self.assertEqual(stats.moved, 1)
+        self.assertEqual(stats.created, 0)
+        self.assertEqual(set(self.root.get_children()), set(children))
+
+    def test_insert_remove(self):
+        self.render(['a', 'b', 'c'])
+        stats = self.render(['a', 'x', 'c'])
+        self.assertEqual(self.texts(), ['a', 'x', 'c'])
+        self.assertEqual((stats.created, stats.removed, stats.moved), (1, 1, 0))
+
+    def test_properties(self):
+        self.reconciler.render({'type': Clutter.Actor,
+                                'props': {'width': 10.0, 'reactive': True},
+                                'children': [{'type': Clutter.Text}]})
+        actor = self.root.get_first_child()
+        stats = self.reconciler.render({'type': Clutter.Actor,
+                                        'props': {'width': 20.0},
+                                        'children': [{'type': Clutter.Text}]})
+        self.assertTrue(self.root.get_first_child() is actor)
+        self.assertEqual(actor.get_width(), 20.0)
+        self.assertFalse(actor.get_reactive())
+        self.assertEqual(stats.properties_set, 2)
+        self.assertEqual(actor.get_n_children(), 1)
+
+    def test_reset_size_and_position(self):
+        element = {'type': Clutter.Actor,
+                   'props': {'width': 10.0, 'height': 20.0, 'x': 5.0, 'y': 6.0}}
+        self.reconciler.render(element)
+        actor = self.root.get_first_child()
+        self.assertTrue(actor.get_fixed_position_set())
+
+        self.reconciler.render({'type': Clutter.Actor, 'props': {'y': 6.0}})
+        self.assertFalse(actor.props.min_width_set)
+        self.assertFalse(actor.props.natural_width_set)
+        self.assertFalse(actor.props.min_height_set)
+        self.assertFalse(actor.props.natural_height_set)
+        self.assertEqual(actor.props.fixed_x, 0.0)
+        self.assertEqual(actor.props.fixed_y, 6.0)
+
+        self.reconciler.render({'type': Clutter.Actor})
+        self.assertFalse(actor.get_fixed_position_set())
+
+    def test_create_sets_converted_properties(self):
+        element = {'type': Clutter.Actor, 'props': {'x': 5, 'opacity': 128}}
+        self.reconciler.render(element)
+        actor = self.root.get_first_child()
+        self.assertEqual(actor.get_x(), 5.0)
+        self.assertEqual(actor.get_opacity(), 128)
+        stats = self.reconciler.render(element)
+        self.assertEqual(stats.mutations, 0)
+
+    def test_destroyed_elsewhere(self):
+        self.render(['a', 'b', 'c'])
+        self.root.get_child_at_index(1).destroy()
+        self.assertEqual(self.texts(), ['a', 'c'])
+
+        stats = self.render(['a', 'b', 'c'])
+        self.assertEqual(self.texts(), ['a', 'b', 'c'])
+        self.assertEqual((stats.created, stats.removed), (1, 0))
+        self.assertEqual(len(self.reconciler._rendered), 3)
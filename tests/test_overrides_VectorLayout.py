@@ -0,0 +1,51 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(numpy, 'NumPy not available')
+class TestClutterVectorLayout(unittest.TestCase):
+    def setUp(self):
+        self.sizes = numpy.array([[0, 0, 10, 5], [0, 0, 20, 7], [0, 0, 30, 3]],
+                                 dtype=numpy.float32)
+
+    def test_grid(self):
+        layout = Clutter.VectorGridLayout(spacing=2, columns=2)
+        boxes = layout.compute_allocations(self.sizes, 100, 100).to_numpy()
+        self.assertEqual(boxes.tolist(), [[0, 0, 30, 7], [32, 0, 62, 7],
+                                          [0, 9, 30, 16]])
+
+    def test_flow(self):
+        layout = Clutter.VectorFlowLayout(spacing=2)
+        boxes = layout.compute_allocations(self.sizes, 35, 100).to_numpy()
+        self.assertEqual(boxes.tolist(), [[0, 0, 10, 5], [12, 0, 32, 7],
+                                          [0, 9, 30, 12]])
+
+    def test_circle(self):
+        layout = Clutter.VectorCircleLayout()
+        boxes = layout.compute_allocations(self.sizes, 100, 100).to_numpy()
+        self.assertEqual(len(boxes), 3)
+        self.assertEqual(boxes[0].tolist(), [35, 81.5, 65, 88.5])
+
+    def test_allocate(self):
+        layout = Clutter.VectorGridLayout(columns=2)
+        box = Clutter.Actor(layout_manager=layout)
+        children = [Clutter.Actor(width=10, height=10) for i in range(4)]
+        for child in children:
+            box.add_child(child)
+        self.assertEqual(box.get_preferred_width(-1), (20.0, 20.0))
+        self.assertEqual(box.get_preferred_height(-1), (20.0, 20.0))
+        box.allocate_preferred_size(Clutter.AllocationFlags.ALLOCATION_NONE)
+        self.assertEqual(children[3].get_allocation_box().get_origin(), (10.0, 10.0))
@@ -0,0 +1,139 @@
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter, Gio, GObject
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+if Clutter is not None:
+    class Item(GObject.Object):
+        value = GObject.Property(type=int)
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+class TestClutterVirtualList(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Clutter.FrameScheduler()
+        self.model = Gio.ListStore.new(Item)
+        for i in range(100):
+            self.model.append(Item(value=i))
+        self.scroll = Clutter.ScrollActor(
+            scroll_mode=Clutter.ScrollMode.VERTICALLY)
+        self.scroll.set_size(100, 50)
+        self.bound = []
+
+    def tearDown(self):
+        if self.scheduler._repaint_id:
+            Clutter.threads_remove_repaint_func(self.scheduler._repaint_id)
+
+    def create(self, item):
+        return Clutter.Actor(name=str(item.props.value))
+
+    def bind(self, view, item):
+        self.bound.append(item.props.value)
+        view.set_name(str(item.props.value))
+
+    def make_list(self, **kwargs):
+        vlist = Clutter.VirtualList(self.scroll, self.model, self.create,
+                                    item_height=10, scheduler=self.scheduler,
+                                    **kwargs)
+        vlist.update()
+        return vlist
+
+    def scroll_to(self, y):
+        self.scroll.scroll_to_point(Clutter.Point.alloc().init(0, y))
+
+    def get_names(self, vlist):
+        return sorted(int(vlist.get_view(i).get_name())
+                      for i in range(len(vlist))
+                      if vlist.get_view(i) is not None)
+
+    def test_visible_range(self):
+        vlist = self.make_list()
+        # 5 visible rows, the 2 overscan rows after them
+        self.assertEqual(self.get_names(vlist), list(range(8)))
+        self.assertEqual(vlist.n_created, 8)
+        self.assertEqual(vlist.get_view(3).get_position(), (0, 30))
+        self.assertIsNone(vlist.get_view(8))
+        self.assertEqual(vlist.actor.get_size(), (100, 1000))
+
+        self.scroll_to(500)
+        vlist.update()
+        self.assertEqual(self.get_names(vlist), list(range(48, 58)))
+        self.assertEqual(vlist.get_view(50).get_position(), (0, 500))
+
+    def test_recycling(self):
+        vlist = self.make_list(bind_func=self.bind)
+        views = set(vlist.get_view(i) for i in range(8))
+        self.scroll_to(500)
+        vlist.update()
+        self.assertEqual(self.get_names(vlist), list(range(48, 58)))
+        # the 8 views scrolled away are reused, 2 more are created
+        self.assertEqual(vlist.n_created, 10)
+        self.assertEqual(vlist.n_pooled, 0)
+        self.assertEqual(len(self.bound), 8)
+        self.assertEqual(len(views & set(vlist.get_view(i)
+                                         for i in range(48, 58))), 8)
+
+        self.scroll_to(0)
+        vlist.update()
+        self.assertEqual(self.get_names(vlist), list(range(8)))
+        self.assertEqual(vlist.n_created, 10)
+        self.assertEqual(vlist.n_pooled, 2)
+
+    def test_without_bind_func(self):
+        vlist = self.make_list()
+        self.scroll_to(500)
+        vlist.update()
+        self.assertEqual(vlist.n_created, 18)
+        self.assertEqual(vlist.n_pooled, 0)
+        self.assertEqual(vlist.actor.get_n_children(), 10)
+
+    def test_items_changed(self):
+        vlist = self.make_list()
+        first = vlist.get_view(0)
+        second = vlist.get_view(1)
+        third = vlist.get_view(2)
+        self.model.insert(0, Item(value=100))
+        # the views after the insertion are moved, not rebuilt
+        self.assertIs(vlist.get_view(1), first)
+        self.assertEqual(first.get_position(), (0, 10))
+        self.assertIsNone(vlist.get_view(0))
+        vlist.update()
+        self.assertEqual(vlist.get_view(0).get_name(), '100')
+        self.assertEqual(vlist.n_created, 9)
+
+        self.model.remove(1)
+        self.assertIsNone(first.get_parent())
+        self.assertIs(vlist.get_view(1), second)
+        self.assertEqual(second.get_position(), (0, 10))
+        self.assertIs(vlist.get_view(2), third)
+        self.assertEqual(third.get_position(), (0, 20))
+        vlist.update()
+        self.assertEqual(self.get_names(vlist), list(range(1, 8)) + [100])
+
+    def test_columns(self):
+        self.scroll.set_width(0)
+        vlist = self.make_list(columns=2)
+        self.assertEqual(vlist.get_view(3).get_position(), (0, 10))
+
+        # views placed with no width are moved once @scroll is sized
+        self.scroll.set_width(200)
+        vlist.update()
+        self.assertEqual(vlist.get_view(3).get_position(), (100, 10))
+        self.assertEqual(vlist.get_view(4).get_position(), (0, 20))
+
+        vlist = self.make_list(columns=2, item_width=40)
+        self.assertEqual(vlist.get_view(3).get_position(), (40, 10))
+
+    def test_destroy(self):
+        vlist = self.make_list()
+        actor = vlist.actor
+        vlist.destroy()
+        self.assertEqual(vlist.n_materialized, 0)
+        self.assertIsNone(actor.get_parent())
+        self.model.append(Item(value=100))
+        self.assertEqual(vlist.n_materialized, 0)
@@ -0,0 +1,63 @@
+import os
+import unittest
+
+import gi.overrides
+
+try:
+    from gi.repository import Clutter
+    Clutter # pyflakes
+except ImportError as err:
+    print(err)
+    Clutter = None
+
+try:
+    import asyncio
+    import selectors
+except ImportError:
+    asyncio = None
+
+@unittest.skipUnless(Clutter, 'Clutter not available')
+@unittest.skipUnless(asyncio, 'asyncio not available')
+class TestClutterAsyncio(unittest.TestCase):
+    def setUp(self):
+        self.loop = Clutter.EventLoopPolicy().new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def test_selector_map(self):
+        rfd, wfd = os.pipe()
+        self.addCleanup(os.close, rfd)
+        self.addCleanup(os.close, wfd)
+        selector = self.loop._selector
+        key = selector.register(wfd, selectors.EVENT_WRITE, 'data')
+        self.assertIs(selector.get_key(wfd), key)
+        self.assertIn(wfd, selector.get_map())
+        self.assertEqual(selector.select(0), [(key, selectors.EVENT_WRITE)])
+        self.assertRaises(KeyError, selector.register, wfd, selectors.EVENT_READ)
+        selector.unregister(wfd)
+        self.assertNotIn(wfd, selector.get_map())
+
+    def test_call_later(self):
+        future = self.loop.create_future()
+        self.loop.call_later(0.01, future.set_result, 42)
+        self.assertEqual(self.loop.run_until_complete(future), 42)
+
+    def test_transition_completed_without_transition(self):
+        actor = Clutter.Actor()
+        future = actor.transition_completed('x', loop=self.loop)
+        self.assertTrue(future.done())
+        self.assertTrue(future.result())
+
+    def test_signal_stream(self):
+        actor = Clutter.Actor()
+        stream = actor.events('show', loop=self.loop)
+        actor.show()
+        self.assertEqual(self.loop.run_until_complete(stream.__anext__()), ())
+        pending = stream.__anext__()
+        self.assertFalse(pending.done())
+        stream.close()
+        self.assertRaises(StopAsyncIteration,
+                          self.loop.run_until_complete, pending)